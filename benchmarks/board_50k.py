@@ -0,0 +1,188 @@
+"""
+Benchmark of the board model with a synthetic board of many devices
+
+A scheme with --devices devices is generated, the devices are chained
+through their ports. The scheme is then opened (with constructed devices
+and in the lightweight mode, next to parsing its JSON), edited (devices
+added, connected, disconnected and removed), saved through the edit
+journal, compacted and reopened. Finally a second board is opened and
+the first one is activated again (served from its open session), every
+step is timed.
+
+The device class is picked at runtime among the builtin qureed devices,
+the first device with an output port which is compatible with one of its
+own input ports is used.
+
+Usage:
+    python benchmarks/board_50k.py --devices 50000 --edits 1000
+"""
+import argparse
+import importlib
+import inspect
+import json
+import shutil
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from qureed_project_server import server_pb2
+from qureed_project_server.logic_modules import (
+    LogicModuleEnum, LogicModuleHandler
+)
+
+LMH = LogicModuleHandler()
+
+
+def find_chainable_device() -> tuple[str, str, str]:
+    """
+    Finds a builtin device whose output port can be connected to one of
+    its own input ports
+
+    Returns:
+    --------
+    tuple[str, str, str]: module.class of the device, the input and the
+        output port label
+    """
+    QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+    GenericDevice = QM.get_class(
+        "qureed.devices.generic_device.GenericDevice")
+    spec = importlib.util.find_spec("qureed")
+    qureed_path = Path(next(iter(spec.submodule_search_locations)))
+    signal_index = QM.get_signal_index()
+    for module_name, _ in QM.find_modules(
+            qureed_path / "devices", qureed_path, prefix="qureed."):
+        try:
+            module = importlib.import_module(module_name)
+        except Exception:
+            continue
+        for attr in vars(module).values():
+            if (not inspect.isclass(attr) or attr is GenericDevice or
+                    not issubclass(attr, GenericDevice) or
+                    attr.__module__ != module_name):
+                continue
+            ports = getattr(attr, "ports", {})
+            inputs = [p for p in ports.values() if p.direction == "input"]
+            outputs = [p for p in ports.values() if p.direction == "output"]
+            for i in inputs:
+                for o in outputs:
+                    if signal_index.common_signal(
+                            i.signal_type, o.signal_type) is not None:
+                        return (f"{attr.__module__}.{attr.__name__}",
+                                i.label, o.label)
+    raise RuntimeError("No chainable device found")
+
+
+def generate_scheme(
+        path: Path, device_mc: str, in_port: str, out_port: str,
+        devices: int) -> list[str]:
+    uuids = [str(uuid.uuid4()) for _ in range(devices)]
+    QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+    device_class = QM.get_class(device_mc)
+    out_signal = device_class.ports[out_port].signal_type
+    in_signal = device_class.ports[in_port].signal_type
+    signal_class = QM.get_signal_index().common_signal(out_signal, in_signal)
+    signal_mc = f"{signal_class.__module__}.{signal_class.__name__}"
+    scheme = {
+        "devices": [
+            {"device": device_mc, "uuid": u, "location": [i, 0],
+             "properties": {}}
+            for i, u in enumerate(uuids)
+        ],
+        "connections": [
+            {"signal": signal_mc,
+             "conn": [{"device_uuid": a, "port": out_port},
+                      {"device_uuid": b, "port": in_port}]}
+            for a, b in zip(uuids, uuids[1:])
+        ]
+    }
+    with open(path, "w") as f:
+        json.dump(scheme, f)
+    return uuids
+
+
+def timed(label: str, func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    print(f"{label:<36} {time.perf_counter() - start:8.3f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=50000)
+    parser.add_argument("--edits", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as project:
+        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+        VM.path = str(Path(project) / ".venv")
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+
+        device_mc, in_port, out_port = find_chainable_device()
+        print(f"device: {device_mc} ({out_port} -> {in_port})")
+        uuids = generate_scheme(
+            Path(project) / "board.json", device_mc, in_port, out_port,
+            args.devices)
+
+        def parse():
+            with open(Path(project) / "board.json") as f:
+                return json.load(f)
+        timed("parse the scheme JSON", parse)
+        timed(f"open {args.devices} devices (constructed)",
+              BM.open_scheme, "board.json", False)
+        devices_msg, _ = timed(
+            f"open {args.devices} devices (lightweight)",
+            BM.open_scheme, "board.json", None, True)
+
+        def add_devices():
+            return [BM.add_device(server_pb2.Device(
+                module_class=device_mc, uuid=str(uuid.uuid4())))
+                for _ in range(args.edits)]
+        new_uuids = timed(f"add {args.edits} devices", add_devices)
+
+        def connect():
+            for a, b in zip(new_uuids, new_uuids[1:]):
+                BM.connect_devices(server_pb2.ConnectDevicesRequest(
+                    device_uuid_1=a, device_port_1=out_port,
+                    device_uuid_2=b, device_port_2=in_port))
+        timed(f"connect {args.edits - 1} devices", connect)
+
+        def disconnect():
+            for a, b in zip(uuids[:args.edits:2], uuids[1:args.edits:2]):
+                BM.disconnect_devices(server_pb2.DisconnectDevicesRequest(
+                    device_uuid_1=a, device_port_1=out_port,
+                    device_uuid_2=b, device_port_2=in_port))
+        timed(f"disconnect {args.edits // 2} connections", disconnect)
+
+        def remove():
+            for u in uuids[-args.edits:]:
+                BM.remove_device(u)
+        timed(f"remove {args.edits} devices", remove)
+
+        kept = {m.uuid: m for m in devices_msg}
+        for u in uuids[-args.edits:]:
+            kept.pop(u, None)
+        request = server_pb2.SaveBoardRequest(devices=[
+            *kept.values(),
+            *(server_pb2.Device(module_class=device_mc, uuid=u)
+              for u in new_uuids)])
+        BM.compaction_threshold = float("inf")
+        timed(f"save (journal {len(BM.pending_edits)} edits)",
+              BM.save_scheme, request)
+        request.devices[0].location[:] = [-1, -1]
+        timed("save (journal 1 move)", BM.save_scheme, request)
+        timed(f"compact {len(request.devices)} devices", BM.compact_scheme)
+        timed(f"reopen {len(request.devices)} devices",
+              BM.open_scheme, "board.json", None, True)
+
+        shutil.copy(Path(project) / "board.json",
+                    Path(project) / "other.json")
+        timed("open a second board", BM.open_scheme, "other.json")
+        timed("switch back to the open board", BM.open_scheme, "board.json")
+        print(f"board: {len(BM.devices)} devices, "
+              f"{len(BM.connections)} connections")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,292 @@
+"""
+Concurrency stress test of the board manager
+
+A chained board of --devices devices is opened, then --threads threads
+fire --edits mixed edits through the gRPC servicer (add, remove, connect,
+disconnect, batched edits, undo, redo and saves with moved devices), like
+the thread pool of the gRPC server does. Meanwhile --readers threads check
+the invariants of every snapshot they read (pausing --read-interval
+between two snapshots, like polling clients):
+
+- every connection joins two devices of the same snapshot
+- no port is connected twice
+- the device and connection counts match the snapshot content
+
+Once the edits are done, the live state is checked against the graph, the
+port and adjacency indices and the last snapshot, and the saved board is
+reloaded and compared. Finally a device is added, connected, removed and
+restored with undo, the board must still save and reopen with it. Edits rejected by the board (e.g. a port connected
+by another thread meanwhile) are expected and counted. The script exits
+with status 1 if an invariant is violated.
+
+Usage:
+    python benchmarks/board_stress.py --devices 2000 --threads 16 \
+        --edits 5000 --readers 4
+"""
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+import traceback
+from concurrent import futures
+from pathlib import Path
+
+from board_50k import find_chainable_device, generate_scheme
+from qureed_project_server import server_pb2
+from qureed_project_server.board_manager.board_records import DeviceRecord
+from qureed_project_server.logic_modules import (
+    LogicModuleEnum, LogicModuleHandler
+)
+from qureed_project_server.qureed_manager.qureed_pb import (
+    QuReemManagementService
+)
+
+LMH = LogicModuleHandler()
+
+
+def check_snapshot(snapshot) -> list[str]:
+    """
+    Checks the invariants of a board snapshot
+
+    Returns:
+    --------
+    list[str]: The violated invariants
+    """
+    errors = []
+    devices = {d["uuid"] for d in snapshot.devices()}
+    ports = set()
+    connections = 0
+    for key, descriptor in snapshot.connections():
+        connections += 1
+        for uuid, port in key:
+            if uuid not in devices:
+                errors.append(f"connection {key} to a missing device")
+            if (uuid, port) in ports:
+                errors.append(f"port {uuid}:{port} connected twice")
+            ports.add((uuid, port))
+        ends = {(c["device_uuid"], c["port"]) for c in descriptor["conn"]}
+        if ends != set(key):
+            errors.append(f"connection {key} described as {ends}")
+    if len(devices) != snapshot.device_count:
+        errors.append(f"{len(devices)} devices, counted "
+                      f"{snapshot.device_count}")
+    if connections != snapshot.connection_count:
+        errors.append(f"{connections} connections, counted "
+                      f"{snapshot.connection_count}")
+    return errors
+
+
+def check_board(BM) -> list[str]:
+    """
+    Checks the live board against its indices and its last snapshot, runs
+    on the writer
+    """
+    errors = []
+    if set(BM.graph.topological_order()) != set(BM.devices):
+        errors.append("graph nodes differ from the devices")
+    if set(BM.graph.edges) != set(BM.connections):
+        errors.append("graph edges differ from the connections")
+    ports = {end: key for key in BM.connections for end in key}
+    if ports != BM.port_connections:
+        errors.append("port index differs from the connections")
+    for uuid, keys in BM.adjacency.items():
+        if keys != {k for k in BM.connections if uuid in (k[0][0], k[1][0])}:
+            errors.append(f"adjacency of {uuid} differs")
+    if set(BM.adjacency) != set(BM.devices):
+        errors.append("adjacency differs from the devices")
+    constructed = sum(not isinstance(d, DeviceRecord)
+                      for d in BM.devices.values())
+    if constructed != BM.session.materialized:
+        errors.append(f"{constructed} constructed devices, counted "
+                      f"{BM.session.materialized}")
+    if board_state(BM.scheme_descriptor()) != snapshot_state(BM.snapshot()):
+        errors.append("last snapshot differs from the board")
+    return errors
+
+
+def board_state(descriptor: dict) -> tuple:
+    devices = sorted((d["uuid"], d["device"], tuple(d["location"]))
+                     for d in descriptor["devices"])
+    connections = sorted(
+        tuple(sorted((c["device_uuid"], c["port"]) for c in s["conn"]))
+        for s in descriptor["connections"])
+    return devices, connections
+
+
+def snapshot_state(snapshot) -> tuple:
+    return board_state({
+        "devices": list(snapshot.devices()),
+        "connections": [d for _, d in snapshot.connections()]})
+
+
+def check_undo_remove(servicer, BM, device_mc, in_port, out_port) -> list[str]:
+    """
+    Adds a device, connects it, removes it and undoes the removal, the
+    restored device has to be saved and reopened with its connection
+    """
+    errors = []
+    uuids = [servicer.AddDevice(server_pb2.AddDeviceRequest(
+        device=server_pb2.Device(module_class=device_mc, location=[i, i])),
+        None).device_uuid for i in range(2)]
+    servicer.ConnectDevices(server_pb2.ConnectDevicesRequest(
+        device_uuid_1=uuids[0], device_port_1=out_port,
+        device_uuid_2=uuids[1], device_port_2=in_port), None)
+    servicer.RemoveDevice(
+        server_pb2.RemoveDeviceRequest(device_uuid=uuids[1]), None)
+    servicer.UndoBoard(server_pb2.UndoBoardRequest(), None)
+    before = snapshot_state(BM.snapshot())
+    for _ in range(2):
+        response = servicer.SaveBoard(server_pb2.SaveBoardRequest(), None)
+        if response.status != "success":
+            errors.append(f"save after undo failed: {response.message}")
+    response = servicer.OpenBoard(
+        server_pb2.OpenBoardRequest(board="board.json", reload=True), None)
+    if response.status != "success":
+        errors.append(f"reopen after undo failed: {response.message}")
+    elif snapshot_state(BM.snapshot()) != before:
+        errors.append("reopened board differs after undoing a removal")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--edits", type=int, default=5000)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument(
+        "--read-interval", type=float, default=0.001,
+        help="Pause of the readers between two snapshots in seconds")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as project:
+        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+        VM.path = str(Path(project) / ".venv")
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        servicer = QuReemManagementService()
+
+        device_mc, in_port, out_port = find_chainable_device()
+        generate_scheme(Path(project) / "board.json", device_mc, in_port,
+                        out_port, args.devices)
+        servicer.OpenBoard(
+            server_pb2.OpenBoardRequest(board="board.json"), None)
+
+        def edit(n: int) -> str:
+            rng = random.Random(args.seed * 1_000_003 + n)
+            snapshot = BM.snapshot()
+            uuids = [d["uuid"] for d in snapshot.devices()]
+            keys = [key for key, _ in snapshot.connections()]
+            r = rng.random()
+            if r < 0.2 or len(uuids) < 2:
+                response = servicer.AddDevice(server_pb2.AddDeviceRequest(
+                    device=server_pb2.Device(
+                        module_class=device_mc,
+                        location=[rng.random(), rng.random()])), None)
+            elif r < 0.35:
+                response = servicer.RemoveDevice(
+                    server_pb2.RemoveDeviceRequest(
+                        device_uuid=rng.choice(uuids)), None)
+            elif r < 0.55:
+                a, b = rng.sample(uuids, 2)
+                response = servicer.ConnectDevices(
+                    server_pb2.ConnectDevicesRequest(
+                        device_uuid_1=a, device_port_1=out_port,
+                        device_uuid_2=b, device_port_2=in_port), None)
+            elif r < 0.7 and keys:
+                (u1, p1), (u2, p2) = rng.choice(keys)
+                response = servicer.DisconnectDevices(
+                    server_pb2.DisconnectDevicesRequest(
+                        device_uuid_1=u1, device_port_1=p1,
+                        device_uuid_2=u2, device_port_2=p2), None)
+            elif r < 0.8:
+                new_uuid = str(rng.getrandbits(128))
+                response = servicer.ApplyBoardEdits(
+                    server_pb2.ApplyBoardEditsRequest(edits=[
+                        server_pb2.BoardEdit(
+                            add_device=server_pb2.AddDeviceRequest(
+                                device=server_pb2.Device(
+                                    module_class=device_mc,
+                                    uuid=new_uuid))),
+                        server_pb2.BoardEdit(
+                            connect_devices=server_pb2.ConnectDevicesRequest(
+                                device_uuid_1=rng.choice(uuids),
+                                device_port_1=out_port,
+                                device_uuid_2=new_uuid,
+                                device_port_2=in_port)),
+                    ]), None)
+            elif r < 0.85:
+                response = servicer.UndoBoard(
+                    server_pb2.UndoBoardRequest(), None)
+            elif r < 0.9:
+                response = servicer.RedoBoard(
+                    server_pb2.RedoBoardRequest(), None)
+            else:
+                # Saving iterates over the board while other threads edit
+                moved = rng.sample(uuids, min(20, len(uuids)))
+                response = servicer.SaveBoard(server_pb2.SaveBoardRequest(
+                    devices=[server_pb2.Device(
+                        uuid=u, location=[rng.random(), rng.random()])
+                        for u in moved]), None)
+            return response.status
+
+        errors = []
+        done = threading.Event()
+        snapshots_checked = [0]
+
+        def read():
+            while not done.is_set():
+                try:
+                    snapshot = BM.snapshot()
+                    violations = check_snapshot(snapshot)
+                    servicer.ListBoards(server_pb2.ListBoardsRequest(), None)
+                    servicer.GetBoardHistory(
+                        server_pb2.GetBoardHistoryRequest(), None)
+                except Exception:
+                    violations = [traceback.format_exc()]
+                errors.extend(violations)
+                snapshots_checked[0] += 1
+                time.sleep(args.read_interval)
+
+        readers = [threading.Thread(target=read, daemon=True)
+                   for _ in range(args.readers)]
+        for reader in readers:
+            reader.start()
+        start = time.perf_counter()
+        with futures.ThreadPoolExecutor(max_workers=args.threads) as pool:
+            statuses = list(pool.map(edit, range(args.edits)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        for reader in readers:
+            reader.join()
+
+        errors.extend(BM.writer.call(check_board, BM))
+        before = snapshot_state(BM.snapshot())
+        servicer.SaveBoard(server_pb2.SaveBoardRequest(), None)
+        BM.open_scheme("board.json", reload=True)
+        if snapshot_state(BM.snapshot()) != before:
+            errors.append("reloaded board differs from the saved board")
+        errors.extend(BM.writer.call(check_board, BM))
+        errors.extend(check_undo_remove(
+            servicer, BM, device_mc, in_port, out_port))
+
+        print(f"{args.edits} edits from {args.threads} threads in "
+              f"{elapsed:.2f} s ({args.edits / elapsed:.0f} edits/s), "
+              f"{statuses.count('success')} applied, "
+              f"{statuses.count('failure')} rejected")
+        print(f"{snapshots_checked[0]} snapshots checked by "
+              f"{args.readers} readers")
+        print(f"board: {len(BM.devices)} devices, "
+              f"{len(BM.connections)} connections")
+        if errors:
+            for error in errors[:20]:
+                print("VIOLATION:", error)
+            print(f"{len(errors)} invariant violations")
+            sys.exit(1)
+        print("all invariants hold")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark of the device metadata extraction used when building the catalog
+
+Compares constructing every device (the old behaviour) with the memoized
+class-level property schema of QuReedManager.get_device_properties. The
+time and the peak of the allocated memory are reported per catalog scan.
+
+Usage:
+    python benchmarks/device_metadata.py --repeat 20
+"""
+import argparse
+import importlib
+import inspect
+import time
+import tracemalloc
+from pathlib import Path
+
+import qureed_project_server  # noqa: F401 (initializes the singletons)
+from qureed_project_server.logic_modules import (
+    LogicModuleEnum, LogicModuleHandler
+)
+
+LMH = LogicModuleHandler()
+
+
+def collect_device_classes() -> list[type]:
+    QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+    GenericDevice = QM.get_class(
+        "qureed.devices.generic_device.GenericDevice")
+    spec = importlib.util.find_spec("qureed")
+    qureed_path = Path(next(iter(spec.submodule_search_locations)))
+    device_classes = {}
+    for module_name, _ in QM.find_modules(
+            qureed_path / "devices", qureed_path, prefix="qureed."):
+        try:
+            module = importlib.import_module(module_name)
+        except Exception:
+            continue
+        for attr in vars(module).values():
+            if (inspect.isclass(attr) and issubclass(attr, GenericDevice) and
+                    attr is not GenericDevice):
+                device_classes[f"{attr.__module__}.{attr.__qualname__}"] = attr
+    return list(device_classes.values())
+
+
+def measure(scan, repeat: int) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        scan()
+    elapsed = (time.perf_counter() - start) / repeat
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+    BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+    device_classes = collect_device_classes()
+
+    def instantiate_scan():
+        for device_class in device_classes:
+            try:
+                BM.serialize_properties(
+                    device_class(trigger=False).properties)
+            except Exception:
+                pass
+
+    def cold_schema_scan():
+        QM.device_properties.clear()
+        for device_class in device_classes:
+            try:
+                QM.get_device_properties(device_class)
+            except Exception:
+                pass
+
+    def warm_schema_scan():
+        for device_class in device_classes:
+            try:
+                QM.get_device_properties(device_class)
+            except Exception:
+                pass
+
+    print(f"{len(device_classes)} device classes, {args.repeat} scans")
+    print(f"{'mode':<24}{'ms/scan':>12}{'peak KiB':>12}")
+    for name, scan in (("instantiate", instantiate_scan),
+                       ("schema (cold)", cold_schema_scan),
+                       ("schema (memoized)", warm_schema_scan)):
+        elapsed, peak = measure(scan, args.repeat)
+        print(f"{name:<24}{elapsed * 1000:>12.3f}{peak / 1024:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark of the simulation log submission
+
+The simulation servicer is served in process, a subscriber follows the
+SimulationLogStream (like the frontend does) while --logs logs are
+submitted, first with one unary SimulationLogSubmission call per log, then
+through the LogBatcher over the client-streaming
+SimulationLogBatchSubmission. The throughput (logs/s) is measured from the
+first submitted log until the subscriber received the last one.
+
+Usage:
+    python benchmarks/log_submission.py --logs 20000 --batch-size 500
+"""
+import argparse
+import threading
+import time
+from concurrent import futures
+
+import grpc
+
+from qureed_project_server import server_pb2, server_pb2_grpc
+from qureed_project_server.logic_modules import (
+    LogicModuleEnum, LogicModuleHandler
+)
+from qureed_project_server.qureed_simulation_manager.qureed_simulation_pb import (
+    QuReedSimulationServicer
+)
+from qureed_project_server.simulation.log_batcher import LogBatcher
+
+LMH = LogicModuleHandler()
+
+
+def make_log(n: int, total: int) -> server_pb2.SimulationLog:
+    return server_pb2.SimulationLog(
+        simulation_id="benchmark",
+        simulation_timestamp=n * 1e-9,
+        timestamp=float(n),
+        message=f"Photon detected on detector {n % 8}",
+        log_type="info",
+        device_name=f"Detector {n % 8}",
+        device_type="qureed.devices.detectors.ideal_detector.IdealDetector",
+        end=n == total - 1,
+    )
+
+
+def subscribe(stub, batched: bool) -> threading.Thread:
+    """
+    Follows the log stream until the end log, the returned thread ends
+    once the last log was received
+    """
+    received = [0]
+
+    def follow():
+        request = server_pb2.SimulationLogStreamRequest(batched=batched)
+        for response in stub.SimulationLogStream(request):
+            received[0] += len(response.logs) or 1
+
+    SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
+    subscribed = set(SiM.log_broker.subscriptions())
+    thread = threading.Thread(target=follow, daemon=True)
+    thread.received = received
+    thread.start()
+    while not set(SiM.log_broker.subscriptions()) - subscribed:
+        time.sleep(0.001)
+    return thread
+
+
+def run_unary(stub, logs: list) -> float:
+    subscriber = subscribe(stub, batched=False)
+    start = time.perf_counter()
+    for log in logs:
+        stub.SimulationLogSubmission(
+            server_pb2.SubmitSimulationLogRequest(log=log))
+    subscriber.join()
+    elapsed = time.perf_counter() - start
+    assert subscriber.received[0] == len(logs), subscriber.received[0]
+    return elapsed
+
+
+def run_batched(stub, logs: list, args) -> float:
+    subscriber = subscribe(stub, batched=True)
+    batcher = LogBatcher(
+        stub.SimulationLogBatchSubmission,
+        max_batch_logs=args.batch_size,
+        flush_interval=args.flush_interval)
+    start = time.perf_counter()
+    for log in logs:
+        batcher.submit(log)
+    batcher.close()
+    subscriber.join()
+    elapsed = time.perf_counter() - start
+    assert subscriber.received[0] == len(logs), subscriber.received[0]
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logs", type=int, default=20000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--flush-interval", type=float, default=0.05)
+    args = parser.parse_args()
+
+    servicer = QuReedSimulationServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server_pb2_grpc.add_QuReedSimulationServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+            stub = server_pb2_grpc.QuReedSimulationStub(channel)
+            logs = [make_log(n, args.logs) for n in range(args.logs)]
+            unary = run_unary(stub, logs)
+            batched = run_batched(stub, logs, args)
+    finally:
+        server.stop(None)
+
+    print(f"unary:   {args.logs} logs in {unary:.2f} s "
+          f"({args.logs / unary:.0f} logs/s)")
+    print(f"batched: {args.logs} logs in {batched:.2f} s "
+          f"({args.logs / batched:.0f} logs/s), "
+          f"batches of up to {args.batch_size} logs")
+    print(f"speedup: {unary / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark of the JSON and the binary scheme format
+
+A synthetic scheme with --devices devices (each with a few typed
+properties) and a chain of connections is written in both formats. The
+file sizes and the time needed to read and write every format are
+reported. Only the file formats are measured, no devices are built.
+
+Usage:
+    python benchmarks/scheme_format.py --devices 50000 --repeat 3
+"""
+import argparse
+import tempfile
+import time
+import uuid
+from pathlib import Path
+
+from qureed_project_server.board_manager.scheme_format import (
+    BINARY_FORMAT, JSON_FORMAT, read_scheme, write_scheme
+)
+
+
+def generate_scheme(devices: int) -> dict:
+    uuids = [str(uuid.uuid4()) for _ in range(devices)]
+    return {
+        "devices": [
+            {
+                "device": "qureed.devices.beam.beam_splitter.BeamSplitter",
+                "location": [float(i % 300), float(i // 300)],
+                "uuid": u,
+                "properties": {
+                    "ratio": {"type": "float", "value": 0.5},
+                    "modes": {"type": "int", "value": 4},
+                    "label": {"type": "str", "value": f"BS {i}"},
+                    "enabled": {"type": "bool", "value": True},
+                },
+            }
+            for i, u in enumerate(uuids)
+        ],
+        "connections": [
+            {
+                "signal": "qureed.signals.signals.GenericQuantumSignal",
+                "conn": [{"device_uuid": a, "port": "B"},
+                         {"device_uuid": b, "port": "A"}],
+            }
+            for a, b in zip(uuids, uuids[1:])
+        ],
+        "revision": 0,
+    }
+
+
+def best_of(repeat: int, func, *args) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--devices", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    scheme = generate_scheme(args.devices)
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'format':<8} {'size [MB]':>10} {'write [s]':>10} "
+              f"{'read [s]':>10}")
+        for scheme_format in (JSON_FORMAT, BINARY_FORMAT):
+            path = Path(directory) / f"board.{scheme_format}"
+            write_time = best_of(
+                args.repeat, write_scheme, path, scheme, scheme_format)
+            read_time = best_of(
+                args.repeat, read_scheme, path, scheme_format)
+            assert read_scheme(path) == scheme
+            size = path.stat().st_size / 2**20
+            print(f"{scheme_format:<8} {size:10.2f} {write_time:10.3f} "
+                  f"{read_time:10.3f}")
+
+
+if __name__ == "__main__":
+    main()
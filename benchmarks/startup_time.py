@@ -0,0 +1,108 @@
+"""
+Startup time report of the qureed_server entry point
+
+Imports the server module in a fresh interpreter with `-X importtime` and
+reports the total import time together with the slowest imports. With
+--serve the server is started as well and the time until the first
+successful `Status` call is measured.
+
+Usage:
+    python benchmarks/startup_time.py --top 15
+    python benchmarks/startup_time.py --serve --port 50555
+    python benchmarks/startup_time.py --max-import-ms 400
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+MODULE = "qureed_project_server.server"
+
+
+def measure_imports(module: str) -> list[tuple[str, int, int]]:
+    """
+    Imports the module in a new interpreter and parses the importtime log
+
+    Returns:
+    --------
+    list[tuple[str, int, int]]: (module, self us, cumulative us) of every
+        import in import order
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        imports.append((name.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def measure_status(port: int, timeout: float = 30.0) -> float:
+    """
+    Starts the server and measures the time until `Status` succeeds
+
+    Returns:
+    --------
+    float: Seconds from spawning the server to the first Status response
+    """
+    import grpc
+    from qureed_project_server import server_pb2, server_pb2_grpc
+
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", MODULE, "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.perf_counter() - start < timeout:
+            # A new channel per attempt avoids the reconnect backoff
+            with grpc.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = server_pb2_grpc.ServerManagementStub(channel)
+                try:
+                    stub.Status(server_pb2.StatusRequest(), timeout=0.5)
+                    return time.perf_counter() - start
+                except grpc.RpcError:
+                    time.sleep(0.01)
+        raise TimeoutError(f"Server didn't respond within {timeout}s")
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--module", default=MODULE)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--serve", action="store_true",
+                        help="Also measure the time until Status succeeds")
+    parser.add_argument("--port", type=int, default=50555)
+    parser.add_argument("--max-import-ms", type=float, default=None,
+                        help="Exit with an error above this import time")
+    args = parser.parse_args()
+
+    imports = measure_imports(args.module)
+    total_us = next(
+        cumulative for name, _, cumulative in imports if name == args.module)
+    print(f"import {args.module}: {total_us / 1000:.1f} ms")
+    print(f"{'cumulative [ms]':>16} {'self [ms]':>10}  module")
+    for name, self_us, cumulative_us in sorted(
+            imports, key=lambda i: i[2], reverse=True)[:args.top]:
+        print(f"{cumulative_us / 1000:16.1f} {self_us / 1000:10.1f}  {name}")
+
+    heavy = ["jinja2", "numpy", "virtualenvapi", "qureed"]
+    loaded = {name for name, _, _ in imports}
+    print("heavy modules imported at startup:",
+          ", ".join(m for m in heavy if m in loaded) or "none")
+
+    if args.serve:
+        print(f"time to first Status: "
+              f"{measure_status(args.port) * 1000:.1f} ms")
+
+    if args.max_import_ms is not None and total_us / 1000 > args.max_import_ms:
+        sys.exit(f"Import time above {args.max_import_ms} ms")
+
+
+if __name__ == "__main__":
+    main()
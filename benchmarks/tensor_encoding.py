@@ -0,0 +1,103 @@
+"""
+Benchmark of the Tensor wire encodings
+
+A random --dim x --dim complex density matrix is encoded with the repeated
+real_values/imag_values fields and as a raw buffer (dense, uncompressed
+and with every available compression). The message size and the time
+needed to encode (message_from_tensor and serialization) and to decode
+(parsing and tensor_from_message) are reported, the decoded tensors are
+checked against the original. The same is measured for a Fock-space
+density matrix with populated levels below --photons (sparse encoding),
+and the size of the preview the server forwards instead of the full
+tensor is reported.
+
+Usage:
+    python benchmarks/tensor_encoding.py --dim 256 --photons 8 --repeat 20
+"""
+import argparse
+import importlib
+import time
+
+import numpy as np
+
+from qureed_project_server import server_pb2
+from qureed_project_server.utils.tensor_logging import (
+    COMPRESSIONS, message_from_tensor, preview_of_tensor, tensor_from_message
+)
+
+
+def density_matrix(dim: int) -> np.ndarray:
+    rng = np.random.default_rng(1)
+    a = rng.normal(size=(dim, dim)) + 1j * rng.normal(size=(dim, dim))
+    rho = a @ a.conj().T
+    return rho / np.trace(rho)
+
+
+def fock_density_matrix(dim: int, photons: int) -> np.ndarray:
+    rho = np.zeros((dim, dim), dtype=complex)
+    rho[:photons, :photons] = density_matrix(photons)
+    return rho
+
+
+def available(compression: str) -> bool:
+    modules = {"zlib": "zlib", "zstd": "zstandard", "lz4": "lz4.frame"}
+    try:
+        importlib.import_module(modules[compression])
+        return True
+    except ModuleNotFoundError:
+        return False
+
+
+def measure(rho: np.ndarray, repeat: int, **encoding) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        payload = message_from_tensor(rho, **encoding).SerializeToString()
+    encode = (time.perf_counter() - start) / repeat
+    start = time.perf_counter()
+    for _ in range(repeat):
+        message = server_pb2.Tensor()
+        message.ParseFromString(payload)
+        decoded = tensor_from_message(message)
+    decode = (time.perf_counter() - start) / repeat
+    if not np.array_equal(decoded, rho):
+        raise AssertionError(f"{encoding} does not round-trip")
+    return len(payload), encode, decode
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--dim", type=int, default=256)
+    parser.add_argument("--photons", type=int, default=8)
+    parser.add_argument("--preview-elements", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    encodings = [("repeated", {"raw": False}),
+                 ("raw dense", {"sparse": False}),
+                 ("raw", {})]
+    encodings += [(f"raw+{c}", {"compression": c})
+                  for c in COMPRESSIONS if available(c)]
+    for title, rho in [
+            ("random", density_matrix(args.dim)),
+            (f"Fock ({args.photons} levels)",
+             fock_density_matrix(args.dim, args.photons))]:
+        print(f"{args.dim}x{args.dim} {title} complex density matrix "
+              f"({rho.nbytes / 1e6:.2f} MB)")
+        print(f"{'encoding':<12} {'size MB':>8} {'encode ms':>10} "
+              f"{'decode ms':>10}")
+        for name, encoding in encodings:
+            size, encode, decode = measure(rho, args.repeat, **encoding)
+            print(f"{name:<12} {size / 1e6:>8.4f} {encode * 1e3:>10.2f} "
+                  f"{decode * 1e3:>10.2f}")
+        preview = message_from_tensor(
+            preview_of_tensor(rho, args.preview_elements))
+        print(f"{'preview':<12} {preview.ByteSize() / 1e6:>8.4f} "
+              f"(shape {list(preview.shape)})")
+        print()
+    skipped = [c for c in COMPRESSIONS if not available(c)]
+    if skipped:
+        print(f"not installed: {', '.join(skipped)}")
+
+
+if __name__ == "__main__":
+    main()
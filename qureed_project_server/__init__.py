@@ -1,3 +1,2 @@
-import qureed_project_server.board_manager
-import qureed_project_server.venv_management
-import qureed_project_server.qureed_manager
+# The logic modules (and with them their heavy dependencies) are imported
+# on first use through the LogicModuleHandler
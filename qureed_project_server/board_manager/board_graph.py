@@ -0,0 +1,302 @@
+"""
+Incrementally maintained structure of the board graph
+
+The devices are the nodes of the graph and the connections its edges,
+directed from the output to the input port. BoardGraph keeps the connected
+components, a topological order and the connections closing a cycle up to
+date with every added or removed node and edge, so no query needs to
+traverse the whole board.
+
+- Components: union-find (union by size, path halving), so connecting is
+  nearly O(1). Every root keeps the list of its members. Disconnecting
+  only marks the component as dirty, the members of the dirty components
+  are rebuilt from their edges when the components are queried next, so a
+  burst of edits costs at most one rebuild per component and the rest of
+  the board is not visited.
+- Topological order: Pearce-Kelly dynamic topological sort. An edge which
+  agrees with the current order costs O(1), otherwise only the nodes
+  between its ends in the order are searched and reordered.
+- Cycles: an edge which would close a cycle is kept aside as a cycle edge
+  and left out of the ordering. Once an ordered edge of the same component
+  is removed, the cycle edges of that component are ordered again if they
+  no longer close a cycle.
+"""
+
+
+class BoardGraph:
+    """
+    BoardGraph maintains the components, the topological order and the cycle
+    edges of the board
+
+    Attributes:
+    -----------
+    parent (dict): Union-find parent of every node
+    members (dict): Nodes of every component keyed by its union-find root
+    dirty (set): Union-find roots of the components which might be split
+    neighbors (dict): Undirected edge multiplicities keyed by node
+    successors (dict): Ordered edge multiplicities keyed by source node
+    predecessors (dict): Ordered edge multiplicities keyed by target node
+    edges (dict): (source, target) of every edge keyed by the edge key
+    cycle_edges (set): Keys of the edges which close a cycle
+    position (dict): Position of every node in the topological order
+    revision (int): Incremented with every change of the graph
+
+    Methods:
+    --------
+    clear(): Removes all nodes and edges
+    add_node(node): Adds a node without edges
+    remove_node(node): Removes a node, its edges must be removed first
+    add_edge(key, source, target): Adds a directed edge
+    remove_edge(key): Removes the edge
+    topological_order(): Nodes in topological order
+    components(): Nodes of every component in topological order
+    """
+
+    def __init__(self):
+        self.revision = 0
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        Removes all nodes and edges
+        """
+        self.parent = {}
+        self.members = {}
+        self.dirty = set()
+        self.removed = set()
+        self.neighbors = {}
+        self.successors = {}
+        self.predecessors = {}
+        self.edges = {}
+        self.cycle_edges = set()
+        self.position = {}
+        self._order = []
+        self._holes = 0
+        self.revision += 1
+
+    def add_node(self, node: str) -> None:
+        """
+        Adds the node as its own component at the end of the order
+        """
+        if node in self.neighbors:
+            return
+        self.revision += 1
+        if node in self.removed:
+            # Still linked into a dirty component, separated on rebuild
+            self.removed.discard(node)
+        else:
+            self.parent[node] = node
+            self.members[node] = [node]
+        self.neighbors[node] = {}
+        self.successors[node] = {}
+        self.predecessors[node] = {}
+        self.position[node] = len(self._order)
+        self._order.append(node)
+
+    def remove_node(self, node: str) -> None:
+        """
+        Removes the node, the edges of the node must be removed before
+
+        Raises:
+        -------
+        ValueError
+            If the node still has edges
+        """
+        if self.neighbors[node]:
+            raise ValueError(f"Node {node} still has edges")
+        self.revision += 1
+        root = self._find(node)
+        if root == node and len(self.members[node]) == 1:
+            del self.parent[node]
+            del self.members[node]
+        else:
+            # Other nodes might still point to it, it is dropped on rebuild
+            self.removed.add(node)
+            self.dirty.add(root)
+        del self.neighbors[node]
+        del self.successors[node]
+        del self.predecessors[node]
+        self._order[self.position.pop(node)] = None
+        self._holes += 1
+        if self._holes > 64 and self._holes > len(self._order) // 2:
+            self._compact()
+
+    def add_edge(self, key, source: str, target: str) -> None:
+        """
+        Adds the directed edge, an edge which closes a cycle is added as a
+        cycle edge
+
+        Parameters:
+        -----------
+        key (Hashable): Key of the edge (connection key)
+        source (str): Source node (device with the output port)
+        target (str): Target node (device with the input port)
+        """
+        self.revision += 1
+        self.edges[key] = (source, target)
+        _increment(self.neighbors[source], target)
+        _increment(self.neighbors[target], source)
+        self._union(source, target)
+        if self._order_edge(source, target):
+            _increment(self.successors[source], target)
+            _increment(self.predecessors[target], source)
+        else:
+            self.cycle_edges.add(key)
+
+    def remove_edge(self, key) -> None:
+        """
+        Removes the edge, the component is marked dirty if no other edge
+        connects the ends directly
+        """
+        self.revision += 1
+        source, target = self.edges.pop(key)
+        _decrement(self.neighbors[source], target)
+        _decrement(self.neighbors[target], source)
+        if key in self.cycle_edges:
+            self.cycle_edges.discard(key)
+        else:
+            _decrement(self.successors[source], target)
+            _decrement(self.predecessors[target], source)
+            if self.cycle_edges:
+                self._retry_cycle_edges(self._find(source))
+        if target not in self.neighbors[source]:
+            self.dirty.add(self._find(source))
+
+    def topological_order(self) -> list[str]:
+        """
+        Gets the nodes in topological order, the cycle edges are ignored
+        """
+        return [node for node in self._order if node is not None]
+
+    def components(self) -> list[list[str]]:
+        """
+        Gets the nodes of every component in topological order, the
+        components are ordered by their first node
+        """
+        self._rebuild()
+        components = {}
+        for node in self._order:
+            if node is not None:
+                components.setdefault(self._find(node), []).append(node)
+        return list(components.values())
+
+    def _find(self, node: str) -> str:
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]
+            node = parent[node]
+        return node
+
+    def _union(self, a: str, b: str) -> None:
+        a, b = self._find(a), self._find(b)
+        if a == b:
+            return
+        if len(self.members[a]) < len(self.members[b]):
+            a, b = b, a
+        self.parent[b] = a
+        self.members[a].extend(self.members.pop(b))
+        if b in self.dirty:
+            self.dirty.discard(b)
+            self.dirty.add(a)
+
+    def _rebuild(self) -> None:
+        """
+        Rebuilds the dirty components from the edges of their nodes
+        """
+        if not self.dirty:
+            return
+        stale = [node for root in self.dirty
+                 for node in self.members.pop(root)]
+        self.dirty.clear()
+        for node in stale:
+            if node in self.removed:
+                self.removed.discard(node)
+                del self.parent[node]
+            else:
+                self.parent[node] = node
+                self.members[node] = [node]
+        for node in stale:
+            if node in self.neighbors:
+                for neighbor in self.neighbors[node]:
+                    self._union(node, neighbor)
+
+    def _order_edge(self, source: str, target: str) -> bool:
+        """
+        Updates the topological order for the new edge (Pearce-Kelly)
+
+        Returns:
+        --------
+        bool: False if the edge closes a cycle, the order is unchanged then
+        """
+        if source == target:
+            # A device feeding itself
+            return False
+        upper = self.position[source]
+        lower = self.position[target]
+        if lower > upper:
+            return True
+
+        forward = []
+        seen = {target}
+        stack = [target]
+        while stack:
+            node = stack.pop()
+            forward.append(node)
+            for successor in self.successors[node]:
+                if successor == source:
+                    return False
+                if successor not in seen and self.position[successor] < upper:
+                    seen.add(successor)
+                    stack.append(successor)
+
+        backward = []
+        seen = {source}
+        stack = [source]
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for predecessor in self.predecessors[node]:
+                if (predecessor not in seen and
+                        self.position[predecessor] > lower):
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+
+        # The affected nodes keep their slots, the nodes reaching the source
+        # are placed before the nodes reachable from the target
+        position = self.position
+        backward.sort(key=position.__getitem__)
+        forward.sort(key=position.__getitem__)
+        nodes = backward + forward
+        for node, slot in zip(nodes, sorted(position[n] for n in nodes)):
+            self._order[slot] = node
+            position[node] = slot
+        return True
+
+    def _retry_cycle_edges(self, root: str) -> None:
+        """
+        Orders the cycle edges of the component which no longer close a
+        cycle
+        """
+        for key in list(self.cycle_edges):
+            source, target = self.edges[key]
+            if (self._find(source) == root and
+                    self._order_edge(source, target)):
+                self.cycle_edges.discard(key)
+                _increment(self.successors[source], target)
+                _increment(self.predecessors[target], source)
+
+    def _compact(self) -> None:
+        self._order = self.topological_order()
+        self.position = {node: i for i, node in enumerate(self._order)}
+        self._holes = 0
+
+
+def _increment(counts: dict, node: str) -> None:
+    counts[node] = counts.get(node, 0) + 1
+
+
+def _decrement(counts: dict, node: str) -> None:
+    if counts[node] == 1:
+        del counts[node]
+    else:
+        counts[node] -= 1
@@ -0,0 +1,229 @@
+"""
+Version history of the board for undo, redo and revert
+
+Every version holds two persistent maps (devices keyed by uuid, connections
+keyed by their connection key) with the entries which changed since the
+scheme was opened, everything else is read from the opened scheme (the
+base). Recording a version only copies the paths to the changed entries,
+so the memory per version is proportional to the edit, not to the board.
+Moving to another version swaps the current version, the changes to apply
+to the board are the difference of the two versions, which skips all
+shared structure.
+"""
+from contextlib import contextmanager
+
+from qureed_project_server.utils.persistent_map import MISSING, PersistentMap
+
+# Marks a device or connection removed since the scheme was opened
+REMOVED = object()
+
+
+class BoardVersion:
+    """
+    A recorded state of the board
+
+    Attributes:
+    -----------
+    number (int): Number of the version, zero is the opened scheme
+    description (str): Edit which led to the version
+    devices (PersistentMap): Changed device entries keyed by uuid
+    connections (PersistentMap): Changed connection entries keyed by the
+        connection key
+    previous (Optional[BoardVersion]): The version it was recorded on, None
+        for the oldest kept version
+    """
+    __slots__ = ("number", "description", "devices", "connections",
+                 "previous")
+
+    def __init__(
+            self,
+            number: int,
+            description: str,
+            devices: PersistentMap,
+            connections: PersistentMap,
+            previous: "BoardVersion | None" = None):
+        self.number = number
+        self.description = description
+        self.devices = devices
+        self.connections = connections
+        self.previous = previous
+
+    def lineage(self) -> list["BoardVersion"]:
+        """
+        Gets the kept versions up to this one, oldest first
+        """
+        versions = []
+        version = self
+        while version is not None:
+            versions.append(version)
+            version = version.previous
+        versions.reverse()
+        return versions
+
+
+class BoardHistory:
+    """
+    BoardHistory records the versions of the board. The entries are the
+    device and connection descriptors (as stored in the scheme), they must
+    not be modified once staged.
+
+    The board manager stages the entries changed by an edit and commits
+    them as a new version. Committing after an undo drops the undone
+    versions. Edits within `batch()` are committed as a single version.
+    Every version links the version it was recorded on, so the newest
+    version describes the whole history without copying the list.
+
+    Attributes:
+    -----------
+    base_devices (dict): Device descriptors of the opened scheme
+    base_connections (dict): Connection descriptors of the opened scheme
+    versions (list[BoardVersion]): Recorded versions, oldest first
+    current (int): Index of the current version
+    latest (BoardVersion): Newest recorded version
+    max_versions (int): Number of versions kept, the oldest versions are
+        dropped first
+
+    Methods:
+    --------
+    reset(): Starts a new history for a newly opened scheme
+    stage_device(uuid, entry): Stages the new state of the device
+    stage_connection(key, entry): Stages the new state of the connection
+    commit(description): Records the staged entries as a new version
+    discard(): Drops the staged entries
+    batch(description): Commits the edits made within as one version
+    checkout(number): Makes the version current, returns the changes
+    """
+
+    def __init__(self, max_versions: int = 1000):
+        self.max_versions = max_versions
+        self.reset()
+
+    def reset(
+            self,
+            base_devices: dict | None = None,
+            base_connections: dict | None = None) -> None:
+        """
+        Starts a new history, the base dicts may still be filled while the
+        scheme is being opened
+        """
+        self.base_devices = base_devices if base_devices is not None else {}
+        self.base_connections = (
+            base_connections if base_connections is not None else {})
+        self.versions = [BoardVersion(
+            0, "open", PersistentMap(), PersistentMap())]
+        self.current = 0
+        self._batch_depth = 0
+        self.discard()
+
+    @property
+    def version(self) -> int:
+        return self.versions[self.current].number
+
+    @property
+    def latest(self) -> BoardVersion:
+        return self.versions[-1]
+
+    def stage_device(self, uuid: str, entry: dict | None) -> None:
+        """
+        Stages the device descriptor (None if the device was removed)
+        """
+        self._devices = self._devices.set(
+            uuid, REMOVED if entry is None else entry)
+
+    def stage_connection(self, key: tuple, entry: dict | None) -> None:
+        """
+        Stages the connection descriptor (None if it was removed)
+        """
+        self._connections = self._connections.set(
+            key, REMOVED if entry is None else entry)
+
+    def commit(self, description: str) -> None:
+        """
+        Records the staged entries as a new version, nothing is recorded
+        within a batch or if nothing was staged
+        """
+        current = self.versions[self.current]
+        if self._batch_depth or (self._devices is current.devices and
+                                 self._connections is current.connections):
+            return
+        del self.versions[self.current + 1:]
+        self.versions.append(BoardVersion(
+            current.number + 1, description,
+            self._devices, self._connections, current))
+        if len(self.versions) > self.max_versions:
+            del self.versions[:len(self.versions) - self.max_versions]
+            self.versions[0].previous = None
+        self.current = len(self.versions) - 1
+
+    def discard(self) -> None:
+        """
+        Drops the staged entries which were not committed
+        """
+        current = self.versions[self.current]
+        self._devices = current.devices
+        self._connections = current.connections
+
+    @contextmanager
+    def batch(self, description: str):
+        """
+        Commits all edits made within the context as a single version, the
+        staged entries are discarded if an exception is raised
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        except BaseException:
+            self._batch_depth -= 1
+            self.discard()
+            raise
+        self._batch_depth -= 1
+        self.commit(description)
+
+    def checkout(self, number: int) -> tuple[list[tuple], list[tuple]]:
+        """
+        Makes the given version the current one
+
+        Parameters:
+        -----------
+        number (int): Number of the version
+
+        Returns:
+        --------
+        tuple[list[tuple], list[tuple]]: Changed devices as (uuid, current
+            entry, new entry) and changed connections as (key, current
+            entry, new entry), an entry is None if it doesn't exist
+
+        Raises:
+        -------
+        ValueError
+            If the version is not in the history
+        """
+        index = number - self.versions[0].number
+        if not 0 <= index < len(self.versions):
+            raise ValueError(
+                f"Version {number} is not in the history (versions "
+                f"{self.versions[0].number}-{self.versions[-1].number})")
+        self.discard()
+        current, target = self.versions[self.current], self.versions[index]
+        device_changes = self._changes(
+            current.devices, target.devices, self.base_devices)
+        connection_changes = self._changes(
+            current.connections, target.connections, self.base_connections)
+        self.current = index
+        self.discard()
+        return device_changes, connection_changes
+
+    @staticmethod
+    def _changes(
+            current: PersistentMap,
+            target: PersistentMap,
+            base: dict) -> list[tuple]:
+        changes = []
+        for key, old, new in current.diff(target):
+            old = base.get(key) if old is MISSING else old
+            new = base.get(key) if new is MISSING else new
+            old = None if old is REMOVED else old
+            new = None if new is REMOVED else new
+            if old is not new:
+                changes.append((key, old, new))
+        return changes
@@ -1,13 +1,28 @@
-import json
+import copy
+import functools
+import queue
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from qureed_project_server.logic_modules import (
     LogicModuleEnum,
     LogicModuleHandler
 )
 from qureed_project_server import server_pb2
-from google.protobuf.struct_pb2 import Struct
 from google.protobuf.json_format import MessageToDict
 
+from qureed_project_server.board_manager.board_history import REMOVED
+from qureed_project_server.board_manager.board_session import BoardSession
+from qureed_project_server.board_manager.board_snapshot import BoardSnapshot
+from qureed_project_server.board_manager.board_writer import BoardWriter
+from qureed_project_server.board_manager.board_records import (
+    ConnectionRecord, DeviceRecord, device_uuid, module_class
+)
+from qureed_project_server.board_manager.scheme_format import (
+    BINARY_FORMAT, plain_properties
+)
+
 LMH = LogicModuleHandler()
 
 
@@ -19,6 +34,48 @@ class NoSchemeOpenedError(Exception):
     """Raised when no scheme is opened, but is expected to be"""
 
 
+def connection_key(
+        device_uuid_1: str, port_1: str,
+        device_uuid_2: str, port_2: str) -> tuple:
+    """
+    Gets the key of the connection between the two ports, the key doesn't
+    depend on the order of the endpoints
+    """
+    end_1, end_2 = (device_uuid_1, port_1), (device_uuid_2, port_2)
+    return (end_1, end_2) if end_1 <= end_2 else (end_2, end_1)
+
+
+def _session_attribute(name: str) -> property:
+    """
+    Exposes an attribute of the active board session on the BoardManager
+    """
+    def get(self):
+        if self.session is None:
+            raise NoSchemeOpenedError("No Scheme is currently opened")
+        return getattr(self.session, name)
+
+    def set(self, value):
+        if self.session is None:
+            raise NoSchemeOpenedError("No Scheme is currently opened")
+        setattr(self.session, name, value)
+    return property(get, set)
+
+
+def _board_command(method):
+    """
+    Runs the decorated BoardManager method as a command on the board
+    writer, for the board selected with `use_board`. Commands issued by a
+    running command (e.g. the edits of apply_board_edits) run immediately.
+    """
+    @functools.wraps(method)
+    def command(self, *args, **kwargs):
+        if self.writer.is_writer():
+            return method(self, *args, **kwargs)
+        return self.writer.call(
+            self._run_command, self._selected_board(), method, args, kwargs)
+    return command
+
+
 class BoardManager:
     """
     BoardManager (Singleton) manages the board
@@ -26,19 +83,71 @@ class BoardManager:
     BoardManager opens (loads) a scheme and saves the scheme. Additionally it
     manages the addition and removal of devices and connections.
 
+    Several boards can be open at once, each in its own session (see
+    board_session) keyed by the scheme location. The edits apply to the
+    active board, `use_board` selects it. Reopening an open board only
+    switches to it. The constructed devices of the least recently used
+    boards are replaced by records once more boards (or devices) than
+    allowed are constructed.
+
+    The attributes of the active board (devices, connections, ...) are
+    read from its session.
+
+    The boards are only changed by the commands of a single writer thread
+    (see board_writer), the mutating methods queue their call and wait for
+    its result. After every command the writer publishes an immutable
+    snapshot of the board (see board_snapshot), the board history, the
+    board list, the board graph, the compatible ports and reopened boards
+    are read from the snapshots without waiting for the writer.
+
     Attributes:
     -----------
-    opened_scheme (Optional[str]): Currently opened scheme
+    opened_scheme (Optional[Path]): Scheme of the active board
         (None if no scheme is opened)
     initialized (bool): Initialization flag for the Singleton pattern
-    devices (list): List of devices on the current board
-    connections (list): List of connections on the current board
+    sessions (OrderedDict): Open boards keyed by the scheme location,
+        least recently used first
+    session (Optional[BoardSession]): The active board
+    max_materialized_boards (int): Number of boards which keep their
+        constructed devices
+    max_materialized_devices (Optional[int]): Number of constructed devices
+        kept over all boards (None for no limit)
+    devices (dict): Devices on the current board keyed by their uuid
+    connections (dict): Signals (connections) on the current board keyed
+        by their connection_key
+    port_connections (dict): Connection keys by (device uuid, port label)
+    adjacency (dict): Connection keys of every device keyed by its uuid
+    writer (BoardWriter): Runs the board commands one after another
+    locations (dict): Locations of the devices keyed by their uuid
+    journal (Optional[SchemeJournal]): Edit journal of the opened scheme
+    pending_edits (list[dict]): Journal entries of the edits since the
+        last save
+    compaction_threshold (int): Number of journaled edits after which the
+        journal is compacted into the scheme
+    lightweight (bool): Open schemes with device records instead of
+        constructing the devices (default)
+    graph (BoardGraph): Components, topological order and cycles of the
+        board, updated with every edit
+    history (BoardHistory): Versions of the board since it was opened
 
     Methods:
     --------
-    open_scheme(board:str): Opens a new scheme
+    open_scheme(board:str, lightweight:Optional[bool], reload:bool): Opens
+        a scheme or switches to it if it is open
+    open_scheme_chunks(board:str, chunk_size:int,
+                       lightweight:Optional[bool], reload:bool): Opens a
+        scheme incrementally, yielding the messages in chunks
+    use_board(board:str): Selects the board for the commands and the
+        snapshots of the calling thread within the context
+    snapshot(board:Optional[str]): Gets the last published state of a board
+    close_board(board:str, save:bool): Closes an open board
+    list_boards(): Gets the open boards
+    materialize_device(uuid:str): Replaces the record of the device with
+        the constructed device
     save_scheme(request:SaveBoardRequest): Saves the scheme, gets
         positions from the given request
+    compact_scheme(): Writes the whole scheme and clears its journal
+    scheme_descriptor(): Builds the scheme descriptor of the current board
     serialize_properties(properties:dict): Serialize the properties of a
         device before saving them
     deserialize_properties (properties:dict,
@@ -48,12 +157,21 @@ class BoardManager:
     add_device(device_msg:Device): Creates a new device on the current board
     connect_devices(connect_request:ConnectDevicesRequest): Creates
         a connection between two ports on two devices
+    get_compatible_ports(request:GetCompatiblePortsRequest): Finds the
+        ports on the board and in the catalog compatible with a port
     disconnect_devices(disconnect_request:DisconnectDevicesRequest): Removes
         specified connection between two devices
-    remove_device(device:Device): Removes specified device from the
-        current board
+    remove_device(device:Device): Removes specified device (and its
+        connections) from the current board
     update_device_properties(device:Device): Updates the properties of an
         existing device on the board
+    apply_board_edits(edits:list[BoardEdit]): Applies the edits atomically,
+        reverting the applied edits on the first failure
+    get_board_graph(): Gets the components, the topological order and the
+        cycle closing connections of the board
+    undo(): Reverts the board to the previous version
+    redo(): Reapplies the next (undone) version
+    revert_board(version:int): Reverts the board to the given version
 
     Examples:
     ---------
@@ -75,130 +193,621 @@ class BoardManager:
     def __init__(self):
         if not hasattr(self, "initialized"):
             LMH.register(LogicModuleEnum.BOARD_MANAGER, self)
-            self.opened_scheme = None
             self.initialized = True
-            self.devices = []
-            self.connections = []
+            self.sessions = OrderedDict()
+            self.session = None
+            self.writer = BoardWriter()
+            self._selected = threading.local()
+            self.compaction_threshold = 1000
+            self.lightweight = True
+            self.max_materialized_boards = 4
+            self.max_materialized_devices = None
+
+    devices = _session_attribute("devices")
+    connections = _session_attribute("connections")
+    port_connections = _session_attribute("port_connections")
+    adjacency = _session_attribute("adjacency")
+    locations = _session_attribute("locations")
+    journal = _session_attribute("journal")
+    pending_edits = _session_attribute("pending_edits")
+    graph = _session_attribute("graph")
+    history = _session_attribute("history")
+
+    @property
+    def opened_scheme(self):
+        if self.session is None:
+            return None
+        return self.session.opened_scheme
 
     def open_scheme(
             self,
-            board: str
+            board: str,
+            lightweight: bool | None = None,
+            reload: bool = False
             ) -> tuple[list[server_pb2.Device], list[server_pb2.Connection]]:
         """
-        Opens a given scheme, this means that old devices and connectinos are
-        erased and new ones are loaded. It returns the devices and connections
-        of the new scheme.
+        Opens a given scheme as the active board and returns its devices and
+        connections. Saved edits which were not compacted into the scheme
+        yet are replayed from its journal. If the scheme is already open,
+        the board is only activated and its current state is returned,
+        unless it is reloaded (unsaved edits are dropped then).
+
+        In the lightweight mode the devices and connections are kept as
+        records (see board_records), the devices are constructed once
+        they are needed. Simulations open the scheme with
+        lightweight=False.
 
         Parameters:
         -----------
         board (str): Relative location of the scheme within a project
+        lightweight (Optional[bool]): Keep records instead of devices,
+            defaults to the `lightweight` attribute
+        reload (bool): Load the scheme again if it is already open
 
         Returns:
         --------
         tuple[list[Device], list[Connection]]: tuple with lists of
         devices and connections respectively
         """
-        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
-        project_root = Path(VM.path).parents[0]
-        scheme_name = project_root / board
-        with open(scheme_name, "r") as f:
-            scheme = json.load(f)
-
-        self.opened_scheme = scheme_name
-        self.devices = []
-        self.connections = []
         devices_msg = []
         connections_msg = []
+        for devices, connections in self.open_scheme_chunks(
+                board, lightweight=lightweight, reload=reload):
+            devices_msg.extend(devices)
+            connections_msg.extend(connections)
+        return devices_msg, connections_msg
+
+    def open_scheme_chunks(
+            self,
+            board: str,
+            chunk_size: int = 0,
+            lightweight: bool | None = None,
+            reload: bool = False):
+        """
+        Opens a given scheme like `open_scheme`, but the scheme is parsed
+        incrementally and the messages are yielded in chunks as soon as the
+        writer has built the devices. All devices are yielded before the
+        connections.
+
+        Parameters:
+        -----------
+        board (str): Relative location of the scheme within a project
+        chunk_size (int): Maximal number of messages in a chunk, zero
+            yields everything in one chunk
+        lightweight (Optional[bool]): Keep records instead of devices,
+            defaults to the `lightweight` attribute
+        reload (bool): Load the scheme again if it is already open
+
+        Yields:
+        -------
+        tuple[list[Device], list[Connection]]: The next chunk of the
+            devices and connections
+        """
+        if lightweight is None:
+            lightweight = self.lightweight
+        chunks = queue.Queue()
+        opened = self.writer.submit(
+            self._open_command, board, chunk_size, lightweight, reload,
+            chunks.put)
+        for chunk in iter(chunks.get, None):
+            yield chunk
+        snapshot = opened.result()
+        if snapshot is not None:
+            yield from self._snapshot_chunks(snapshot, chunk_size)
+
+    def _open_command(
+            self,
+            board: str,
+            chunk_size: int,
+            lightweight: bool,
+            reload: bool,
+            emit) -> BoardSnapshot | None:
+        """
+        Opens the scheme on the writer, the loaded chunks are passed to
+        emit (None marks the end)
+
+        Returns:
+        --------
+        Optional[BoardSnapshot]: State of the board if it was open already,
+            its messages are built from the snapshot
+        """
+        try:
+            scheme_name = self._scheme_path(board)
+            session = self.sessions.get(scheme_name)
+            if session is not None and not reload:
+                self._activate(session)
+                if not lightweight:
+                    for uuid in list(self.devices):
+                        self.materialize_device(uuid)
+                self._publish()
+                return session.snapshot
+
+            self.sessions.pop(scheme_name, None)
+            session = BoardSession(board, scheme_name)
+            self.sessions[scheme_name] = session
+            self._activate(session)
+            try:
+                for chunk in self._load_chunks(
+                        session.journal, chunk_size, lightweight):
+                    emit(chunk)
+            except BaseException:
+                # A partially loaded board is not kept
+                self._close(session)
+                raise
+            # The loaded state is the base of the snapshots
+            session.dirty_devices.clear()
+            session.dirty_connections.clear()
+            session.snapshot = BoardSnapshot(
+                board, session.history.base_devices,
+                session.history.base_connections)
+            self._publish()
+            return None
+        finally:
+            emit(None)
+
+    def _load_chunks(
+            self,
+            journal,
+            chunk_size: int,
+            lightweight: bool):
+        """
+        Loads the scheme into the active (new) session, see
+        `open_scheme_chunks`
+        """
+        devices_msg = []
+        connections_msg = []
+        deferred = []
 
         QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        # Reload the changed modules once, the classes of all devices and
+        # connections are then resolved through the class cache
+        QM.module_registry.refresh()
+        class_messages = {}
 
-        for device_descriptor in scheme.get("devices", []):
-            device_class = QM.get_class(device_descriptor["device"])
-            device = device_class(uid=device_descriptor["uuid"])
-            if "properties" in device_descriptor:
-                device.properties = device_descriptor["properties"]
-            
-            self.devices.append(device)
-            device_msg = QM.create_device_message(device_class)
-            device_msg.uuid = device_descriptor["uuid"]
-            if "properties" in device_descriptor:
-                # Create a Struct object and populate it
-                properties = Struct()
-                properties.update(device_descriptor["properties"])
-                device.proterties = properties
-
-                # Assign it to the device_properties field
-                device_msg.device_properties.properties.CopyFrom(properties)
-                device_msg.location.extend(device_descriptor["location"])
-                devices_msg.append(device_msg)
-
-        for signal_descriptor in scheme.get("connections", []):
-            signal_class = QM.get_class(signal_descriptor["signal"])
-            signal = signal_class()
-            device1 = self.get_device(
-                signal_descriptor["conn"][0]["device_uuid"])
-            device2 = self.get_device(
-                signal_descriptor["conn"][1]["device_uuid"])
-            device1.register_signal(
-                signal=signal,
-                port_label=signal_descriptor["conn"][0]["port"]
-                )
-            device2.register_signal(
-                signal=signal,
-                port_label=signal_descriptor["conn"][1]["port"]
-                )
-            self.connections.append(signal)
-            connection_msg = server_pb2.Connection(
-                device_one_uuid=device1.ref.uuid,
-                device_two_uuid=device2.ref.uuid,
-                device_one_port_label=signal_descriptor["conn"][0]["port"],
-                device_two_port_label=signal_descriptor["conn"][1]["port"],
-                signal=signal_descriptor["signal"]
-                )
-            connections_msg.append(connection_msg)
-        return devices_msg, connections_msg
+        # Without chunks nothing is gained from parsing incrementally
+        for key, descriptor in journal.iter_load(
+                incremental=bool(chunk_size)):
+            if key == "devices":
+                device_msg = self._open_device(
+                    QM, descriptor, class_messages, lightweight)
+                if device_msg is not None:
+                    devices_msg.append(device_msg)
+            elif (descriptor["conn"][0]["device_uuid"] in self.devices and
+                    descriptor["conn"][1]["device_uuid"] in self.devices):
+                connections_msg.append(
+                    self._open_connection(QM, descriptor))
+            else:
+                # The devices of the connection were not read yet
+                deferred.append(descriptor)
+
+            if chunk_size and (
+                    len(devices_msg) + len(connections_msg) >= chunk_size):
+                yield devices_msg, connections_msg
+                devices_msg, connections_msg = [], []
+
+        for descriptor in deferred:
+            connections_msg.append(self._open_connection(QM, descriptor))
+            if chunk_size and len(connections_msg) >= chunk_size:
+                yield devices_msg, connections_msg
+                devices_msg, connections_msg = [], []
+        if devices_msg or connections_msg or not chunk_size:
+            yield devices_msg, connections_msg
+
+    def _scheme_path(self, board: str) -> Path:
+        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+        return Path(VM.path).parents[0] / board
+
+    def _snapshot_chunks(self, snapshot: BoardSnapshot, chunk_size: int):
+        """
+        Builds the messages of the board from its snapshot, the chunks are
+        yielded like in `open_scheme_chunks`
+        """
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        class_messages = {}
+        devices_msg = []
+        connections_msg = []
+        for descriptor in snapshot.devices():
+            if "properties" not in descriptor:
+                continue
+            devices_msg.append(self._device_message(
+                QM, QM.get_class(descriptor["device"]), descriptor,
+                class_messages))
+            if chunk_size and len(devices_msg) >= chunk_size:
+                yield devices_msg, connections_msg
+                devices_msg = []
+        for _, descriptor in snapshot.connections():
+            connections_msg.append(self._connection_message(descriptor))
+            if chunk_size and (
+                    len(devices_msg) + len(connections_msg) >= chunk_size):
+                yield devices_msg, connections_msg
+                devices_msg, connections_msg = [], []
+        if devices_msg or connections_msg or not chunk_size:
+            yield devices_msg, connections_msg
+
+    @contextmanager
+    def use_board(self, board: str = "", required: bool = True):
+        """
+        Selects the open board for the commands and snapshots of the calling
+        thread within the context, the writer makes the board active before
+        running a command
+
+        Parameters:
+        -----------
+        board (str): Relative location of the scheme as it was opened, the
+            active board is used if empty
+        required (bool): Raise if no board is open, otherwise the context
+            is entered without an active board
+
+        Raises:
+        -------
+        NoSchemeOpenedError
+            If the board is not open
+        """
+        if required:
+            self.snapshot(board)
+        previous = self._selected_board()
+        self._selected.board = board
+        try:
+            yield
+        finally:
+            self._selected.board = previous
+
+    def _selected_board(self) -> str:
+        return getattr(self._selected, "board", "")
+
+    def snapshot(self, board: str | None = None) -> BoardSnapshot:
+        """
+        Gets the last published state of the board, without waiting for the
+        writer
+
+        Parameters:
+        -----------
+        board (Optional[str]): Relative location of the scheme as it was
+            opened, defaults to the board selected with `use_board` (the
+            active board if none is selected)
+
+        Returns:
+        --------
+        BoardSnapshot: State of the board after the last command
+
+        Raises:
+        -------
+        NoSchemeOpenedError
+            If the board is not open
+        """
+        if board is None:
+            board = self._selected_board()
+        if board:
+            session = self.sessions.get(self._scheme_path(board))
+        else:
+            session = self.session
+        snapshot = None if session is None else session.snapshot
+        if snapshot is None:
+            raise NoSchemeOpenedError(
+                f"Board {board} is not open" if board
+                else "No Scheme is currently opened")
+        return snapshot
+
+    def _run_command(self, board: str, method, args: tuple, kwargs: dict):
+        """
+        Runs a board command on the writer and publishes the snapshot of the
+        board afterwards
+        """
+        if board:
+            session = self.sessions.get(self._scheme_path(board))
+            if session is None or session.snapshot is None:
+                raise NoSchemeOpenedError(f"Board {board} is not open")
+            if session is not self.session:
+                self._activate(session)
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._publish()
+
+    def _publish(self, session: BoardSession | None = None) -> None:
+        """
+        Publishes a new snapshot of the (active) board, only the devices and
+        connections changed since the last snapshot are described again
+        """
+        if session is None:
+            session = self.session
+        if session is None or session.snapshot is None:
+            return
+        snapshot = session.snapshot
+        devices = snapshot.changed_devices
+        connections = snapshot.changed_connections
+        # Only the active board has unpublished changes, its descriptors
+        # are built with the locations and journal of the active board
+        if session.dirty_devices or session.dirty_connections:
+            for uuid in session.dirty_devices:
+                device = session.devices.get(uuid)
+                devices = devices.set(uuid, REMOVED if device is None
+                                      else self._device_descriptor(device))
+            for key in session.dirty_connections:
+                signal = session.connections.get(key)
+                connections = connections.set(
+                    key, REMOVED if signal is None
+                    else self._connection_descriptor(signal))
+            session.dirty_devices.clear()
+            session.dirty_connections.clear()
+        history = session.history
+        graph_revision = session.graph.revision
+        session.snapshot = BoardSnapshot(
+            session.board, history.base_devices, history.base_connections,
+            devices, connections,
+            version=history.version,
+            latest_version=history.latest,
+            pending_edits=len(session.pending_edits),
+            materialized=session.materialized,
+            device_count=len(session.devices),
+            connection_count=len(session.connections),
+            graph_revision=graph_revision,
+            graph=(snapshot.graph if snapshot.graph_revision == graph_revision
+                   else None))
+
+    def close_board(self, board: str = "", save: bool = False) -> None:
+        """
+        Closes the open board, the most recently used of the remaining
+        boards becomes active if the active board was closed
+
+        Parameters:
+        -----------
+        board (str): Relative location of the scheme as it was opened, the
+            active board is closed if empty
+        save (bool): Journal the unsaved edits before closing
+        """
+        with self.use_board(board):
+            self._close_active(save)
+
+    @_board_command
+    def _close_active(self, save: bool) -> None:
+        if save:
+            self.save_scheme(server_pb2.SaveBoardRequest())
+        self._close(self.session)
+
+    def list_boards(self) -> list[tuple[str, int, int, int, int, bool]]:
+        """
+        Gets the open boards from their snapshots, least recently used first
+
+        Returns:
+        --------
+        list[tuple[str, int, int, int, int, bool]]: (board, devices,
+            connections, constructed devices, unsaved edits, active) of
+            every open board
+        """
+        active = self.session
+        boards = []
+        for session in tuple(self.sessions.values()):
+            snapshot = session.snapshot
+            if snapshot is not None:
+                boards.append((
+                    snapshot.board, snapshot.device_count,
+                    snapshot.connection_count, snapshot.materialized,
+                    snapshot.pending_edits, session is active))
+        return boards
+
+    def _activate(self, session: BoardSession) -> None:
+        if self.session is not None and self.session is not session:
+            self._publish()
+        self.session = session
+        self.sessions.move_to_end(session.opened_scheme)
+        self._evict()
 
+    def _close(self, session: BoardSession) -> None:
+        if self.sessions.get(session.opened_scheme) is session:
+            del self.sessions[session.opened_scheme]
+        if self.session is session:
+            self.session = (next(reversed(self.sessions.values()))
+                            if self.sessions else None)
+
+    def _evict(self) -> None:
+        """
+        Replaces the constructed devices of the least recently used boards
+        with records, until the limits on the constructed boards and
+        devices hold. The active board is never evicted.
+        """
+        constructed = [s for s in self.sessions.values() if s.materialized]
+        boards = len(constructed)
+        devices = sum(s.materialized for s in constructed)
+        for session in constructed:
+            if boards <= self.max_materialized_boards and (
+                    self.max_materialized_devices is None or
+                    devices <= self.max_materialized_devices):
+                break
+            if session is self.session:
+                continue
+            devices -= session.materialized
+            boards -= 1
+            released = session.dematerialize(
+                lambda properties, journal=session.journal:
+                    self._properties_descriptor(properties, journal))
+            self._publish(session)
+            print(f"Released {released} devices of {session.board}")
+
+    def _open_device(
+            self,
+            QM,
+            device_descriptor: dict,
+            class_messages: dict,
+            lightweight: bool) -> server_pb2.Device | None:
+        """
+        Builds the device (or its record) of the opened scheme and its
+        message, the message only needs the class catalog entry
+        """
+        device_class = QM.get_class(device_descriptor["device"])
+        device = DeviceRecord(
+            device_class, device_descriptor["device"],
+            device_descriptor["uuid"], device_descriptor.get("properties"))
+        if not lightweight:
+            device = device.materialize()
+
+        self._add_device(device)
+        self.locations[device_uuid(device)] = list(
+            device_descriptor.get("location", []))
+        self.history.base_devices[device_uuid(device)] = device_descriptor
+        if "properties" in device_descriptor:
+            return self._device_message(
+                QM, device_class, device_descriptor, class_messages)
+        return None
+
+    def _device_message(
+            self,
+            QM,
+            device_class: type,
+            device_descriptor: dict,
+            class_messages: dict) -> server_pb2.Device:
+        """
+        Builds the message of a board device from its descriptor
+        """
+        # The catalog message is created once per class and copied
+        if device_class not in class_messages:
+            class_messages[device_class] = QM.create_device_message(
+                device_class)
+        device_msg = server_pb2.Device()
+        device_msg.CopyFrom(class_messages[device_class])
+        device_msg.uuid = device_descriptor["uuid"]
+        device_msg.device_properties.properties.update(
+            device_descriptor["properties"] or {})
+        device_msg.location.extend(device_descriptor.get("location", []))
+        return device_msg
+
+    def _open_connection(
+            self,
+            QM,
+            signal_descriptor: dict) -> server_pb2.Connection:
+        """
+        Builds the connection of the opened scheme and its message
+        """
+        signal_class = QM.get_class(signal_descriptor["signal"])
+        device1 = self.get_device(
+            signal_descriptor["conn"][0]["device_uuid"])
+        device2 = self.get_device(
+            signal_descriptor["conn"][1]["device_uuid"])
+        key = self._add_connection(
+            signal_class,
+            device1, signal_descriptor["conn"][0]["port"],
+            device2, signal_descriptor["conn"][1]["port"])
+        self.history.base_connections[key] = signal_descriptor
+        return server_pb2.Connection(
+            device_one_uuid=signal_descriptor["conn"][0]["device_uuid"],
+            device_two_uuid=signal_descriptor["conn"][1]["device_uuid"],
+            device_one_port_label=signal_descriptor["conn"][0]["port"],
+            device_two_port_label=signal_descriptor["conn"][1]["port"],
+            signal=signal_descriptor["signal"]
+            )
+
+    @_board_command
     def save_scheme(self, request: server_pb2.SaveBoardRequest) -> None:
         """
         Saves the currently opened scheme, the positions of the
         devices on the board are compiled from the request.
 
+        Only the edits since the last save (and the changed positions) are
+        appended to the journal of the scheme. Once the journal grows
+        beyond the compaction threshold, it is compacted into the scheme.
+
         Parameters:
         -----------
         request (SaveBoardRequest): the request for the saving
         of the board, the request includes the positions of the
         devices
         """
+        moved = {}
+        for device in request.devices:
+            location = list(device.location)
+            if (device.uuid in self.devices and
+                    self.locations.get(device.uuid) != location):
+                self.locations[device.uuid] = location
+                moved[device.uuid] = location
+                self.session.dirty_devices.add(device.uuid)
+        if moved:
+            self.pending_edits.append({"op": "move", "locations": moved})
+
+        self.journal.append(self.pending_edits)
+        self.pending_edits = []
+        if self.journal.entries >= self.compaction_threshold:
+            self.compact_scheme()
+
+    @_board_command
+    def compact_scheme(self) -> None:
+        """
+        Writes the whole scheme atomically and removes its journal
+        """
+        self.journal.compact(self.scheme_descriptor())
+
+    @_board_command
+    def scheme_descriptor(self) -> dict:
+        """
+        Builds the descriptor (as stored in the scheme file) of the current
+        board
+
+        Returns:
+        --------
+        dict: Scheme descriptor with the devices and connections
+        """
         json_file_descriptor = {
             "devices": [],
             "connections": []
         }
-        for device in request.devices:
-            dev_instance = self.get_device(device.uuid)
-            dev_descriptor = {
-                "device": device.module_class,
-                "location": list(device.location),
-                "uuid": device.uuid,
-                "properties": self.serialize_properties(
-                    dev_instance.properties),
-                }
-            json_file_descriptor["devices"].append(dev_descriptor)
+        for uuid, dev_instance in self.devices.items():
+            json_file_descriptor["devices"].append(
+                self._device_descriptor(dev_instance))
+
+        for signal in self.connections.values():
+            json_file_descriptor["connections"].append(
+                self._connection_descriptor(signal))
+        return json_file_descriptor
 
-        for signal in self.connections:
-            signal_descriptor = {
-                "signal": f"{type(signal).__module__}.{type(signal).__name__}",
-                "conn": []
+    def _device_descriptor(self, dev_instance) -> dict:
+        if isinstance(dev_instance, DeviceRecord):
+            # The record still holds the properties as stored
+            return {
+                "device": dev_instance.module_class,
+                "location": self.locations.get(dev_instance.uuid, []),
+                "uuid": dev_instance.uuid,
+                "properties": dev_instance.properties or {},
                 }
-            for port in signal.ports:
-                port_descriptor = {
-                    "device_uuid": port.device.ref.uuid,
-                    "port": port.label
-                    }
-                signal_descriptor["conn"].append(port_descriptor)
-            json_file_descriptor["connections"].append(signal_descriptor)
+        return {
+            "device": (f"{type(dev_instance).__module__}."
+                       f"{type(dev_instance).__name__}"),
+            "location": self.locations.get(dev_instance.ref.uuid, []),
+            "uuid": dev_instance.ref.uuid,
+            "properties": self._properties_descriptor(
+                dev_instance.properties),
+            }
 
-        with open(self.opened_scheme, "w") as json_file:
-            json.dump(json_file_descriptor, json_file, indent=2)
+    def _properties_descriptor(
+            self,
+            properties: dict,
+            journal=None) -> dict:
+        """
+        Serializes the properties for the scheme (of the active board by
+        default), the binary scheme format keeps the types of the values
+        """
+        if journal is None and self.session is not None:
+            journal = self.journal
+        if journal is not None and journal.format == BINARY_FORMAT:
+            return plain_properties(properties)
+        return self.serialize_properties(properties)
+
+    def _connection_descriptor(self, signal) -> dict:
+        if isinstance(signal, ConnectionRecord):
+            return {
+                "signal": signal.module_class,
+                "conn": [{"device_uuid": uuid, "port": port}
+                         for uuid, port in signal.conn]
+                }
+        signal_descriptor = {
+            "signal": f"{type(signal).__module__}.{type(signal).__name__}",
+            "conn": []
+            }
+        for port in signal.ports:
+            port_descriptor = {
+                "device_uuid": port.device.ref.uuid,
+                "port": port.label
+                }
+            signal_descriptor["conn"].append(port_descriptor)
+        return signal_descriptor
 
     def serialize_properties(self, properties: dict) -> dict:
         """
@@ -280,12 +889,165 @@ class BoardManager:
         -------
         Exception: if device is not found
         """
-        filtered_devices = [d for d in self.devices if d.ref.uuid == uuid]
-        if len(filtered_devices) == 1:
-            return filtered_devices[0]
-        else:
+        device = self.devices.get(uuid)
+        if device is None:
             raise Exception("Device Not found on the current board")
+        return device
+
+    def _add_device(self, device) -> None:
+        """
+        Adds the device instance (or record) to the board indices
+        """
+        uuid = device_uuid(device)
+        if uuid in self.devices:
+            raise Exception(f"Device {uuid} is already on the current board")
+        self.devices[uuid] = device
+        self.adjacency[uuid] = set()
+        self.graph.add_node(uuid)
+        self.session.dirty_devices.add(uuid)
+        if not isinstance(device, DeviceRecord):
+            self.session.materialized += 1
+
+    def _discard_device(self, uuid: str) -> None:
+        """
+        Removes the device from the board indices, its connections must be
+        removed before
+        """
+        device = self.devices.pop(uuid)
+        if not isinstance(device, DeviceRecord):
+            self.session.materialized -= 1
+        self.adjacency.pop(uuid, None)
+        self.graph.remove_node(uuid)
+        self.locations.pop(uuid, None)
+        self.session.dirty_devices.add(uuid)
+
+    def _add_connection(
+            self,
+            signal_class: type,
+            device1, port_label_1: str,
+            device2, port_label_2: str) -> tuple:
+        """
+        Creates the signal, registers it with both ports and adds the
+        connection to the board indices. If one of the devices is a record
+        a connection record is stored instead of the signal.
+
+        Returns:
+        --------
+        tuple: The connection key
+
+        Raises:
+        -------
+        DeviceConnectionError
+            If one of the ports is already connected
+        """
+        uuid1, uuid2 = device_uuid(device1), device_uuid(device2)
+        for endpoint in ((uuid1, port_label_1), (uuid2, port_label_2)):
+            if endpoint in self.port_connections:
+                raise DeviceConnectionError(
+                    f"Port {endpoint[1]} of device {endpoint[0]} "
+                    "is already connected")
+        if (isinstance(device1, DeviceRecord) or
+                isinstance(device2, DeviceRecord)):
+            signal = ConnectionRecord(
+                signal_class, [(uuid1, port_label_1), (uuid2, port_label_2)])
+        else:
+            signal = signal_class()
+            device1.register_signal(signal=signal, port_label=port_label_1)
+            device2.register_signal(signal=signal, port_label=port_label_2)
+        key = connection_key(uuid1, port_label_1, uuid2, port_label_2)
+        self.connections[key] = signal
+        self.port_connections[(uuid1, port_label_1)] = key
+        self.port_connections[(uuid2, port_label_2)] = key
+        self.adjacency[uuid1].add(key)
+        self.adjacency[uuid2].add(key)
+        self.graph.add_edge(key, *self._signal_flow(key))
+        self.session.dirty_connections.add(key)
+        return key
+
+    def _signal_flow(self, key: tuple) -> tuple[str, str]:
+        """
+        Gets the (source, target) device uuids of the connection, the
+        signal flows from the output to the input port
+        """
+        (uuid1, port_label_1), (uuid2, port_label_2) = key
+        if self.devices[uuid1].ports[port_label_1].direction == "input":
+            return uuid2, uuid1
+        return uuid1, uuid2
+
+    def _remove_connection(self, key: tuple) -> None:
+        """
+        Removes the connection from the ports and the board indices
+        """
+        signal = self.connections.pop(key)
+        if not isinstance(signal, ConnectionRecord):
+            for p in signal.ports:
+                p.signal = None
+        for uuid, port_label in key:
+            self.port_connections.pop((uuid, port_label), None)
+            self.adjacency.get(uuid, set()).discard(key)
+        self.graph.remove_edge(key)
+        self.session.dirty_connections.add(key)
+
+    def _restore_connection(self, key: tuple, signal) -> None:
+        """
+        Restores a removed connection, the signal still references the
+        ports it was registered with
+        """
+        if not isinstance(signal, ConnectionRecord):
+            for p in signal.ports:
+                p.signal = signal
+        self.connections[key] = signal
+        for uuid, port_label in key:
+            self.port_connections[(uuid, port_label)] = key
+            self.adjacency[uuid].add(key)
+        self.graph.add_edge(key, *self._signal_flow(key))
+        self.session.dirty_connections.add(key)
+        # Both devices might have been constructed in the meantime
+        self._materialize_connection(key)
+
+    @_board_command
+    def materialize_device(self, uuid: str) -> object:
+        """
+        Constructs the device in place of its record, the connections to
+        constructed devices get their signals registered. Constructed
+        devices are returned as they are.
 
+        Parameters:
+        -----------
+        uuid (str): UUID of the device
+
+        Returns:
+        --------
+        device: The device instance
+        """
+        device = self.get_device(uuid)
+        if not isinstance(device, DeviceRecord):
+            return device
+        device = device.materialize()
+        self.devices[uuid] = device
+        self.session.materialized += 1
+        for key in self.adjacency[uuid]:
+            self._materialize_connection(key)
+        self._evict()
+        return device
+
+    def _materialize_connection(self, key: tuple) -> None:
+        """
+        Replaces the connection record with the signal once both of its
+        devices are constructed
+        """
+        record = self.connections[key]
+        if not isinstance(record, ConnectionRecord):
+            return
+        ends = [(self.devices[uuid], port) for uuid, port in record.conn]
+        if any(isinstance(device, DeviceRecord) for device, _ in ends):
+            return
+        signal = record.signal_class()
+        for device, port in ends:
+            device.register_signal(signal=signal, port_label=port)
+        self.connections[key] = signal
+
+    @_board_command
     def add_device(self, device_msg: server_pb2.Device) -> str:
         """
         Adds a device to a currently opened board, raises an
@@ -310,9 +1072,16 @@ class BoardManager:
         device_class = QM.get_class(device_msg.module_class)
         device = device_class(uid=device_msg.uuid)
         uuid = device.ref.uuid
-        self.devices.append(device)
+        self._add_device(device)
+        self.locations[uuid] = list(device_msg.location)
+        self.pending_edits.append({
+            "op": "add_device",
+            "device": self._device_descriptor(device)})
+        self._stage_device(uuid)
+        self.history.commit(f"Add {device_msg.module_class}")
         return str(uuid)
 
+    @_board_command
     def connect_devices(
             self,
             connect_request: server_pb2.ConnectDevicesRequest) -> None:
@@ -324,6 +1093,10 @@ class BoardManager:
         -----------
         connect_request (ConnectDevicesRequest): Request defining the desired
             connection.
+
+        Returns:
+        --------
+        tuple: The key of the new connection
         """
         dev1 = self.get_device(connect_request.device_uuid_1)
         dev2 = self.get_device(connect_request.device_uuid_2)
@@ -333,23 +1106,108 @@ class BoardManager:
 
         sig_cls_1 = dev1.ports[connect_request.device_port_1].signal_type
         sig_cls_2 = dev2.ports[connect_request.device_port_2].signal_type
-        sig_cls = None
-        if issubclass(sig_cls_1, sig_cls_2):
-            sig_cls = sig_cls_1
-        elif issubclass(sig_cls_2, sig_cls_1):
-            sig_cls = sig_cls_2
-        else:
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        sig_cls = QM.get_signal_index().common_signal(sig_cls_1, sig_cls_2)
+        if sig_cls is None:
             raise Exception("Signals Hierarchies Diverge")
 
-        sig = sig_cls()
-        dev1.register_signal(
-            signal=sig,
-            port_label=connect_request.device_port_1)
-        dev2.register_signal(
-            signal=sig,
-            port_label=connect_request.device_port_2)
-        self.connections.append(sig)
+        key = self._add_connection(
+            sig_cls,
+            dev1, connect_request.device_port_1,
+            dev2, connect_request.device_port_2)
+        self.pending_edits.append({
+            "op": "connect",
+            "connection": self._connection_descriptor(
+                self.connections[key])})
+        self._stage_connection(key)
+        self.history.commit("Connect devices")
+        return key
+
+    def get_compatible_ports(
+            self,
+            request: server_pb2.GetCompatiblePortsRequest
+            ) -> tuple[list[server_pb2.PortReference],
+                       list[server_pb2.PortReference]]:
+        """
+        Finds all ports which can be connected to the given port. The port
+        is either a port of a device on the board (device_uuid) or a port of
+        a catalog device (module_class). A compatible port must have the
+        opposite direction, a signal type from the same hierarchy and
+        (on the board) must not be connected yet. The board ports are read
+        from the snapshot of the board.
 
+        Parameters:
+        -----------
+        request (GetCompatiblePortsRequest): The queried port
+
+        Returns:
+        --------
+        tuple[list[PortReference], list[PortReference]]: Compatible ports
+            on the board and compatible ports of the catalog devices
+        """
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        signal_index = QM.get_signal_index(
+            populate=request.include_catalog)
+        try:
+            snapshot = self.snapshot()
+        except NoSchemeOpenedError:
+            if request.device_uuid:
+                raise
+            # Catalog ports can be queried without an open board
+            snapshot = None
+        if request.device_uuid:
+            descriptor = snapshot.device(request.device_uuid)
+            if descriptor is None:
+                raise Exception("Device Not found on the current board")
+            device_class = QM.get_class(descriptor["device"])
+        else:
+            device_class = QM.get_class(request.module_class)
+        port = device_class.ports[request.port_label]
+        signal = signal_index.add(port.signal_type)
+
+        board_ports = []
+        connected = set()
+        board_devices = ()
+        if snapshot is not None:
+            for key, _ in snapshot.connections():
+                connected.update(key)
+            board_devices = snapshot.devices()
+        for candidate in board_devices:
+            candidate_uuid = candidate["uuid"]
+            if candidate_uuid == request.device_uuid:
+                continue
+            candidate_class = QM.get_class(candidate["device"])
+            for candidate_port in candidate_class.ports.values():
+                if (candidate_port.direction == port.direction or
+                        (candidate_uuid, candidate_port.label) in connected):
+                    continue
+                candidate_signal = signal_index.add(candidate_port.signal_type)
+                if signal_index.compatible(signal, candidate_signal):
+                    board_ports.append(server_pb2.PortReference(
+                        device_uuid=candidate_uuid,
+                        module_class=candidate["device"],
+                        port=server_pb2.Port(
+                            label=candidate_port.label,
+                            direction=candidate_port.direction,
+                            signal_type=candidate_port.signal_type.__name__)
+                    ))
+
+        catalog_ports = []
+        if request.include_catalog:
+            devices, _ = QM.get_devices()
+            for catalog_device in devices:
+                for catalog_port in catalog_device.ports:
+                    if catalog_port.direction == port.direction:
+                        continue
+                    if signal_index.compatible_with_name(
+                            signal, catalog_port.signal_type):
+                        catalog_ports.append(server_pb2.PortReference(
+                            module_class=catalog_device.module_class,
+                            port=catalog_port
+                        ))
+        return board_ports, catalog_ports
+
+    @_board_command
     def disconnect_devices(
             self,
             disconnect_request: server_pb2.DisconnectDevicesRequest
@@ -375,38 +1233,383 @@ class BoardManager:
         if dev1 == dev2:
             raise DeviceConnectionError("Cannot disconnect from self!")
 
-        sig1 = dev1.ports[disconnect_request.device_port_1].signal
-        sig2 = dev2.ports[disconnect_request.device_port_2].signal
+        key1 = self.port_connections.get(
+            (disconnect_request.device_uuid_1, disconnect_request.device_port_1))
+        key2 = self.port_connections.get(
+            (disconnect_request.device_uuid_2, disconnect_request.device_port_2))
+        if key1 is None or key2 is None:
+            raise DeviceConnectionError("The ports are not connected")
 
-        if not sig1 == sig2:
+        if not key1 == key2:
             raise DeviceConnectionError(
                 "Multiple signals per port not yet supported!"
             )
 
-        for p in sig1.ports:
-            p.signal = None
-        self.connections.remove(sig1)
+        self._remove_connection(key1)
+        self.pending_edits.append({
+            "op": "disconnect",
+            "conn": [list(end) for end in key1]})
+        self._stage_connection(key1)
+        self.history.commit("Disconnect devices")
 
+    @_board_command
     def remove_device(self, device_uuid: str) -> None:
         """
-        Removes a device from the board
+        Removes a device from the board, together with all of its
+        connections
 
         Parameters:
         -----------
         device_uuid (str): the uuid of the device to be removed
         """
-        dev = self.get_device(device_uuid)
-        self.devices.remove(dev)
+        self.get_device(device_uuid)
+        for key in list(self.adjacency.get(device_uuid, ())):
+            self._remove_connection(key)
+            self._stage_connection(key)
+        self._discard_device(device_uuid)
+        self.pending_edits.append(
+            {"op": "remove_device", "uuid": device_uuid})
+        self._stage_device(device_uuid)
+        self.history.commit("Remove device")
+
+    def _stage_device(self, uuid: str) -> None:
+        """
+        Stages the current state of the device in the history
+        """
+        device = self.devices.get(uuid)
+        if device is None:
+            self.history.stage_device(uuid, None)
+            return
+        if isinstance(device, DeviceRecord):
+            properties = device.properties
+        else:
+            # The version keeps the properties as stored in the scheme (a
+            # copy, the device changes its properties in place), so records
+            # rebuilt by undo or revert can be journaled and saved
+            properties = self._properties_descriptor(device.properties)
+        self.history.stage_device(uuid, {
+            "device": module_class(device),
+            "location": list(self.locations.get(uuid, [])),
+            "uuid": uuid,
+            "properties": properties})
+
+    def _stage_connection(self, key: tuple) -> None:
+        """
+        Stages the current state of the connection in the history
+        """
+        signal = self.connections.get(key)
+        self.history.stage_connection(
+            key,
+            None if signal is None else self._connection_descriptor(signal))
+
+    def get_board_graph(
+            self
+            ) -> tuple[list[list[str]], list[str],
+                       list[server_pb2.Connection]]:
+        """
+        Gets the structure of the board graph, which is maintained with
+        every edit. The connections are directed from the output to the
+        input port. The structure is read from the snapshot, the writer
+        only describes it once after the graph changed.
+
+        Returns:
+        --------
+        tuple[list[list[str]], list[str], list[Connection]]: Device uuids
+            of every connected component, device uuids in topological order
+            and the connections which close a cycle (left out of the order)
+        """
+        graph = self.snapshot().graph
+        if graph is None:
+            graph = self._describe_graph()
+        return graph
+
+    @_board_command
+    def _describe_graph(
+            self
+            ) -> tuple[list[list[str]], list[str],
+                       list[server_pb2.Connection]]:
+        """
+        Describes the board graph, the description is kept in the snapshot
+        until the graph changes
+        """
+        snapshot = self.session.snapshot
+        if (snapshot.graph is not None and
+                snapshot.graph_revision == self.graph.revision):
+            return snapshot.graph
+        cycle_connections = [
+            self._connection_message(
+                self._connection_descriptor(self.connections[key]))
+            for key in self.graph.cycle_edges]
+        graph = (self.graph.components(),
+                 self.graph.topological_order(),
+                 cycle_connections)
+        if snapshot.graph_revision == self.graph.revision:
+            snapshot.graph = graph
+        return graph
+
+    @_board_command
+    def apply_board_edits(
+            self,
+            edits: list[server_pb2.BoardEdit]
+            ) -> tuple[list[server_pb2.BoardEditResult], int]:
+        """
+        Applies the edits in the given order as a single transaction. If an
+        edit fails, all of the edits applied before it are reverted in the
+        reverse order, so the board is left as it was before the call.
+
+        Parameters:
+        -----------
+        edits (list[BoardEdit]): The edits to apply
+
+        Returns:
+        --------
+        tuple[list[BoardEditResult], int]: Result of every attempted edit
+            and the index of the failed edit (-1 if all edits were applied)
+        """
+        results = []
+        undo = []
+        with self.history.batch(f"Apply {len(edits)} edits"):
+            pending_edits = len(self.pending_edits)
+            for i, edit in enumerate(edits):
+                try:
+                    result, revert = self._apply_board_edit(edit)
+                except Exception as e:
+                    results.append(server_pb2.BoardEditResult(
+                        status="failure", message=str(e)))
+                    for revert in reversed(undo):
+                        revert()
+                    # The reverted edits must not reach the journal or the
+                    # history
+                    del self.pending_edits[pending_edits:]
+                    self.history.discard()
+                    for applied in results[:-1]:
+                        applied.status = "rolled_back"
+                    return results, i
+                results.append(result)
+                undo.append(revert)
+        return results, -1
+
+    @_board_command
+    def undo(self) -> tuple:
+        """
+        Reverts the board to the previous version
+
+        Returns:
+        --------
+        tuple: See `revert_board`
+        """
+        if self.history.current == 0:
+            raise Exception("Nothing to undo")
+        return self.revert_board(self.history.version - 1)
+
+    @_board_command
+    def redo(self) -> tuple:
+        """
+        Reapplies the next version, which was undone before
+
+        Returns:
+        --------
+        tuple: See `revert_board`
+        """
+        if self.history.current == len(self.history.versions) - 1:
+            raise Exception("Nothing to redo")
+        return self.revert_board(self.history.version + 1)
+
+    @_board_command
+    def revert_board(
+            self,
+            version: int
+            ) -> tuple[int, list[server_pb2.Device], list[str],
+                       list[server_pb2.Connection],
+                       list[server_pb2.Connection]]:
+        """
+        Reverts the board to the given version of its history. Only the
+        devices and connections which differ between the current and the
+        given version are touched, the changes are journaled like edits.
+        Later versions are kept until a new edit is made.
+
+        Parameters:
+        -----------
+        version (int): Number of the version
+
+        Returns:
+        --------
+        tuple[int, list[Device], list[str], list[Connection],
+              list[Connection]]: The version, added or changed devices,
+            uuids of the removed devices, added connections and removed
+            connections
+        """
+        device_changes, connection_changes = self.history.checkout(
+            version)
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        devices_msg = []
+        removed_devices = []
+        connections_msg = []
+        removed_connections = []
+
+        for key, old, new in connection_changes:
+            if old is not None and key in self.connections:
+                self._remove_connection(key)
+                self.pending_edits.append({
+                    "op": "disconnect",
+                    "conn": [list(end) for end in key]})
+                removed_connections.append(
+                    self._connection_message(old))
+
+        for uuid, old, new in device_changes:
+            if new is not None or uuid not in self.devices:
+                continue
+            for key in list(self.adjacency.get(uuid, ())):
+                self._remove_connection(key)
+            self._discard_device(uuid)
+            self.pending_edits.append(
+                {"op": "remove_device", "uuid": uuid})
+            removed_devices.append(uuid)
+
+        class_messages = {}
+        for uuid, old, new in device_changes:
+            if new is None:
+                continue
+            device_class = QM.get_class(new["device"])
+            device = self.devices.get(uuid)
+            if device is None:
+                self._add_device(DeviceRecord(
+                    device_class, new["device"], uuid,
+                    new["properties"]))
+                self.locations[uuid] = list(new["location"])
+                self.pending_edits.append({
+                    "op": "add_device",
+                    "device": self._device_descriptor(
+                        self.devices[uuid])})
+            else:
+                if isinstance(device, DeviceRecord):
+                    device.properties = new["properties"]
+                elif new["properties"] is not None:
+                    device.properties = copy.deepcopy(new["properties"])
+                self.session.dirty_devices.add(uuid)
+                self.pending_edits.append({
+                    "op": "update_properties",
+                    "uuid": uuid,
+                    "properties": self._properties_descriptor(
+                        new["properties"] or {})})
+            devices_msg.append(self._device_message(
+                QM, device_class,
+                {**new, "properties": self._properties_descriptor(
+                    new["properties"] or {})},
+                class_messages))
+
+        for key, old, new in connection_changes:
+            if new is None:
+                continue
+            conn = new["conn"]
+            self._add_connection(
+                QM.get_class(new["signal"]),
+                self.devices[conn[0]["device_uuid"]], conn[0]["port"],
+                self.devices[conn[1]["device_uuid"]], conn[1]["port"])
+            self.pending_edits.append({"op": "connect", "connection": new})
+            connections_msg.append(self._connection_message(new))
+
+        return (version, devices_msg, removed_devices,
+                connections_msg, removed_connections)
+
+    def get_board_history(self) -> tuple[int, list[tuple[int, str]]]:
+        """
+        Gets the versions of the board from its snapshot
+
+        Returns:
+        --------
+        tuple[int, list[tuple[int, str]]]: The current version and the
+            (version, description) of all recorded versions
+        """
+        snapshot = self.snapshot()
+        return (snapshot.version,
+                [(v.number, v.description) for v in snapshot.versions()])
+
+    @staticmethod
+    def _connection_message(descriptor: dict) -> server_pb2.Connection:
+        return server_pb2.Connection(
+            device_one_uuid=descriptor["conn"][0]["device_uuid"],
+            device_two_uuid=descriptor["conn"][1]["device_uuid"],
+            device_one_port_label=descriptor["conn"][0]["port"],
+            device_two_port_label=descriptor["conn"][1]["port"],
+            signal=descriptor["signal"])
+
+    def _apply_board_edit(self, edit: server_pb2.BoardEdit) -> tuple:
+        """
+        Applies a single edit
+
+        Returns:
+        --------
+        tuple[BoardEditResult, callable]: Result of the edit and a callable
+            reverting the edit
+        """
+        kind = edit.WhichOneof("edit")
+        if kind == "add_device":
+            uuid = self.add_device(edit.add_device.device)
+            return (server_pb2.BoardEditResult(
+                        status="success", device_uuid=uuid),
+                    lambda: self.remove_device(uuid))
+
+        if kind == "remove_device":
+            uuid = edit.remove_device.device_uuid
+            device = self.get_device(uuid)
+            removed = [(key, self.connections[key])
+                       for key in self.adjacency.get(uuid, ())]
+            location = self.locations.get(uuid, [])
+            self.remove_device(uuid)
+
+            def revert():
+                self._add_device(device)
+                self.locations[uuid] = location
+                for key, signal in removed:
+                    self._restore_connection(key, signal)
+            return server_pb2.BoardEditResult(status="success"), revert
+
+        if kind == "connect_devices":
+            key = self.connect_devices(edit.connect_devices)
+            return (server_pb2.BoardEditResult(status="success"),
+                    lambda: self._remove_connection(key))
+
+        if kind == "disconnect_devices":
+            request = edit.disconnect_devices
+            key = self.port_connections.get(
+                (request.device_uuid_1, request.device_port_1))
+            signal = self.connections.get(key)
+            self.disconnect_devices(request)
+            return (server_pb2.BoardEditResult(status="success"),
+                    lambda: self._restore_connection(key, signal))
+
+        if kind == "update_device_properties":
+            device = edit.update_device_properties.device
+            dev = self.materialize_device(device.uuid)
+            old_properties = copy.deepcopy(dev.properties)
+            try:
+                self.update_device_properties(device)
+            except Exception:
+                dev.properties = old_properties
+                raise
+
+            def revert():
+                for key, item in old_properties.items():
+                    if isinstance(item, dict) and "value" in item:
+                        dev.set_property(key, item["value"])
+                dev.properties = old_properties
+                self.session.dirty_devices.add(device.uuid)
+            return server_pb2.BoardEditResult(status="success"), revert
+
+        raise ValueError("Empty board edit")
 
+    @_board_command
     def update_device_properties(self, device: server_pb2.Device) -> None:
         """
-        Updates the properties of the device
+        Updates the properties of the device, the device is constructed
+        first so it can validate the new values
 
         Parameters:
         -----------
         device (Device): A device message with new properties
         """
-        dev = self.get_device(device.uuid)
+        dev = self.materialize_device(device.uuid)
         new_properties = MessageToDict(device.device_properties.properties)
 
         for key, item in new_properties.items():
@@ -415,3 +1618,10 @@ class BoardManager:
                 if item['type'] == "int":
                     value = int(value)
                 dev.set_property(key, value)
+        self.session.dirty_devices.add(device.uuid)
+        self.pending_edits.append({
+            "op": "update_properties",
+            "uuid": device.uuid,
+            "properties": self._properties_descriptor(dev.properties)})
+        self._stage_device(device.uuid)
+        self.history.commit("Update properties")
@@ -0,0 +1,101 @@
+"""
+Lightweight records of the devices and connections on the board
+
+When a scheme is opened in the lightweight mode the devices and connections
+are kept as plain records, no qureed device or signal is constructed. The
+records hold everything needed to render and save the board (class, uuid,
+properties as stored in the scheme), the ports are read from the device
+class. BoardManager replaces a record with the real device once the device
+is needed (simulation, property edits).
+"""
+import copy
+
+
+def device_uuid(device) -> str:
+    """
+    Gets the uuid of a device instance or a device record
+    """
+    if isinstance(device, DeviceRecord):
+        return device.uuid
+    return device.ref.uuid
+
+
+def module_class(device) -> str:
+    """
+    Gets the module.class name of a device instance or a device record
+    """
+    if isinstance(device, DeviceRecord):
+        return device.module_class
+    return f"{type(device).__module__}.{type(device).__name__}"
+
+
+class DeviceRecord:
+    """
+    DeviceRecord stands in for a device which was not constructed yet
+
+    Attributes:
+    -----------
+    device_class (type): Class of the device
+    module_class (str): module.class name of the device class
+    uuid (str): UUID of the device
+    properties (Optional[dict]): Properties as stored in the scheme
+    """
+    __slots__ = ("device_class", "module_class", "uuid", "properties")
+
+    def __init__(
+            self,
+            device_class: type,
+            module_class: str,
+            uuid: str,
+            properties: dict | None = None):
+        self.device_class = device_class
+        self.module_class = module_class
+        self.uuid = uuid
+        self.properties = properties
+
+    @property
+    def ports(self) -> dict:
+        """
+        Ports declared on the device class
+        """
+        return self.device_class.ports
+
+    def materialize(self):
+        """
+        Constructs the device with the stored properties
+
+        Returns:
+        --------
+        GenericDevice: The device instance
+        """
+        device = self.device_class(uid=self.uuid)
+        if self.properties is not None:
+            # The device changes its properties in place, the stored ones
+            # are still referenced by the board history
+            device.properties = copy.deepcopy(self.properties)
+        return device
+
+
+class ConnectionRecord:
+    """
+    ConnectionRecord stands in for a signal between two ports, of which at
+    least one belongs to a device record
+
+    Attributes:
+    -----------
+    signal_class (type): Class of the signal
+    conn (list[tuple[str, str]]): Connected (device uuid, port label)
+        pairs in the order they were connected
+    """
+    __slots__ = ("signal_class", "conn")
+
+    def __init__(self, signal_class: type, conn: list[tuple[str, str]]):
+        self.signal_class = signal_class
+        self.conn = conn
+
+    @property
+    def module_class(self) -> str:
+        """
+        module.class name of the signal class
+        """
+        return f"{self.signal_class.__module__}.{self.signal_class.__name__}"
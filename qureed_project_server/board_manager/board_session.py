@@ -0,0 +1,99 @@
+"""
+State of a board opened by the BoardManager
+
+Every opened scheme gets its own session, so several boards (e.g. tabs in
+the GUI) stay open at the same time and switching between them doesn't
+reload the scheme. The constructed devices of inactive sessions can be
+evicted, the session then keeps the lightweight records (see
+board_records) until the devices are needed again.
+"""
+from pathlib import Path
+
+from qureed_project_server.board_manager.board_graph import BoardGraph
+from qureed_project_server.board_manager.board_history import BoardHistory
+from qureed_project_server.board_manager.board_records import (
+    ConnectionRecord, DeviceRecord, device_uuid, module_class
+)
+from qureed_project_server.board_manager.scheme_journal import SchemeJournal
+
+
+class BoardSession:
+    """
+    BoardSession holds the state of an opened board
+
+    Attributes:
+    -----------
+    board (str): Location of the scheme relative to the project, as given
+        when the board was opened
+    opened_scheme (Path): Location of the scheme
+    devices (dict): Devices (or device records) keyed by their uuid
+    connections (dict): Signals (or connection records) keyed by their
+        connection key
+    port_connections (dict): Connection keys by (device uuid, port label)
+    adjacency (dict): Connection keys of every device keyed by its uuid
+    locations (dict): Locations of the devices keyed by their uuid
+    journal (SchemeJournal): Edit journal of the scheme
+    pending_edits (list[dict]): Journal entries of the edits since the
+        last save
+    graph (BoardGraph): Components, topological order and cycles
+    history (BoardHistory): Versions of the board since it was opened
+    materialized (int): Number of constructed devices on the board
+    snapshot (Optional[BoardSnapshot]): Last published state of the board,
+        None while the scheme is being loaded
+    dirty_devices (set): UUIDs of the devices changed since the snapshot
+    dirty_connections (set): Keys of the connections changed since the
+        snapshot
+
+    Methods:
+    --------
+    dematerialize(describe_properties): Replaces the constructed devices
+        and signals with records
+    """
+
+    def __init__(self, board: str, scheme_path: Path):
+        self.board = board
+        self.opened_scheme = scheme_path
+        self.devices = {}
+        self.connections = {}
+        self.port_connections = {}
+        self.adjacency = {}
+        self.locations = {}
+        self.journal = SchemeJournal(scheme_path)
+        self.pending_edits = []
+        self.graph = BoardGraph()
+        self.history = BoardHistory()
+        self.materialized = 0
+        self.snapshot = None
+        self.dirty_devices = set()
+        self.dirty_connections = set()
+
+    def dematerialize(self, describe_properties) -> int:
+        """
+        Replaces the constructed devices with records holding their
+        properties and the signals with connection records, the devices
+        are constructed again once they are needed
+
+        Parameters:
+        -----------
+        describe_properties (Callable[[dict], dict]): Serializes the
+            properties of a device as they are stored in the scheme
+
+        Returns:
+        --------
+        int: Number of the released devices
+        """
+        released = 0
+        for uuid, device in self.devices.items():
+            if not isinstance(device, DeviceRecord):
+                self.devices[uuid] = DeviceRecord(
+                    type(device), module_class(device), uuid,
+                    describe_properties(device.properties))
+                released += 1
+        for key, signal in self.connections.items():
+            if not isinstance(signal, ConnectionRecord):
+                conn = [(device_uuid(port.device), port.label)
+                        for port in signal.ports]
+                self.connections[key] = ConnectionRecord(
+                    type(signal), conn if len(conn) == 2 else list(key))
+        self.materialized = 0
+        return released
@@ -0,0 +1,129 @@
+"""
+Immutable snapshots of the board state
+
+The board writer publishes a new snapshot after every command. A snapshot
+holds the descriptors (as stored in the scheme) of the devices and
+connections: the descriptors of the opened scheme (the base, which is not
+modified once the scheme is loaded) overlaid with persistent maps of the
+entries changed since. Publishing only updates the overlay with the entries
+touched by the command, readers keep using the snapshot they took while
+the writer moves on. The merged view is built once per snapshot, when it is
+first iterated. The board graph is described once per graph state, the
+description is passed on to the following snapshots until the graph
+changes.
+"""
+from qureed_project_server.utils.persistent_map import MISSING, PersistentMap
+from qureed_project_server.board_manager.board_history import REMOVED
+
+
+class BoardSnapshot:
+    """
+    A consistent state of a board
+
+    Attributes:
+    -----------
+    board (str): Relative location of the scheme
+    version (int): Current version of the board history
+    latest_version (Optional[BoardVersion]): Newest recorded version, it
+        links the older versions
+    pending_edits (int): Number of the edits since the last save
+    materialized (int): Number of constructed devices
+    device_count (int): Number of the devices
+    connection_count (int): Number of the connections
+    graph_revision (int): Revision of the board graph
+    graph (Optional[tuple]): Components, topological order and cycle
+        connections of the board graph, None until described
+    base_devices (dict): Device descriptors of the opened scheme
+    base_connections (dict): Connection descriptors of the opened scheme
+    changed_devices (PersistentMap): Changed device descriptors by uuid
+    changed_connections (PersistentMap): Changed connection descriptors by
+        connection key
+
+    Methods:
+    --------
+    versions(): Gets the recorded versions, oldest first
+    device(uuid): Gets the descriptor of a device
+    devices(): Iterates over the device descriptors
+    connections(): Iterates over the (key, descriptor) of the connections
+    """
+    __slots__ = ("board", "version", "latest_version", "pending_edits",
+                 "materialized", "device_count", "connection_count",
+                 "graph_revision", "graph",
+                 "base_devices", "base_connections",
+                 "changed_devices", "changed_connections",
+                 "_devices", "_connections")
+
+    def __init__(
+            self,
+            board: str,
+            base_devices: dict,
+            base_connections: dict,
+            changed_devices: PersistentMap = PersistentMap(),
+            changed_connections: PersistentMap = PersistentMap(),
+            version: int = 0,
+            latest_version=None,
+            pending_edits: int = 0,
+            materialized: int = 0,
+            device_count: int = 0,
+            connection_count: int = 0,
+            graph_revision: int = 0,
+            graph: tuple | None = None):
+        self.board = board
+        self.base_devices = base_devices
+        self.base_connections = base_connections
+        self.changed_devices = changed_devices
+        self.changed_connections = changed_connections
+        self.version = version
+        self.latest_version = latest_version
+        self.pending_edits = pending_edits
+        self.materialized = materialized
+        self.device_count = device_count
+        self.connection_count = connection_count
+        self.graph_revision = graph_revision
+        self.graph = graph
+        self._devices = None
+        self._connections = None
+
+    def versions(self) -> list:
+        """
+        Gets the recorded versions of the board, oldest first
+        """
+        if self.latest_version is None:
+            return []
+        return self.latest_version.lineage()
+
+    def device(self, uuid: str) -> dict | None:
+        """
+        Gets the descriptor of the device, None if it is not on the board
+        """
+        entry = self.changed_devices.get(uuid, MISSING)
+        if entry is MISSING:
+            return self.base_devices.get(uuid)
+        return None if entry is REMOVED else entry
+
+    def devices(self):
+        """
+        Iterates over the device descriptors
+        """
+        if self._devices is None:
+            self._devices = _merge(self.base_devices, self.changed_devices)
+        yield from self._devices.values()
+
+    def connections(self):
+        """
+        Iterates over the (connection key, descriptor) of the connections
+        """
+        if self._connections is None:
+            self._connections = _merge(
+                self.base_connections, self.changed_connections)
+        yield from self._connections.items()
+
+
+def _merge(base: dict, changed: PersistentMap) -> dict:
+    merged = dict(base)
+    for key, entry in changed.items():
+        if entry is REMOVED:
+            merged.pop(key, None)
+        else:
+            merged[key] = entry
+    return merged
@@ -0,0 +1,84 @@
+"""
+Single writer of the board state
+
+All mutations of the boards run as commands on one writer thread, in the
+order they were submitted. The gRPC server handles the board RPCs on a pool
+of threads, the writer keeps their edits from interleaving without a lock
+held by the RPC threads. Reads are served from the snapshots the writer
+publishes after every command (see board_snapshot).
+"""
+import threading
+import queue
+from concurrent.futures import Future
+
+
+class BoardWriter:
+    """
+    BoardWriter runs the submitted commands one after another on its
+    thread, the thread is started with the first command
+
+    Attributes:
+    -----------
+    commands (Queue): Submitted (future, command, args, kwargs) tuples
+    thread (Optional[Thread]): The writer thread
+
+    Methods:
+    --------
+    submit(command, *args, **kwargs): Queues the command, returns its future
+    call(command, *args, **kwargs): Runs the command and waits for its result
+    is_writer(): Checks if the calling thread is the writer thread
+    """
+
+    def __init__(self, name: str = "board-writer"):
+        self.name = name
+        self.commands = queue.Queue()
+        self.thread = None
+        self._start_lock = threading.Lock()
+
+    def is_writer(self) -> bool:
+        return threading.current_thread() is self.thread
+
+    def submit(self, command, *args, **kwargs) -> Future:
+        """
+        Queues the command, commands submitted by the writer thread itself
+        run immediately (they are part of the running command)
+
+        Returns:
+        --------
+        Future: Result (or exception) of the command
+        """
+        future = Future()
+        if self.is_writer():
+            self._run(future, command, args, kwargs)
+            return future
+        if self.thread is None:
+            with self._start_lock:
+                if self.thread is None:
+                    self.thread = threading.Thread(
+                        target=self._loop, name=self.name, daemon=True)
+                    self.thread.start()
+        self.commands.put((future, command, args, kwargs))
+        return future
+
+    def call(self, command, *args, **kwargs):
+        """
+        Runs the command on the writer thread and returns its result, the
+        exceptions of the command are raised in the calling thread
+        """
+        return self.submit(command, *args, **kwargs).result()
+
+    def _loop(self) -> None:
+        while True:
+            future, command, args, kwargs = self.commands.get()
+            self._run(future, command, args, kwargs)
+
+    @staticmethod
+    def _run(future: Future, command, args: tuple, kwargs: dict) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = command(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
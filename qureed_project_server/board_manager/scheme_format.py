@@ -0,0 +1,242 @@
+"""
+Reading and writing of the scheme files
+
+Schemes are stored either as JSON (the default) or in the binary format, a
+serialized `SchemeFile` message preceded by the MAGIC header. The format is
+detected from the content of the file, so both formats can be opened
+through the same path. The binary format stores the module.class names
+once per scheme and the property values with their types instead of their
+string representation.
+
+Usage (conversion):
+    qureed_scheme main.json main.qrs
+    qureed_scheme main.qrs main.json
+    qureed_scheme board.scheme converted.scheme --to binary
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+
+from qureed_project_server import server_pb2
+
+MAGIC = b"QUREED-SCHEME\x00\x01"
+JSON_FORMAT = "json"
+BINARY_FORMAT = "binary"
+BINARY_SUFFIX = ".qrs"
+
+# Types of the property values which can be recovered from their string
+# representation when a JSON scheme is converted
+_DECLARED_TYPES = {
+    "int": int,
+    "float": float,
+    "bool": lambda value: value.strip().lower() == "true",
+}
+
+
+def detect_format(path: Path) -> str:
+    """
+    Detects the format of the scheme file from its header
+    """
+    with open(path, "rb") as f:
+        header = f.read(len(MAGIC))
+    return BINARY_FORMAT if header == MAGIC else JSON_FORMAT
+
+
+def write_atomically(path: Path, content: str | bytes) -> None:
+    """
+    Writes the file through a temporary file which replaces the original,
+    an interrupted write leaves the original file untouched
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb" if isinstance(content, bytes) else "w") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def plain_properties(value):
+    """
+    Converts the properties into JSON compatible values, unlike
+    `BoardManager.serialize_properties` the types of the basic values are
+    kept. Types are stored by their name, unknown objects as strings.
+    """
+    if isinstance(value, dict):
+        return {str(k): plain_properties(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [plain_properties(v) for v in value]
+    if isinstance(value, type):
+        return value.__name__
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def encode_properties(properties: dict, coerce: bool = False) -> bytes:
+    """
+    Encodes the properties as compact JSON which keeps the value types, with
+    coerce the string values of the properties with a declared type
+    (e.g. {"type": "int", "value": "1"}) are converted to that type
+    """
+    properties = plain_properties(properties)
+    if coerce:
+        properties = {
+            key: _coerce_property(value) if isinstance(value, dict) else value
+            for key, value in properties.items()
+        }
+    return json.dumps(properties, separators=(",", ":")).encode()
+
+
+def _coerce_property(prop: dict) -> dict:
+    convert = _DECLARED_TYPES.get(prop.get("type"))
+    if convert is None or not isinstance(prop.get("value"), str):
+        return prop
+    try:
+        return {**prop, "value": convert(prop["value"])}
+    except ValueError:
+        return prop
+
+
+def scheme_to_message(
+        scheme: dict,
+        coerce: bool = False) -> server_pb2.SchemeFile:
+    """
+    Converts the scheme descriptor into the SchemeFile message
+
+    Parameters:
+    -----------
+    scheme (dict): Scheme descriptor (devices, connections, revision)
+    coerce (bool): Convert the stringified property values of a JSON
+        scheme to their declared type
+    """
+    device_classes = {}
+    signal_classes = {}
+    devices = [
+        server_pb2.SchemeDevice(
+            device_class=device_classes.setdefault(
+                device["device"], len(device_classes)),
+            uuid=device["uuid"],
+            location=device.get("location", []),
+            properties=encode_properties(
+                device.get("properties", {}), coerce))
+        for device in scheme.get("devices", [])
+    ]
+    connections = [
+        server_pb2.SchemeConnection(
+            signal_class=signal_classes.setdefault(
+                connection["signal"], len(signal_classes)),
+            device_uuids=[end["device_uuid"] for end in connection["conn"]],
+            ports=[end["port"] for end in connection["conn"]])
+        for connection in scheme.get("connections", [])
+    ]
+    return server_pb2.SchemeFile(
+        revision=scheme.get("revision", 0),
+        device_classes=list(device_classes),
+        signal_classes=list(signal_classes),
+        devices=devices,
+        connections=connections)
+
+
+def scheme_from_message(message: server_pb2.SchemeFile) -> dict:
+    """
+    Converts the SchemeFile message into the scheme descriptor
+    """
+    device_classes = list(message.device_classes)
+    signal_classes = list(message.signal_classes)
+    # The properties of all devices are decoded with a single JSON parse
+    properties = json.loads(b"[" + b",".join(
+        device.properties or b"{}" for device in message.devices) + b"]")
+    return {
+        "devices": [
+            {
+                "device": device_classes[device.device_class],
+                "location": list(device.location),
+                "uuid": device.uuid,
+                "properties": device_properties,
+            }
+            for device, device_properties in zip(message.devices, properties)
+        ],
+        "connections": [
+            {
+                "signal": signal_classes[connection.signal_class],
+                "conn": [
+                    {"device_uuid": device_uuid, "port": port}
+                    for device_uuid, port in zip(
+                        connection.device_uuids, connection.ports)
+                ],
+            }
+            for connection in message.connections
+        ],
+        "revision": message.revision,
+    }
+
+
+def read_scheme(path: Path, scheme_format: str | None = None) -> dict:
+    """
+    Reads the scheme descriptor from the file in either format
+
+    Parameters:
+    -----------
+    path (Path): Location of the scheme
+    scheme_format (Optional[str]): Format of the file, detected if None
+    """
+    if scheme_format is None:
+        scheme_format = detect_format(path)
+    if scheme_format == BINARY_FORMAT:
+        with open(path, "rb") as f:
+            content = f.read()
+        return scheme_from_message(
+            server_pb2.SchemeFile.FromString(content[len(MAGIC):]))
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_scheme(
+        path: Path,
+        scheme: dict,
+        scheme_format: str,
+        coerce: bool = False) -> None:
+    """
+    Writes the scheme descriptor atomically in the given format
+    """
+    if scheme_format == BINARY_FORMAT:
+        content = MAGIC + scheme_to_message(scheme, coerce).SerializeToString()
+    else:
+        content = json.dumps(scheme, indent=2)
+    write_atomically(path, content)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Converts schemes between the JSON and binary format")
+    parser.add_argument("source", type=Path)
+    parser.add_argument("target", type=Path)
+    parser.add_argument(
+        "--to", choices=[JSON_FORMAT, BINARY_FORMAT], default=None,
+        help=f"Target format (default: binary for *{BINARY_SUFFIX}, "
+             "json otherwise)")
+    args = parser.parse_args()
+
+    source_format = detect_format(args.source)
+    target_format = args.to
+    if target_format is None:
+        target_format = (BINARY_FORMAT if args.target.suffix == BINARY_SUFFIX
+                         else JSON_FORMAT)
+
+    from qureed_project_server.board_manager.scheme_journal import (
+        SchemeJournal
+    )
+    # Edits which were not compacted yet are part of the converted scheme,
+    # the journal of the source is left untouched
+    scheme = SchemeJournal(args.source).load(read_only=True)
+    scheme.setdefault("revision", 0)
+    write_scheme(args.target, scheme, target_format,
+                 coerce=source_format == JSON_FORMAT)
+    print(f"Converted {args.source} ({source_format}) to "
+          f"{args.target} ({target_format})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,392 @@
+import json
+import os
+import re
+from pathlib import Path
+
+from qureed_project_server.board_manager.scheme_format import (
+    BINARY_FORMAT, JSON_FORMAT, detect_format, read_scheme, write_scheme
+)
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_DELIMITER = re.compile(r"[ \t\n\r,\]}]")
+
+
+class _JsonStream:
+    """
+    Reads a JSON document from a file in blocks, values are decoded one by
+    one with `JSONDecoder.raw_decode`
+    """
+
+    def __init__(self, f, read_size: int):
+        self.f = f
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> None:
+        chunk = self.f.read(self.read_size)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self) -> str:
+        """
+        Skips the whitespace and gets the next character (empty at the end)
+        """
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self.fill()
+
+    def expect(self, characters: str) -> str:
+        character = self.peek()
+        if not character or character not in characters:
+            raise ValueError(
+                f"Expected one of {characters!r}, got {character!r}")
+        self.pos += 1
+        return character
+
+    def value(self):
+        character = self.peek()
+        if character and character in "-0123456789":
+            # A number at the end of the buffer might continue in the file
+            while (not self.eof and
+                   not _DELIMITER.search(self.buffer, self.pos)):
+                self.fill()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+                self.fill()
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_items(path: Path, read_size: int = 1 << 16):
+    """
+    Incrementally parses a JSON object, the elements of its array values
+    are yielded one by one as soon as they are read
+
+    Parameters:
+    -----------
+    path (Path): Location of the JSON file holding an object
+    read_size (int): Number of characters read at once
+
+    Yields:
+    -------
+    tuple[str, Any]: (key, element) for every element of an array value,
+        (key, value) for all other values
+    """
+    with open(path, "r") as f:
+        stream = _JsonStream(f, read_size)
+        stream.expect("{")
+        if stream.peek() == "}":
+            return
+        while True:
+            key = stream.value()
+            stream.expect(":")
+            if stream.peek() == "[":
+                stream.expect("[")
+                if stream.peek() == "]":
+                    stream.expect("]")
+                else:
+                    while True:
+                        yield key, stream.value()
+                        if stream.expect(",]") == "]":
+                            break
+            else:
+                yield key, stream.value()
+            if stream.expect(",}") == "}":
+                return
+
+
+class SchemeJournal:
+    """
+    SchemeJournal is the append-only journal of the board edits which
+    were saved but not yet compacted into the scheme file. It is stored next
+    to the scheme (`<scheme>.journal`) as JSON lines.
+
+    The first line of the journal holds the revision of the scheme it
+    extends. Compacting the journal writes the scheme with an incremented
+    revision before the journal is removed, so a journal left behind by an
+    interrupted compaction is recognized as stale. A journal whose header
+    can't be read is moved aside (`<scheme>.journal.corrupt`) rather than
+    removed. A torn (partially written) last line is ignored on replay.
+    The journal is JSON lines for both scheme formats.
+
+    Journal entries:
+        {"op": "add_device", "device": <device descriptor>}
+        {"op": "remove_device", "uuid": <uuid>}
+        {"op": "connect", "connection": <connection descriptor>}
+        {"op": "disconnect", "conn": [[<uuid>, <port>], [<uuid>, <port>]]}
+        {"op": "update_properties", "uuid": <uuid>, "properties": <dict>}
+        {"op": "move", "locations": {<uuid>: <location>}}
+
+    Attributes:
+    -----------
+    scheme_path (Path): Location of the scheme
+    path (Path): Location of the journal
+    revision (int): Revision of the scheme the journal extends
+    format (str): Format of the scheme file (json or binary)
+    entries (int): Number of entries in the journal
+
+    Methods:
+    --------
+    load(read_only): Loads the scheme with the journal replayed on top of
+        it
+    iter_load(): Loads the scheme incrementally
+    append(entries): Appends the entries to the journal
+    compact(scheme): Writes the scheme and removes the journal
+    """
+
+    def __init__(self, scheme_path: Path):
+        self.scheme_path = Path(scheme_path)
+        self.path = self.scheme_path.with_name(
+            self.scheme_path.name + ".journal")
+        self.revision = 0
+        self.entries = 0
+        self.format = JSON_FORMAT
+
+    def load(self, read_only: bool = False) -> dict:
+        """
+        Loads the scheme and replays the journal on top of it, a stale
+        journal (older revision) is removed, a journal with an unreadable
+        header or a newer revision is moved aside (.corrupt)
+
+        Parameters:
+        -----------
+        read_only (bool): Leave the journal as it is, a journal which can't
+            be replayed is only skipped
+
+        Returns:
+        --------
+        dict: The scheme descriptor (devices and connections)
+        """
+        self.format = detect_format(self.scheme_path)
+        scheme = read_scheme(self.scheme_path, self.format)
+        self.revision = scheme.get("revision", 0)
+        self.entries = 0
+
+        entries = self._read(read_only)
+        if entries is None:
+            return scheme
+        print(f"Replaying {len(entries)} journaled edits of "
+              f"{self.scheme_path.name}")
+        self.entries = len(entries)
+        return self.replay(scheme, entries)
+
+    def iter_load(self, incremental: bool = True):
+        """
+        Loads the scheme incrementally, every device and connection is
+        yielded as soon as it is parsed. A scheme with a journal is loaded
+        as a whole, since the journal can change any part of it, the
+        binary format is always decoded as a whole.
+
+        Parameters:
+        -----------
+        incremental (bool): Parse the JSON scheme incrementally, otherwise
+            it is parsed at once (faster in total) before the first item
+
+        Yields:
+        -------
+        tuple[str, dict]: ("devices", device descriptor) or
+            ("connections", connection descriptor)
+        """
+        self.format = detect_format(self.scheme_path)
+        if (not incremental or self.path.exists() or
+                self.format == BINARY_FORMAT):
+            scheme = self.load()
+            for key in ("devices", "connections"):
+                for item in scheme.get(key, []):
+                    yield key, item
+            return
+
+        self.revision = 0
+        self.entries = 0
+        for key, item in iter_json_items(self.scheme_path):
+            if key == "revision":
+                self.revision = item
+            elif key in ("devices", "connections"):
+                yield key, item
+
+    def _read(self, read_only: bool = False) -> list[dict] | None:
+        try:
+            with open(self.path, "r") as f:
+                lines = f.read().split("\n")
+        except FileNotFoundError:
+            return None
+        if not any(lines):
+            if not read_only:
+                self.path.unlink(missing_ok=True)
+            return None
+        try:
+            header = json.loads(lines[0])
+            revision = header["revision"]
+            if not isinstance(revision, int):
+                raise ValueError(f"revision {revision!r}")
+        except (ValueError, TypeError, KeyError) as e:
+            self._skip(f"its header can't be read ({e})", read_only)
+            return None
+        if revision < self.revision:
+            if read_only:
+                print(f"Skipping the stale journal {self.path.name}")
+            else:
+                print(f"Removing the stale journal {self.path.name}")
+                self.path.unlink(missing_ok=True)
+            return None
+        if revision > self.revision:
+            self._skip(f"it extends revision {revision} of the scheme, "
+                       f"the scheme is at revision {self.revision}",
+                       read_only)
+            return None
+        entries = []
+        for line in lines[1:]:
+            if not line:
+                continue
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # Torn write of the last entry
+                break
+        return entries
+
+    def _skip(self, reason: str, read_only: bool) -> None:
+        if read_only:
+            print(f"Journal {self.path.name} is not replayed, {reason}")
+        else:
+            self._set_aside(reason)
+
+    def _set_aside(self, reason: str) -> None:
+        """
+        Renames a journal which can't be replayed, so its edits are kept
+        for a manual recovery instead of being removed
+        """
+        aside = self.path.with_name(self.path.name + ".corrupt")
+        n = 1
+        while aside.exists():
+            aside = self.path.with_name(f"{self.path.name}.corrupt.{n}")
+            n += 1
+        self.path.rename(aside)
+        print(f"Journal {self.path.name} is not replayed, {reason}; "
+              f"moved to {aside.name}")
+
+    @staticmethod
+    def replay(scheme: dict, entries: list[dict]) -> dict:
+        """
+        Applies the journal entries to the scheme descriptor
+
+        Parameters:
+        -----------
+        scheme (dict): Scheme descriptor
+        entries (list[dict]): Journal entries in order
+
+        Returns:
+        --------
+        dict: The updated scheme descriptor
+        """
+        devices = {d["uuid"]: d for d in scheme.get("devices", [])}
+        connections = {}
+        adjacency = {}
+
+        def connect(connection):
+            key = SchemeJournal.connection_key(connection)
+            connections[key] = connection
+            for uuid, _ in key:
+                adjacency.setdefault(uuid, set()).add(key)
+
+        def disconnect(key):
+            if connections.pop(key, None) is not None:
+                for uuid, _ in key:
+                    adjacency.get(uuid, set()).discard(key)
+
+        for connection in scheme.get("connections", []):
+            connect(connection)
+
+        for entry in entries:
+            op = entry["op"]
+            if op == "add_device":
+                devices[entry["device"]["uuid"]] = entry["device"]
+            elif op == "remove_device":
+                devices.pop(entry["uuid"], None)
+                for key in list(adjacency.pop(entry["uuid"], ())):
+                    disconnect(key)
+            elif op == "connect":
+                connect(entry["connection"])
+            elif op == "disconnect":
+                disconnect(tuple(sorted(tuple(end) for end in entry["conn"])))
+            elif op == "update_properties":
+                if entry["uuid"] in devices:
+                    devices[entry["uuid"]]["properties"] = entry["properties"]
+            elif op == "move":
+                for uuid, location in entry["locations"].items():
+                    if uuid in devices:
+                        devices[uuid]["location"] = location
+
+        scheme["devices"] = list(devices.values())
+        scheme["connections"] = list(connections.values())
+        return scheme
+
+    @staticmethod
+    def connection_key(connection: dict) -> tuple:
+        """
+        Gets the order independent key of the connection descriptor
+        """
+        return tuple(sorted(
+            (end["device_uuid"], end["port"]) for end in connection["conn"]))
+
+    def append(self, entries: list[dict]) -> None:
+        """
+        Appends the entries to the journal, the journal is synced to disk
+        before returning
+
+        Parameters:
+        -----------
+        entries (list[dict]): Journal entries in order
+        """
+        if not entries:
+            return
+        lines = [json.dumps(entry) for entry in entries]
+        if not self.path.exists():
+            lines.insert(0, json.dumps({"revision": self.revision}))
+        else:
+            self._repair()
+        with open(self.path, "a") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self.entries += len(entries)
+
+    def _repair(self) -> None:
+        """
+        Cuts off a torn last line, so new entries start on a fresh line
+        """
+        with open(self.path, "rb+") as f:
+            size = f.seek(0, os.SEEK_END)
+            if size == 0:
+                return
+            f.seek(size - 1)
+            if f.read(1) != b"\n":
+                f.seek(0)
+                f.truncate(f.read().rfind(b"\n") + 1)
+
+    def compact(self, scheme: dict) -> None:
+        """
+        Writes the canonical scheme (with the next revision) atomically in
+        the format of the scheme file and removes the journal
+
+        Parameters:
+        -----------
+        scheme (dict): Scheme descriptor (devices and connections)
+        """
+        self.revision += 1
+        scheme = {**scheme, "revision": self.revision}
+        write_scheme(self.scheme_path, scheme, self.format)
+        self.path.unlink(missing_ok=True)
+        self.entries = 0
@@ -1,3 +1,5 @@
+import importlib
+import threading
 from enum import StrEnum
 
 class LogicModuleEnum(StrEnum):
@@ -6,6 +8,16 @@ class LogicModuleEnum(StrEnum):
     BOARD_MANAGER = "board_manager"
     SIMULATION_MANAGER = "simulation_manager"
 
+# Packages which create (and register) the logic module singletons when
+# they are imported, modules are imported on first use
+LOGIC_MODULE_PACKAGES = {
+    LogicModuleEnum.VENV_MANAGER: "qureed_project_server.venv_management",
+    LogicModuleEnum.QUREED_MANAGER: "qureed_project_server.qureed_manager",
+    LogicModuleEnum.BOARD_MANAGER: "qureed_project_server.board_manager",
+    LogicModuleEnum.SIMULATION_MANAGER:
+        "qureed_project_server.qureed_simulation_manager",
+}
+
 class LogicModuleHandler:
     _instance = None
 
@@ -17,10 +29,32 @@ class LogicModuleHandler:
     def __init__(self):
         if not hasattr(self,"initialized"):
             self.modules = {}
+            self.settings = {}
+            self.lock = threading.RLock()
             self.initialized=True
 
     def register(self, module_type:LogicModuleEnum, module):
         self.modules[module_type]=module
 
+    def configure(self, module_type:LogicModuleEnum, **settings):
+        """
+        Sets the attributes of the logic module, the settings are applied
+        when the module is first used if it isn't loaded yet
+        """
+        with self.lock:
+            if module_type in self.modules:
+                for name, value in settings.items():
+                    setattr(self.modules[module_type], name, value)
+            else:
+                self.settings.setdefault(module_type, {}).update(settings)
+
     def get_logic(self, module_type):
-        return self.modules[module_type]
+        module = self.modules.get(module_type)
+        if module is None or module_type in self.settings:
+            with self.lock:
+                if module_type not in self.modules:
+                    importlib.import_module(LOGIC_MODULE_PACKAGES[module_type])
+                module = self.modules[module_type]
+                for name, value in self.settings.pop(module_type, {}).items():
+                    setattr(module, name, value)
+        return module
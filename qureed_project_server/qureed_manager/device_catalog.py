@@ -0,0 +1,242 @@
+import queue
+import threading
+from pathlib import Path
+
+from qureed_project_server import server_pb2
+from qureed_project_server.logic_modules import (
+    LogicModuleEnum, LogicModuleHandler
+)
+from qureed_project_server.utils.file_watcher import FileWatcher
+
+LMH = LogicModuleHandler()
+
+
+class DeviceCatalog:
+    """
+    DeviceCatalog is the in-memory catalog of all devices and signals,
+    grouped by the module which defines them. The custom devices and
+    signals are watched, a changed file is re-imported on its own and the
+    resulting delta is pushed to all subscribers.
+
+    Every change increments the catalog version, subscribers can use it to
+    detect whether their copy of the catalog is up to date.
+
+    Attributes:
+    -----------
+    project_root (Path): Root of the watched project
+    version (int): Monotonic catalog version
+    devices (dict[Path, list[Device]]): Device messages by module path
+    signals (dict[Path, list[Signal]]): Signal messages by module path
+    watcher (Optional[FileWatcher]): Watcher of the custom directories
+
+    Methods:
+    --------
+    load(devices, signals): Loads the initial catalog
+    start(): Starts watching the custom directories
+    stop(): Stops watching the custom directories
+    get_devices(): Gets all devices in the catalog
+    get_signals(): Gets all signals in the catalog
+    snapshot(): Gets the whole catalog as a delta
+    subscribe(): Subscribes to the catalog deltas
+    unsubscribe(subscription): Cancels the subscription
+    update_modules(paths): Re-imports the given modules and publishes the
+        resulting delta
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.custom_devices_path = self.project_root / "custom" / "devices"
+        self.custom_signals_path = self.project_root / "custom" / "signals"
+        self.version = 0
+        self.devices = {}
+        self.signals = {}
+        self.watcher = None
+        self.lock = threading.Lock()
+        self.subscribers = []
+
+    def load(
+            self,
+            devices: dict[Path, list[server_pb2.Device]],
+            signals: dict[Path, list[server_pb2.Signal]]) -> None:
+        """
+        Loads the initial catalog
+
+        Parameters:
+        -----------
+        devices (dict[Path, list[Device]]): Device messages by module path
+        signals (dict[Path, list[Signal]]): Signal messages by module path
+        """
+        with self.lock:
+            self.devices = dict(devices)
+            self.signals = dict(signals)
+            self.version += 1
+
+    def start(self) -> None:
+        """
+        Starts watching the custom devices and signals
+        """
+        directories = [
+            path for path in (self.custom_devices_path,
+                              self.custom_signals_path)
+            if path.exists()
+        ]
+        self.watcher = FileWatcher(directories, self.update_modules)
+        self.watcher.start()
+        print(f"Watching the device catalog ({self.watcher.backend})")
+
+    def stop(self) -> None:
+        """
+        Stops watching the custom devices and signals
+        """
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def get_devices(self) -> list[server_pb2.Device]:
+        """
+        Gets all of the devices in the catalog
+        """
+        with self.lock:
+            return [
+                device for module_devices in self.devices.values()
+                for device in module_devices
+            ]
+
+    def get_signals(self) -> list[server_pb2.Signal]:
+        """
+        Gets all of the signals in the catalog
+        """
+        with self.lock:
+            signals = {}
+            for module_signals in self.signals.values():
+                for signal in module_signals:
+                    signals.setdefault(signal.module_class, signal)
+            return list(signals.values())
+
+    def snapshot(self) -> server_pb2.CatalogDelta:
+        """
+        Gets the whole catalog as a single delta in which all devices and
+        signals are reported as added
+        """
+        with self.lock:
+            return server_pb2.CatalogDelta(
+                version=self.version,
+                snapshot=True,
+                added_devices=[
+                    device for module_devices in self.devices.values()
+                    for device in module_devices
+                ],
+                added_signals=[
+                    signal for module_signals in self.signals.values()
+                    for signal in module_signals
+                ],
+            )
+
+    def subscribe(self) -> queue.Queue:
+        """
+        Subscribes to the catalog deltas
+
+        Returns:
+        --------
+        queue.Queue: Queue into which the deltas are put
+        """
+        subscription = queue.Queue()
+        with self.lock:
+            self.subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: queue.Queue) -> None:
+        """
+        Cancels the subscription
+        """
+        with self.lock:
+            if subscription in self.subscribers:
+                self.subscribers.remove(subscription)
+
+    def update_modules(self, paths: list[Path]) -> None:
+        """
+        Re-imports the given modules and publishes the changes of the
+        catalog as a single delta. Removed files remove their devices and
+        signals from the catalog.
+
+        Parameters:
+        -----------
+        paths (list[Path]): Paths of the changed modules
+        """
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        # Reloading the changed modules also reloads the modules which
+        # depend on them, their devices and signals must be updated too
+        paths = set(paths)
+        for module_name in QM.module_registry.refresh():
+            module_path = QM.module_registry.path_of(module_name)
+            if module_path is not None:
+                paths.add(module_path)
+
+        new_devices = {}
+        new_signals = {}
+        errors = []
+        for path in sorted(paths):
+            if not path.is_relative_to(self.project_root):
+                continue
+            module_name = QM.module_name_from_path(path, self.project_root)
+            if path.is_relative_to(self.custom_devices_path):
+                if path.exists():
+                    devices, error = QM.get_module_devices(
+                        module_name, path, use_cache=False)
+                    if error:
+                        errors.append(f"Failed to import {module_name}: {error}")
+                    new_devices[path] = devices
+                else:
+                    new_devices[path] = None
+            elif path.is_relative_to(self.custom_signals_path):
+                if path.exists():
+                    signals, error = QM.get_module_signals(module_name, path)
+                    if error:
+                        errors.append(f"Failed to import {module_name}: {error}")
+                    new_signals[path] = signals
+                else:
+                    new_signals[path] = None
+
+        with self.lock:
+            delta = server_pb2.CatalogDelta(message="\n".join(errors))
+            for path, devices in new_devices.items():
+                old = {d.module_class: d for d in self.devices.get(path, [])}
+                new = {d.module_class: d for d in devices or []}
+                delta.added_devices.extend(
+                    d for mc, d in new.items() if mc not in old)
+                delta.changed_devices.extend(
+                    d for mc, d in new.items() if mc in old and old[mc] != d)
+                delta.removed_devices.extend(
+                    mc for mc in old if mc not in new)
+                if devices is None:
+                    self.devices.pop(path, None)
+                else:
+                    self.devices[path] = devices
+            for path, signals in new_signals.items():
+                old = {s.module_class: s for s in self.signals.get(path, [])}
+                new = {s.module_class: s for s in signals or []}
+                delta.added_signals.extend(
+                    s for mc, s in new.items() if mc not in old)
+                delta.changed_signals.extend(
+                    s for mc, s in new.items() if mc in old and old[mc] != s)
+                delta.removed_signals.extend(
+                    mc for mc in old if mc not in new)
+                if signals is None:
+                    self.signals.pop(path, None)
+                else:
+                    self.signals[path] = signals
+
+            QM.update_signal_index(
+                [s.module_class for s in delta.added_signals] +
+                [s.module_class for s in delta.changed_signals],
+                list(delta.removed_signals))
+
+            if not (delta.added_devices or delta.changed_devices or
+                    delta.removed_devices or delta.added_signals or
+                    delta.changed_signals or delta.removed_signals or
+                    delta.message):
+                return
+            self.version += 1
+            delta.version = self.version
+            for subscription in self.subscribers:
+                subscription.put(delta)
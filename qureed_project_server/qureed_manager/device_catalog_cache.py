@@ -0,0 +1,203 @@
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+from qureed_project_server import server_pb2
+
+CACHE_FORMAT = 2
+
+
+def get_qureed_version() -> str:
+    """
+    Gets the version of the installed qureed package, an empty string
+    is returned if the version cannot be determined
+    """
+    from importlib import metadata
+
+    try:
+        return metadata.version("qureed")
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def file_hash(path: Path) -> str:
+    """
+    Computes the sha256 hash of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DeviceCatalogCache:
+    """
+    DeviceCatalogCache persists the serialized device messages of every
+    device module, so that unchanged modules don't have to be imported
+    and introspected on every scan.
+
+    Every entry is keyed by the absolute module path and stores the
+    fingerprint (mtime, size and content hash) of the module at the time
+    the messages were generated. The whole cache is discarded when the
+    installed qureed version changes. The cache is shared by the device
+    scans and the watcher thread, the entries are guarded by a lock.
+
+    Attributes:
+    -----------
+    path (Path): Location of the cache file
+    qureed_version (str): Version of qureed the cache was built against
+    entries (dict): Cached entries keyed by the module path
+    dirty (bool): Flag indicating that the cache must be written to disk
+
+    Methods:
+    --------
+    load(): Loads the cache from disk
+    save(): Atomically writes the cache to disk if it changed
+    get(module_path): Gets the cached device messages of the module
+    put(module_path, devices): Stores the device messages of the module
+    prune(module_paths): Drops entries of modules which no longer exist
+    """
+
+    def __init__(self, path: Path, qureed_version: str):
+        self.path = Path(path)
+        self.qureed_version = qureed_version
+        self.entries = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """
+        Loads the cache from disk, a missing, corrupted or outdated cache
+        file results in an empty cache
+        """
+        try:
+            with open(self.path, "r") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            content = None
+        with self._lock:
+            self.entries = {}
+            self.dirty = False
+            if content is None:
+                return
+            if (not isinstance(content, dict) or
+                    content.get("format") != CACHE_FORMAT or
+                    content.get("qureed_version") != self.qureed_version):
+                self.dirty = True
+                return
+            self.entries = content.get("modules", {})
+
+    def save(self) -> None:
+        """
+        Writes the cache to disk, the file is replaced atomically so an
+        interrupted write never leaves a corrupted cache behind. Every write
+        goes through its own temporary file.
+        """
+        with self._lock:
+            if not self.dirty:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, prefix=self.path.name + ".",
+                suffix=".tmp", delete=False)
+            try:
+                with f:
+                    json.dump({
+                        "format": CACHE_FORMAT,
+                        "qureed_version": self.qureed_version,
+                        "modules": self.entries
+                    }, f)
+                os.replace(f.name, self.path)
+            except BaseException:
+                Path(f.name).unlink(missing_ok=True)
+                raise
+            self.dirty = False
+
+    def get(self, module_path: Path) -> list[server_pb2.Device] | None:
+        """
+        Gets the cached device messages of the module
+
+        The content hash is only computed if the mtime or the size of the
+        module changed, a touched but unchanged module is still a hit.
+
+        Parameters:
+        -----------
+        module_path (Path): Path of the device module
+
+        Returns:
+        --------
+        list[Device] | None: Cached device messages or None if the module
+            is not cached or was modified
+        """
+        key = str(module_path)
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(module_path)
+        except OSError:
+            return None
+
+        if (entry["mtime_ns"] != stat.st_mtime_ns or
+                entry["size"] != stat.st_size):
+            if entry["size"] != stat.st_size:
+                return None
+            if entry["sha256"] != file_hash(module_path):
+                return None
+            with self._lock:
+                if self.entries.get(key) is entry:
+                    entry["mtime_ns"] = stat.st_mtime_ns
+                    self.dirty = True
+
+        return [
+            server_pb2.Device.FromString(base64.b64decode(device))
+            for device in entry["devices"]
+        ]
+
+    def put(
+            self,
+            module_path: Path,
+            devices: list[server_pb2.Device]) -> None:
+        """
+        Stores the device messages of the module together with its
+        current fingerprint
+
+        Parameters:
+        -----------
+        module_path (Path): Path of the device module
+        devices (list[Device]): Device messages generated from the module
+        """
+        stat = os.stat(module_path)
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": file_hash(module_path),
+            "devices": [
+                base64.b64encode(device.SerializeToString()).decode("ascii")
+                for device in devices
+            ]
+        }
+        with self._lock:
+            self.entries[str(module_path)] = entry
+            self.dirty = True
+
+    def prune(self, module_paths: set) -> None:
+        """
+        Drops the entries of all modules not in the given set
+
+        Parameters:
+        -----------
+        module_paths (set): Paths of all modules which currently exist
+        """
+        keep = {str(path) for path in module_paths}
+        with self._lock:
+            for key in list(self.entries):
+                if key not in keep:
+                    del self.entries[key]
+                    self.dirty = True
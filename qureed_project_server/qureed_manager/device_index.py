@@ -0,0 +1,120 @@
+import bisect
+import re
+
+from qureed_project_server import server_pb2
+
+
+class DeviceIndex:
+    """
+    DeviceIndex is an in-memory inverted index over the device catalog. It
+    answers the palette queries (name prefix, tags, port signal types and
+    directions) without walking through all of the device messages.
+
+    Devices are identified by their position in the catalog, so query
+    results keep the catalog order and can be paginated by offset.
+
+    Attributes:
+    -----------
+    version (int): Version of the indexed catalog
+    devices (list[Device]): Indexed device messages in catalog order
+    names (list[tuple[str, int]]): Sorted (lowercase name token, device)
+        pairs for the prefix lookups
+    tags (dict[str, set]): Devices by lowercase tag
+    signals (dict[str, set]): Devices by port signal type
+    directions (dict[str, set]): Devices by port direction
+    ports (dict[tuple[str, str], set]): Devices by (signal type, direction)
+
+    Methods:
+    --------
+    query(name_prefix, tags, signal_type, direction): Gets the positions of
+        the matching devices
+    """
+
+    def __init__(self, devices: list[server_pb2.Device], version: int):
+        self.version = version
+        self.devices = devices
+        self.tags = {}
+        self.signals = {}
+        self.directions = {}
+        self.ports = {}
+        names = set()
+        for i, device in enumerate(devices):
+            for token in self._name_tokens(device):
+                names.add((token, i))
+            for tag in device.gui_tags:
+                self.tags.setdefault(tag.lower(), set()).add(i)
+            for port in device.ports:
+                self.signals.setdefault(port.signal_type, set()).add(i)
+                self.directions.setdefault(port.direction, set()).add(i)
+                self.ports.setdefault(
+                    (port.signal_type, port.direction), set()).add(i)
+        self.names = sorted(names)
+
+    @staticmethod
+    def _name_tokens(device: server_pb2.Device) -> set[str]:
+        """
+        Gets the tokens by which the device can be found, the whole names
+        as well as every word of the gui name
+        """
+        tokens = set()
+        for name in (device.gui_name, device.class_name):
+            name = name.lower()
+            if name:
+                tokens.add(name)
+                tokens.update(w for w in re.split(r"[\s_\-]+", name) if w)
+        return tokens
+
+    def _prefix(self, prefix: str) -> set[int]:
+        prefix = prefix.lower()
+        start = bisect.bisect_left(self.names, (prefix,))
+        found = set()
+        for token, i in self.names[start:]:
+            if not token.startswith(prefix):
+                break
+            found.add(i)
+        return found
+
+    def query(
+            self,
+            name_prefix: str = "",
+            tags: list[str] = (),
+            signal_type: str = "",
+            direction: str = "") -> list[int]:
+        """
+        Gets the positions of all devices matching every given criterion,
+        empty criteria match all devices
+
+        Parameters:
+        -----------
+        name_prefix (str): Prefix of the gui name, class name or any word of
+            the gui name (case insensitive)
+        tags (list[str]): Tags the device must have (case insensitive)
+        signal_type (str): Signal type of at least one of the ports
+        direction (str): Direction of at least one of the ports, combined
+            with signal_type the same port must match both
+
+        Returns:
+        --------
+        list[int]: Positions of the matching devices in catalog order
+        """
+        candidates = []
+        if name_prefix:
+            candidates.append(self._prefix(name_prefix))
+        for tag in tags:
+            candidates.append(self.tags.get(tag.lower(), set()))
+        if signal_type and direction:
+            candidates.append(self.ports.get((signal_type, direction), set()))
+        elif signal_type:
+            candidates.append(self.signals.get(signal_type, set()))
+        elif direction:
+            candidates.append(self.directions.get(direction, set()))
+
+        if not candidates:
+            return list(range(len(self.devices)))
+        candidates.sort(key=len)
+        matches = set(candidates[0])
+        for candidate in candidates[1:]:
+            matches &= candidate
+            if not matches:
+                break
+        return sorted(matches)
@@ -0,0 +1,199 @@
+import importlib
+import os
+import pkgutil
+import threading
+from pathlib import Path
+
+from qureed_project_server import server_pb2
+from qureed_project_server.qureed_manager.device_catalog_cache import file_hash
+
+
+class IconManifest:
+    """
+    IconManifest resolves the locations of all icons once and serves the
+    icon contents keyed by their content hash. The hash of an icon is only
+    recomputed when its mtime or size changed.
+
+    Builtin icons are known by their name in `qureed.assets.icon_list` as
+    well as by their file name relative to the qureed assets, custom icons
+    by their path relative to the project root (e.g. custom/icons/a.png).
+
+    Attributes:
+    -----------
+    project_root (Path): Root of the project
+    assets_path (Optional[Path]): Location of the qureed assets
+    icons (dict[str, Path]): Icon locations by name
+    aliases (dict[str, str]): Additional names of the icons
+
+    Methods:
+    --------
+    refresh(): Rebuilds the manifest
+    location(icon): Gets the absolute path of the icon
+    get_icon(name, known_hash): Gets the icon message including its data
+    list_icons(): Gets the messages (without data) of all icons
+    get_changed_icons(known_hashes): Gets the icons unknown to the client
+    """
+
+    def __init__(self, project_root: Path):
+        self.project_root = Path(project_root)
+        self.assets_path = None
+        self.icons = {}
+        self.aliases = {}
+        self.hashes = {}
+        self.lock = threading.Lock()
+        loader = pkgutil.get_loader("qureed")
+        if loader and loader.is_package("qureed"):
+            self.assets_path = Path(loader.get_filename()).parent / "assets"
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Rebuilds the manifest of the builtin and custom icons
+        """
+        icons = {}
+        aliases = {}
+        try:
+            qureed_icons = importlib.import_module("qureed.assets.icon_list")
+        except ModuleNotFoundError:
+            print("Failed to import qureed.assets.icon_list")
+            qureed_icons = None
+        if qureed_icons is not None and self.assets_path is not None:
+            for icon_name, icon_file in vars(qureed_icons).items():
+                if isinstance(icon_file, str) and icon_file.endswith(".png"):
+                    icons[icon_name] = self.assets_path / icon_file
+                    aliases[icon_file.replace("\\", "/")] = icon_name
+
+        custom_icons_path = self.project_root / "custom" / "icons"
+        if custom_icons_path.is_dir():
+            for icon_file in sorted(custom_icons_path.glob("*.png")):
+                icons[icon_file.relative_to(self.project_root).as_posix()] = (
+                    icon_file.resolve())
+
+        with self.lock:
+            self.icons = icons
+            self.aliases = aliases
+
+    def location(self, icon: str) -> str:
+        """
+        Gets the absolute path of the icon
+
+        Parameters:
+        -----------
+        icon (str): The gui_icon of a device
+
+        Returns:
+        --------
+        str: Absolute path of the icon (empty string if not found)
+        """
+        if not icon:
+            return ""
+        # Normalize the icon path to use forward slashes (cross-platform)
+        normalized_icon = icon.replace("\\", "/")
+        if "custom/icons" in normalized_icon:
+            return str(self.project_root / normalized_icon.lstrip("/"))
+        if self.assets_path is not None:
+            return str(self.assets_path / normalized_icon)
+        return ""
+
+    def _resolve(self, name: str) -> tuple[str, Path | None]:
+        normalized_name = name.replace("\\", "/").lstrip("/")
+        with self.lock:
+            name = self.aliases.get(normalized_name, normalized_name)
+            path = self.icons.get(name)
+        if path is None and normalized_name:
+            path = Path(self.location(normalized_name)).resolve()
+            roots = [(self.project_root / "custom" / "icons").resolve()]
+            if self.assets_path is not None:
+                roots.append(self.assets_path.resolve())
+            # Only icons inside of the icon directories are served
+            if (not path.is_file() or
+                    not any(path.is_relative_to(root) for root in roots)):
+                return name, None
+        return name, path
+
+    def _hash(self, path: Path) -> str:
+        stat = os.stat(path)
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            cached = self.hashes.get(path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        content_hash = file_hash(path)
+        with self.lock:
+            self.hashes[path] = (fingerprint, content_hash)
+        return content_hash
+
+    def get_icon(
+            self,
+            name: str,
+            known_hash: str = "") -> server_pb2.GetIconResponse:
+        """
+        Gets the icon, the data is omitted if the client already has the
+        icon with the same content hash
+
+        Parameters:
+        -----------
+        name (str): Name or gui_icon path of the icon
+        known_hash (str): Hash of the icon known to the client
+
+        Returns:
+        --------
+        GetIconResponse: Icon message
+
+        Raises:
+        -------
+        FileNotFoundError: If the icon doesn't exist
+        """
+        name, path = self._resolve(name)
+        if path is None:
+            raise FileNotFoundError(f"Icon {name} not found")
+        content_hash = self._hash(path)
+        icon = server_pb2.GetIconResponse(
+            name=name,
+            abs_path=str(path),
+            hash=content_hash,
+            status="success"
+        )
+        if content_hash == known_hash:
+            icon.unchanged = True
+        else:
+            icon.data = path.read_bytes()
+        return icon
+
+    def list_icons(self) -> list[server_pb2.GetIconResponse]:
+        """
+        Gets the messages of all icons, without their data
+        """
+        with self.lock:
+            icons = list(self.icons.items())
+        messages = []
+        for name, path in icons:
+            try:
+                content_hash = self._hash(path)
+            except OSError:
+                continue
+            messages.append(server_pb2.GetIconResponse(
+                name=name,
+                abs_path=str(path),
+                hash=content_hash
+            ))
+        return messages
+
+    def get_changed_icons(self, known_hashes: dict[str, str]):
+        """
+        Yields all icons which are missing on the client or changed
+
+        Parameters:
+        -----------
+        known_hashes (dict[str, str]): Hashes of the icons known to the
+            client, keyed by the icon name
+        """
+        with self.lock:
+            names = list(self.icons)
+        for name in names:
+            try:
+                icon = self.get_icon(name, known_hashes.get(name, ""))
+            except OSError:
+                continue
+            if not icon.unchanged:
+                yield icon
@@ -0,0 +1,233 @@
+import importlib
+import importlib.util
+import inspect
+import os
+import sys
+import threading
+import types
+from pathlib import Path
+
+
+class ModuleRegistry:
+    """
+    ModuleRegistry imports every device and signal module once and reuses
+    it afterwards. All modules are registered in `sys.modules` under their
+    canonical (dotted) name, so that the classes found during the catalog
+    scans are identical to the ones returned by `importlib.import_module`.
+
+    The registry remembers the fingerprint (mtime, size) of every module
+    file. Modules whose source changed are reloaded together with all of
+    the registered modules which depend on them, dependencies first.
+
+    Attributes:
+    -----------
+    modules (dict): Registered modules by name, every entry holds the path,
+        the fingerprint and the names of the registered dependencies
+    reload_listeners (list[callable]): Called with the names of the
+        reloaded or removed modules after every refresh
+
+    Methods:
+    --------
+    load(module_name, module_path): Gets the module, importing it if needed
+    import_module(module_name): Gets the module by its name
+    refresh(): Reloads the modules whose source changed
+    path_of(module_name): Gets the path of a registered module
+    """
+
+    def __init__(self):
+        self.modules = {}
+        self.reload_listeners = []
+        self.lock = threading.RLock()
+
+    def load(self, module_name: str, module_path: Path) -> types.ModuleType:
+        """
+        Gets the module defined in the given file. A registered module is
+        returned as is unless its source changed, in which case it is
+        reloaded first.
+
+        Parameters:
+        -----------
+        module_name (str): Canonical name of the module
+        module_path (Path): Path of the module file
+
+        Returns:
+        --------
+        types.ModuleType: The imported module
+        """
+        module_path = Path(module_path)
+        with self.lock:
+            entry = self.modules.get(module_name)
+            if entry is not None and entry["path"] == module_path:
+                if entry["fingerprint"] != self._fingerprint(module_path):
+                    self.refresh()
+                if module_name in sys.modules:
+                    return sys.modules[module_name]
+
+            module = sys.modules.get(module_name)
+            if module is None or not self._defined_in(module, module_path):
+                module = self._import(module_name, module_path)
+            self._register(module, module_path)
+            return module
+
+    def import_module(self, module_name: str) -> types.ModuleType:
+        """
+        Gets the module by its name, modules which are not registered yet
+        are imported with `importlib.import_module` and registered
+
+        Parameters:
+        -----------
+        module_name (str): Name of the module
+
+        Returns:
+        --------
+        types.ModuleType: The imported module
+        """
+        with self.lock:
+            entry = self.modules.get(module_name)
+            if entry is not None:
+                return self.load(module_name, entry["path"])
+            module = importlib.import_module(module_name)
+            module_file = getattr(module, "__file__", None)
+            if module_file and module_file.endswith(".py"):
+                self._register(module, Path(module_file))
+            return module
+
+    def path_of(self, module_name: str) -> Path | None:
+        """
+        Gets the path of the registered module
+        """
+        entry = self.modules.get(module_name)
+        return entry["path"] if entry else None
+
+    def refresh(self) -> list[str]:
+        """
+        Reloads all registered modules whose source changed, together with
+        the modules which depend on them. Modules are reloaded in the
+        dependency order, so a reloaded module sees the new classes of its
+        dependencies. Modules whose file was removed are unregistered.
+
+        Returns:
+        --------
+        list[str]: Names of the reloaded and removed modules
+        """
+        with self.lock:
+            changed = {
+                name for name, entry in self.modules.items()
+                if entry["fingerprint"] != self._fingerprint(entry["path"])
+            }
+            if not changed:
+                return []
+
+            dependents = {}
+            for name, entry in self.modules.items():
+                for dependency in entry["dependencies"]:
+                    dependents.setdefault(dependency, set()).add(name)
+
+            affected = set()
+            stack = list(changed)
+            while stack:
+                name = stack.pop()
+                if name in affected:
+                    continue
+                affected.add(name)
+                stack.extend(dependents.get(name, ()))
+
+            importlib.invalidate_caches()
+            for name in self._dependency_order(affected):
+                entry = self.modules[name]
+                if not entry["path"].exists():
+                    del self.modules[name]
+                    sys.modules.pop(name, None)
+                    continue
+                module = sys.modules.get(name)
+                try:
+                    if module is None:
+                        module = self._import(name, entry["path"])
+                    else:
+                        module = importlib.reload(module)
+                except Exception as e:
+                    print(f"Failed to reload {name}: {e}")
+                    del self.modules[name]
+                    sys.modules.pop(name, None)
+                    continue
+                self._register(module, entry["path"])
+
+            reloaded = sorted(affected)
+            for listener in self.reload_listeners:
+                listener(reloaded)
+            return reloaded
+
+    def _dependency_order(self, names: set) -> list[str]:
+        ordered = []
+        visited = set()
+
+        def visit(name, path):
+            if name in visited or name in path:
+                return
+            path.add(name)
+            for dependency in sorted(self.modules[name]["dependencies"]):
+                if dependency in names:
+                    visit(dependency, path)
+            path.discard(name)
+            visited.add(name)
+            ordered.append(name)
+
+        for name in sorted(names):
+            visit(name, set())
+        return ordered
+
+    def _import(self, module_name: str, module_path: Path) -> types.ModuleType:
+        """
+        Imports the module, through the regular import system if the name
+        resolves to the given file, directly from the file otherwise
+        """
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is not None and spec.origin and self._same_file(
+                spec.origin, module_path):
+            return importlib.import_module(module_name)
+
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        return module
+
+    def _register(self, module: types.ModuleType, module_path: Path) -> None:
+        dependencies = set()
+        for value in vars(module).values():
+            if inspect.ismodule(value):
+                dependencies.add(value.__name__)
+            elif inspect.isclass(value) or inspect.isfunction(value):
+                dependencies.add(getattr(value, "__module__", None))
+        dependencies.discard(module.__name__)
+        self.modules[module.__name__] = {
+            "path": module_path,
+            "fingerprint": self._fingerprint(module_path),
+            "dependencies": dependencies
+        }
+
+    def _defined_in(self, module: types.ModuleType, module_path: Path) -> bool:
+        module_file = getattr(module, "__file__", None)
+        return bool(module_file) and self._same_file(module_file, module_path)
+
+    @staticmethod
+    def _same_file(path_one, path_two) -> bool:
+        try:
+            return os.path.samefile(path_one, path_two)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _fingerprint(module_path: Path):
+        try:
+            stat = os.stat(module_path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
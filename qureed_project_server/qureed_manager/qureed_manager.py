@@ -1,17 +1,27 @@
 import json
 import types
 import re
+import weakref
 import sys
 import importlib.util
 import inspect
 import traceback
 import os
+import threading
 from pathlib import Path
 from qureed_project_server.logic_modules import LogicModuleEnum,LogicModuleHandler
 from qureed_project_server import server_pb2
 from google.protobuf.json_format import MessageToDict
 import pkgutil
-from jinja2 import Environment, FileSystemLoader
+
+from qureed_project_server.qureed_manager.device_catalog_cache import (
+    DeviceCatalogCache, get_qureed_version
+)
+from qureed_project_server.qureed_manager.device_catalog import DeviceCatalog
+from qureed_project_server.qureed_manager.module_registry import ModuleRegistry
+from qureed_project_server.qureed_manager.signal_index import SignalIndex
+from qureed_project_server.qureed_manager.icon_manifest import IconManifest
+from qureed_project_server.qureed_manager.device_index import DeviceIndex
 
 LMH = LogicModuleHandler()
 
@@ -19,6 +29,39 @@ class NoDeviceFoundError(Exception):
     """ Error raiesd when device is expected but wasn't found """
 
 
+def _init_discovery_worker(venv_path: str, path: list[str]) -> None:
+    """
+    Initializes a device discovery worker process, so that it sees the
+    same project as the server process
+    """
+    sys.path[:] = path
+    VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+    VM.path = venv_path
+
+
+def _discover_module_devices(
+        module: tuple[str, Path]) -> tuple[list[bytes], str]:
+    """
+    Imports a single device module and creates the messages of all devices
+    it defines. The messages are returned serialized, so that they can be
+    passed between processes.
+
+    Returns:
+    --------
+    tuple[list[bytes], str]: Serialized device messages and the error
+        message (empty string if the module was imported successfully)
+    """
+    module_name, module_path = module
+    QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+    try:
+        imported_module = QM.import_module_from_path(module_name, module_path)
+        device_messages = QM.create_device_message_from_module(
+            imported_module)
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+    return [device.SerializeToString() for device in device_messages], ""
+
+
 class QuReedManager:
     """
     QuReedManager (Singleton) manages different aspects of the QuReed
@@ -28,22 +71,69 @@ class QuReedManager:
     Attributes:
     -----------
     initialized (bool): Initialization flag for the Singleton Pattern
+    device_catalog_cache (Optional[DeviceCatalogCache]): Persistent cache
+        of the device messages of the opened project
+    discovery_workers (int): Number of worker processes used for the
+        device discovery, values below two discover serially
+    device_catalog (Optional[DeviceCatalog]): Watched in-memory catalog,
+        None if the catalog watcher is not running
+    device_properties (WeakKeyDictionary): Memoized serialized properties
+        keyed by the device class
+    module_registry (ModuleRegistry): Registry of the imported device and
+        signal modules
+    signal_index (Optional[SignalIndex]): Index of the signal hierarchy
+    icon_manifest (Optional[IconManifest]): Resolved icons of the project
+    device_index (Optional[DeviceIndex]): Search index of the device catalog
+    class_cache (dict[str, type]): Resolved classes by module.class
+    unresolved_classes (dict[str, tuple]): Cached resolution failures by
+        module.class
 
     Methods:
     --------
+    warm_up(): Imports qureed and its builtin device modules
     get_devices(): Gets all the devices (Built-in and Custom in the project)    
+    search_devices(request): Searches and paginates the device catalog
+    get_device_index(): Gets the search index of the device catalog
+    scan_devices(): Scans all device modules, devices are grouped by module
+    get_module_devices(module_name, module_path): Gets the devices of a
+        single module
+    discover_devices(modules): Imports the modules and creates their
+        device messages, optionally in a process pool
+    import_module_from_path(module_name, module_path): Imports the
+        module from the given path
+    find_modules(path, relative_to, prefix): Finds all python modules in
+        the given directory
+    module_name_from_path(module_path, relative_to, prefix): Computes the
+        dotted module name of the module file
+    start_catalog_watcher(): Starts keeping the in-memory catalog up to date
+    stop_catalog_watcher(): Stops the catalog watcher
+    get_device_catalog_cache(project_root): Gets the persistent device
+        catalog cache of the project
     get_all_icons(): Gets all icons (Built-in and Custom in the project)
+    get_icon(name, known_hash): Gets a single icon including its data
+    get_changed_icons(known_hashes): Gets the icons missing on the client
+    get_icon_manifest(): Gets the icon manifest of the project
     get_all_signals(): Gets all signals (Built-in and Custom in the project)
+    scan_signals(): Scans all signal modules, signals are grouped by module
+    get_signal_index(populate): Gets the signal hierarchy index
+    update_signal_index(added, removed): Incrementally updates the index
+    get_module_signals(module_name, module_path): Gets the signals of a
+        single module
     generate_new_device(device): Generates new Custom device in the project
     get_icon_location(icon): Gets abs location of the requested icon
     create_device_message(device_class): Generates a device message from 
         the device class
+    get_device_properties(device_class): Gets the memoized serialized
+        properties of the device class
+    extract_property_schema(device_class): Extracts the properties of the
+        device class, instantiating it only if needed
     load_custom_as_package(): Loads Custom (custom elements in the project)
     get_device(device_request): Dynamically loadst the device module and
         returns the class in list
     create_device_message_from_module(module): Creates the list of device
         messages from the given module
     get_class(module_class): Gets a class defined by the module.class notation
+    invalidate_class_cache(module_names): Drops the cached classes
     
     Examples:
     ---------
@@ -65,209 +155,664 @@ class QuReedManager:
     def __init__(self):
         if not hasattr(self, "initialized"):
             LMH.register(LogicModuleEnum.QUREED_MANAGER, self)
+            self.device_catalog_cache = None
+            self.device_catalog_cache_lock = threading.Lock()
+            self.discovery_workers = 0
+            self.device_catalog = None
+            self.catalog_lock = threading.Lock()
+            self.device_properties = weakref.WeakKeyDictionary()
+            self.module_registry = ModuleRegistry()
+            self.module_registry.reload_listeners.append(
+                self._on_modules_reloaded)
+            self.signal_index = None
+            self.signal_index_populated = False
+            self.icon_manifest = None
+            self.device_index = None
+            self.class_cache = {}
+            self.unresolved_classes = {}
             self.initialized = True
 
+    def warm_up(self) -> None:
+        """
+        Imports qureed and all of its builtin device modules ahead of the
+        first catalog scan, modules which fail to import are skipped
+        """
+        spec = importlib.util.find_spec("qureed")
+        if not spec or not spec.submodule_search_locations:
+            return
+        qureed_path = Path(next(iter(spec.submodule_search_locations)))
+        for module_name, module_path in self.find_modules(
+                qureed_path / "devices", qureed_path, prefix="qureed."):
+            try:
+                self.import_module_from_path(module_name, module_path)
+            except Exception as e:
+                print(f"Failed to import {module_name}: {e}")
+
     def get_devices(self) -> tuple[list[server_pb2.Device], str]:
         """
         Get all of the devices available in the project (Built-in and Custom)
 
-        It transverses the custom directory and the directory of 'qureed' to 
-        assemble the list of existing devices
+        If the catalog watcher is running the devices are served from the
+        in-memory catalog, otherwise the device modules are scanned.
 
         Returns:
         --------
         tuple[list[Device], str]: Returns the tuple of the list of existing devices
             as messages and a message string if anything went wrong
         """
+        if self.device_catalog is not None:
+            return self.device_catalog.get_devices(), ""
+        devices, message = self.scan_devices()
+        return [
+            device for module_devices in devices.values()
+            for device in module_devices
+        ], message
+
+    def search_devices(
+            self,
+            request: server_pb2.GetDevicesRequest
+            ) -> server_pb2.GetDevicesResponse:
+        """
+        Searches the device catalog through the in-memory device index and
+        returns the requested page of the matching devices
+
+        The page token encodes the catalog version and the offset of the
+        page, a token issued for an older catalog is rejected.
+
+        Parameters:
+        -----------
+        request (GetDevicesRequest): The query, empty query fields match all
+            devices and a page size of zero returns all matches
+
+        Returns:
+        --------
+        GetDevicesResponse: The matching devices
+
+        Raises:
+        -------
+        ValueError: If the page token is malformed or expired
+        """
+        index, message = self.get_device_index()
+        offset = 0
+        if request.page_token:
+            try:
+                version, offset = map(int, request.page_token.split(":"))
+            except ValueError:
+                raise ValueError(f"Invalid page token {request.page_token}")
+            if version != index.version:
+                raise ValueError("Page token expired, the catalog changed")
+
+        matches = index.query(
+            name_prefix=request.name_prefix,
+            tags=list(request.tags),
+            signal_type=request.signal_type,
+            direction=request.direction)
+        end = len(matches)
+        if request.page_size > 0:
+            end = min(offset + request.page_size, end)
+
+        response = server_pb2.GetDevicesResponse(
+            status="success",
+            message=message,
+            total_size=len(matches))
+        for i in matches[offset:end]:
+            device = response.devices.add()
+            device.CopyFrom(index.devices[i])
+            if request.summary_only:
+                device.ClearField("device_properties")
+        if end < len(matches):
+            response.next_page_token = f"{index.version}:{end}"
+        return response
+
+    def get_device_index(self) -> tuple[DeviceIndex, str]:
+        """
+        Gets the index of the current device catalog, the index is rebuilt
+        only when the catalog changed
+
+        Returns:
+        --------
+        tuple[DeviceIndex, str]: The device index and a message string if
+            anything went wrong while scanning the devices
+        """
+        if self.device_catalog is not None:
+            version = self.device_catalog.version
+            if (self.device_index is not None and
+                    self.device_index.version == version):
+                return self.device_index, ""
+            devices, message = self.get_devices()
+        else:
+            devices, message = self.get_devices()
+            version = 1
+            if self.device_index is not None:
+                version = self.device_index.version
+                if self.device_index.devices == devices:
+                    return self.device_index, message
+                version += 1
+        self.device_index = DeviceIndex(devices, version)
+        return self.device_index, message
+
+    def scan_devices(self) -> tuple[dict[Path, list[server_pb2.Device]], str]:
+        """
+        Scans all of the device modules in the project (Built-in and Custom)
+
+        It transverses the custom directory and the directory of 'qureed' to 
+        assemble the list of existing devices. Device messages of modules
+        which didn't change since the last scan are served from the
+        persistent device catalog cache, only the changed modules are
+        imported. Modules which fail to import are reported in the
+        returned message.
+
+        Returns:
+        --------
+        tuple[dict[Path, list[Device]], str]: Device messages keyed by the
+            module path (in module order) and a message string if anything
+            went wrong
+        """
         try:
             VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
             spec = importlib.util.find_spec("qureed")
             if not spec or not spec.submodule_search_locations:
-                return []
+                return {}, "QuReed is not installed"
 
             qureed_path = Path(next(iter(spec.submodule_search_locations)))
             builtin_devices_path = qureed_path / "devices"
-            custom_devices_path = Path(VM.path).parents[0] / "custom" / "devices"
+            project_root = Path(VM.path).parents[0]
+            custom_devices_path = project_root / "custom" / "devices"
             message = ""
 
-            if not qureed_path.exists():
-                message = f"Builtin devices not found in {qureed_path}"
-            if not qureed_path.exists():
+            if not builtin_devices_path.exists():
+                message = f"Builtin devices not found in {builtin_devices_path}"
+            if not custom_devices_path.exists():
                 message += f"\nCustom devices not found in {custom_devices_path}"
 
+            self.module_registry.refresh()
+            # New modules may resolve previously unresolvable classes
+            self.unresolved_classes.clear()
+            cache = self.get_device_catalog_cache(project_root)
+            devices = {}
+            module_paths = set()
+
+            modules = self.find_modules(
+                builtin_devices_path, qureed_path, prefix="qureed.")
+            modules += self.find_modules(custom_devices_path, project_root)
+
+            stale_modules = []
+            cached_devices = {}
+            for module_name, module_path in modules:
+                module_paths.add(module_path)
+                device_messages = cache.get(module_path)
+                if device_messages is None:
+                    stale_modules.append((module_name, module_path))
+                else:
+                    cached_devices[module_path] = device_messages
+
+            discovered_devices, errors = self.discover_devices(stale_modules)
+            for module_path, device_messages in discovered_devices.items():
+                cache.put(module_path, device_messages)
+
+            for module_name, module_path in modules:
+                if module_path in errors:
+                    message += (
+                        f"\nFailed to import {module_name}: "
+                        f"{errors[module_path]}")
+                    continue
+                devices[module_path] = (
+                    cached_devices.get(module_path) or
+                    discovered_devices.get(module_path, []))
 
-            device_list = []
-
-            
-            # Getting builtin QuReed Devices
-            for root, _, files in os.walk(builtin_devices_path):
-                for file in files:
-                    if file.endswith(".py") and not file.startswith("__"):
-                        module_path = Path(root) / file
-                        module_name = "qureed."+str(
-                            module_path.relative_to(qureed_path)).replace(
-                                os.sep, ".").replace(".py", "")
-                        # Dynamically import the module
-                        spec = importlib.util.spec_from_file_location(
-                            module_name, module_path
-                            )
-                        module = importlib.util.module_from_spec(spec)
-                        try:
-                            spec.loader.exec_module(module)
-                        except Exception as e:
-                            print(" X--> EXCEPTION {e}")
-                            continue
-                        device_message = self.create_device_message_from_module(module)
-                        device_list.extend(device_message)
-
-            custom_module = Path(VM.path).parents[0] / "custom"
-            spec = importlib.util.spec_from_file_location("custom", custom_module)
-
-            # Getting Custom Devices
-            for root, _, files in os.walk(custom_devices_path):
-                for file in files:
-                    if file.endswith(".py") and not file.startswith("__"):
-                        module_path = Path(root) / file
-                        module_name = str(
-                            module_path.relative_to(custom_devices_path)).replace(
-                                os.sep, ".").replace(".py", "")
-                        spec = importlib.util.spec_from_file_location(
-                            module_name, module_path
-                            )
-                        module = importlib.util.module_from_spec(spec)
-                        try:
-                            spec.loader.exec_module(module)
-                        except Exception as e:
-                            continue
-                        print("GENERATING CUSTOM DEVICE MESSAGE")
-                        device_message = self.create_device_message_from_module(module)
-                        device_list.extend(device_message)
-                        
-            
-            return device_list, message
+            cache.prune(module_paths)
+            try:
+                cache.save()
+            except OSError as e:
+                print(f"Device catalog cache could not be saved: {e}")
+
+            return devices, message
 
         except Exception as e:
             print("ERROR")
             print(traceback.format_exc())
             traceback.print_exc()
 
-    def get_all_icons(self) -> list[server_pb2.GetIconResponse]:
+    def get_module_devices(
+            self,
+            module_name: str,
+            module_path: Path,
+            use_cache: bool = True) -> tuple[list[server_pb2.Device], str]:
         """
-        Gets all of the icons (Builtin as well as Custom)
+        Gets the device messages of a single device module, the module is
+        only imported if it changed since it was last cached
+
+        Parameters:
+        -----------
+        module_name (str): Name of the module
+        module_path (Path): Path of the module file
+        use_cache (bool): If False the messages are always regenerated,
+            e.g. after one of the module dependencies was reloaded
 
         Returns:
         --------
-        list[GetIconResponse]: List of all found icons
+        tuple[list[Device], str]: Device messages and the error message
+            (empty string if the module was imported successfully)
         """
         VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
-        icons = []
-        
-        # Get built in icons
-        loader = pkgutil.get_loader("qureed")
+        cache = self.get_device_catalog_cache(Path(VM.path).parents[0])
+        device_messages = cache.get(module_path) if use_cache else None
+        if device_messages is not None:
+            return device_messages, ""
+        serialized_devices, error = _discover_module_devices(
+            (module_name, module_path))
+        if error:
+            return [], error
+        device_messages = [
+            server_pb2.Device.FromString(device)
+            for device in serialized_devices
+        ]
+        cache.put(module_path, device_messages)
         try:
-            qureed_icons = importlib.import_module("qureed.assets.icon_list")
-        except ModuleNotFoundError:
-            print("Failed to import qureed.assets.icon_list")
-        if loader and loader.is_package("qureed") and qureed_icons:
-            for icon_name, icon_file in vars(qureed_icons).items():
-                if isinstance(icon_file, str) and icon_file.endswith(".png"):
-                    icon_abs_path = self.get_icon_location(icon_file)
-                    icons.append(
-                        server_pb2.GetIconResponse(
-                            name=icon_name,
-                            abs_path=icon_abs_path
-                        )
-                    )
+            cache.save()
+        except OSError as e:
+            print(f"Device catalog cache could not be saved: {e}")
+        return device_messages, ""
+
+    def discover_devices(
+            self,
+            modules: list[tuple[str, Path]]
+            ) -> tuple[dict[Path, list[server_pb2.Device]], dict[Path, str]]:
+        """
+        Imports the given modules and creates the device messages of all
+        devices found in them. If discovery_workers is larger than one the
+        modules are split across a pool of worker processes.
 
-        # Get Custom Icons
-        custom_icons_path = Path(VM.path).parents[0] / "custom" / "icons"
-        custom_base_path = Path(VM.path).parents[0]
-        if custom_icons_path.exists() and custom_icons_path.is_dir():
-            for icon_file in custom_icons_path.glob("*.png"):  # Only .png files
-                icons.append(
-                    server_pb2.GetIconResponse(
-                        name=str(icon_file.relative_to(custom_base_path)),
-                        abs_path=str(icon_file.resolve())  # Get absolute path
-                    )
-                )
+        Parameters:
+        -----------
+        modules (list[tuple[str, Path]]): Module names and paths
 
+        Returns:
+        --------
+        tuple[dict, dict]: Device messages keyed by the module path and
+            the import errors keyed by the module path
+        """
+        devices = {}
+        errors = {}
+        if self.discovery_workers > 1 and len(modules) > 1:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
 
-        return icons
+            VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+            workers = min(self.discovery_workers, len(modules))
+            chunksize = max(1, len(modules) // (workers * 4))
+            with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_discovery_worker,
+                    initargs=(VM.path, list(sys.path))) as executor:
+                results = list(executor.map(
+                    _discover_module_devices, modules, chunksize=chunksize))
+        else:
+            results = [_discover_module_devices(m) for m in modules]
+
+        for (_, module_path), (serialized_devices, error) in zip(
+                modules, results):
+            if error:
+                errors[module_path] = error
+            else:
+                devices[module_path] = [
+                    server_pb2.Device.FromString(device)
+                    for device in serialized_devices
+                ]
+        return devices, errors
+
+    def import_module_from_path(
+            self,
+            module_name: str,
+            module_path: Path) -> types.ModuleType:
+        """
+        Imports the module from the given path through the module registry,
+        an already imported module is reused unless its source changed
+
+        Parameters:
+        -----------
+        module_name (str): Canonical name of the module
+        module_path (Path): Path of the module file
+
+        Returns:
+        --------
+        types.ModuleType: The imported module
+        """
+        return self.module_registry.load(module_name, module_path)
+
+    def find_modules(
+            self,
+            path: Path,
+            relative_to: Path,
+            prefix: str = "") -> list[tuple[str, Path]]:
+        """
+        Finds all of the python modules in the given directory
+
+        Parameters:
+        -----------
+        path (Path): Directory which is searched recursively
+        relative_to (Path): The module names are computed relative to
+            this directory
+        prefix (str): Prefix of the module names
+
+        Returns:
+        --------
+        list[tuple[str, Path]]: Sorted list of module names and paths
+        """
+        modules = []
+        for root, _, files in os.walk(path):
+            for file in files:
+                if file.endswith(".py") and not file.startswith("__"):
+                    module_path = Path(root) / file
+                    modules.append((
+                        self.module_name_from_path(
+                            module_path, relative_to, prefix),
+                        module_path
+                    ))
+        return sorted(modules)
 
-    def get_all_signals(self):
+    def module_name_from_path(
+            self,
+            module_path: Path,
+            relative_to: Path,
+            prefix: str = "") -> str:
+        """
+        Computes the dotted module name of the module file
+
+        Parameters:
+        -----------
+        module_path (Path): Path of the module file
+        relative_to (Path): The module name is computed relative to
+            this directory
+        prefix (str): Prefix of the module name
+
+        Returns:
+        --------
+        str: Dotted module name
+        """
+        return prefix + str(
+            Path(module_path).relative_to(relative_to)).replace(
+                os.sep, ".").replace(".py", "")
+
+    def start_catalog_watcher(self) -> DeviceCatalog:
+        """
+        Starts watching the custom devices and signals, the in-memory
+        device catalog is kept up to date file by file afterwards.
+        Calling it when the watcher is already running has no effect.
+
+        Returns:
+        --------
+        DeviceCatalog: The watched in-memory device catalog
+        """
+        with self.catalog_lock:
+            if self.device_catalog is None:
+                VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+                devices, _ = self.scan_devices()
+                catalog = DeviceCatalog(Path(VM.path).parents[0])
+                catalog.load(devices, self.scan_signals())
+                catalog.start()
+                self.device_catalog = catalog
+            return self.device_catalog
+
+    def stop_catalog_watcher(self) -> None:
+        """
+        Stops the catalog watcher, devices and signals are scanned on
+        request afterwards
+        """
+        with self.catalog_lock:
+            if self.device_catalog is not None:
+                self.device_catalog.stop()
+                self.device_catalog = None
+
+    def get_device_catalog_cache(
+            self,
+            project_root: Path) -> DeviceCatalogCache:
+        """
+        Gets the device catalog cache of the project, the cache is loaded
+        from disk once and reused afterwards
+
+        Parameters:
+        -----------
+        project_root (Path): Root of the project
+
+        Returns:
+        --------
+        DeviceCatalogCache: The device catalog cache of the project
+        """
+        cache_path = project_root / ".qureed" / "device_catalog.json"
+        qureed_version = get_qureed_version()
+        with self.device_catalog_cache_lock:
+            if (self.device_catalog_cache is None or
+                    self.device_catalog_cache.path != cache_path or
+                    self.device_catalog_cache.qureed_version !=
+                    qureed_version):
+                self.device_catalog_cache = DeviceCatalogCache(
+                    cache_path, qureed_version)
+                self.device_catalog_cache.load()
+            return self.device_catalog_cache
+
+    def get_all_icons(self) -> list[server_pb2.GetIconResponse]:
+        """
+        Gets all of the icons (Builtin as well as Custom)
+
+        Returns:
+        --------
+        list[GetIconResponse]: List of all found icons, including their
+            content hash but without their data
+        """
+        manifest = self.get_icon_manifest()
+        manifest.refresh()
+        return manifest.list_icons()
+
+    def get_icon(
+            self,
+            name: str,
+            known_hash: str = "") -> server_pb2.GetIconResponse:
+        """
+        Gets a single icon including its data, the data is omitted if
+        known_hash matches the content hash of the icon
+
+        Parameters:
+        -----------
+        name (str): Name or gui_icon path of the icon
+        known_hash (str): Hash of the icon already known to the client
+
+        Returns:
+        --------
+        GetIconResponse: The icon message
+        """
+        return self.get_icon_manifest().get_icon(name, known_hash)
+
+    def get_changed_icons(self, known_hashes: dict[str, str]):
+        """
+        Yields all of the icons (including their data) which the client
+        doesn't have yet or which changed
+
+        Parameters:
+        -----------
+        known_hashes (dict[str, str]): Content hashes of the icons known
+            to the client keyed by the icon name
+        """
+        manifest = self.get_icon_manifest()
+        manifest.refresh()
+        yield from manifest.get_changed_icons(known_hashes)
+
+    def get_icon_manifest(self) -> IconManifest:
+        """
+        Gets the icon manifest of the project, the icon locations are
+        resolved once when the manifest is created
+
+        Returns:
+        --------
+        IconManifest: The icon manifest of the project
+        """
+        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+        project_root = Path(VM.path).parents[0]
+        if (self.icon_manifest is None or
+                self.icon_manifest.project_root != project_root):
+            self.icon_manifest = IconManifest(project_root)
+        return self.icon_manifest
+
+    def get_all_signals(self) -> list[server_pb2.Signal]:
         """
         Gets all of the signals (builtin and custom)
+
+        If the catalog watcher is running the signals are served from the
+        in-memory catalog, otherwise the signal modules are scanned. The
+        signal index is updated with the found signals.
+        """
+        if self.device_catalog is not None:
+            return self.device_catalog.get_signals()
+        signals = {}
+        for module_signals in self.scan_signals().values():
+            for signal in module_signals:
+                signals.setdefault(signal.module_class, signal)
+        # The index doesn't exist yet on a fresh server
+        index = self.get_signal_index()
+        index.sync(
+            [self.get_class(module_class) for module_class in signals])
+        self.signal_index_populated = True
+        return list(signals.values())
+
+    def get_signal_index(self, populate: bool = False) -> SignalIndex:
+        """
+        Gets the signal index. Signals are added to the index on demand,
+        if populate is set the index is guaranteed to contain all of the
+        signals of the project.
+
+        Parameters:
+        -----------
+        populate (bool): Populate the index with all signals if it wasn't
+            populated yet
+
+        Returns:
+        --------
+        SignalIndex: The signal hierarchy index
+        """
+        if self.signal_index is None:
+            self.signal_index = SignalIndex(self.get_class(
+                "qureed.signals.generic_signal.GenericSignal"))
+        if populate and not self.signal_index_populated:
+            if self.device_catalog is not None:
+                self.update_signal_index(
+                    [s.module_class for s in self.device_catalog.get_signals()])
+                self.signal_index_populated = True
+            else:
+                self.get_all_signals()
+        return self.signal_index
+
+    def update_signal_index(
+            self,
+            added: list[str],
+            removed: list[str] = None) -> None:
+        """
+        Incrementally updates the signal index
+
+        Parameters:
+        -----------
+        added (list[str]): Added or changed signals (module.class)
+        removed (Optional[list[str]]): Removed signals (module.class)
+        """
+        if self.signal_index is None:
+            return
+        for module_class in removed or []:
+            self.signal_index.remove(module_class)
+        for module_class in added:
+            try:
+                self.signal_index.add(self.get_class(module_class))
+            except Exception as e:
+                print(f"Signal {module_class} could not be indexed: {e}")
+
+    def _on_modules_reloaded(self, module_names: list[str]) -> None:
+        """
+        Called by the module registry after modules were reloaded, signals
+        defined in the reloaded modules are re-indexed
+        """
+        self.invalidate_class_cache(module_names)
+        if self.signal_index is None:
+            return
+        module_names = set(module_names)
+        stale = [
+            module_class for module_class, cls
+            in list(self.signal_index.classes.items())
+            if cls.__module__ in module_names
+        ]
+        for module_class in stale:
+            self.signal_index.remove(module_class)
+            try:
+                self.signal_index.add(self.get_class(module_class))
+            except Exception:
+                pass
+
+    def scan_signals(self) -> dict[Path, list[server_pb2.Signal]]:
+        """
+        Scans all of the signal modules (builtin and custom)
+
+        Returns:
+        --------
+        dict[Path, list[Signal]]: Signal messages keyed by the module path
         """
         VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
-        signals = set()
 
         spec = importlib.util.find_spec("qureed")
         if not spec or not spec.submodule_search_locations:
-            return []
+            return {}
 
         qureed_path = Path(next(iter(spec.submodule_search_locations)))
+        builtin_signals_path = qureed_path / "signals"
+        custom_path = Path(VM.path).parents[0]
+        custom_signals_path = custom_path / "custom" / "signals"
+
+        modules = self.find_modules(
+            builtin_signals_path, qureed_path, prefix="qureed.")
+        modules += self.find_modules(custom_signals_path, custom_path)
+
+        signals = {}
+        for module_name, module_path in modules:
+            signals[module_path], _ = self.get_module_signals(
+                module_name, module_path)
+        return signals
+
+    def get_module_signals(
+            self,
+            module_name: str,
+            module_path: Path) -> tuple[list[server_pb2.Signal], str]:
+        """
+        Gets the messages of all signals defined in the given module
+
+        Parameters:
+        -----------
+        module_name (str): Name of the module
+        module_path (Path): Path of the module file
+
+        Returns:
+        --------
+        tuple[list[Signal], str]: Signal messages and the error message
+            (empty string if the module was imported successfully)
+        """
         GenericSignal = self.get_class(
             "qureed.signals.generic_signal.GenericSignal")
-        builtin_signals_path = qureed_path / "signals"
-        custom_signals_path = Path(VM.path).parents[0] / "custom" / "signals"
+        generic_signal_mc = (
+            f"{GenericSignal.__module__}.{GenericSignal.__qualname__}")
+        try:
+            module = self.import_module_from_path(module_name, module_path)
+        except Exception as e:
+            return [], f"{type(e).__name__}: {e}"
 
-        # Getting builtin QuReed Signals
-        for root, _, files in os.walk(builtin_signals_path):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("__"):
-                    module_path = Path(root) / file
-                    module_name = "qureed."+str(
-                        module_path.relative_to(qureed_path)).replace(
-                            os.sep, ".").replace(".py", "")
-
-                    # Dynamically import the module
-                    spec = importlib.util.spec_from_file_location(
-                        module_name, module_path)
-                    module = importlib.util.module_from_spec(spec)
-                    try:
-                        spec.loader.exec_module(module)
-                    except Exception as e:
-                        continue
-                    
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-
-                        if (inspect.isclass(attr) and
-                            issubclass(attr, GenericSignal) or
-                            attr is GenericSignal):
-                            if attr not in signals:
-                                signals.add(attr)
-        
-        # Getting Custom Signals
-        custom_path = Path(VM.path).parents[0]
-        for root, _, files in os.walk(custom_signals_path):
-            for file in files:
-                if file.endswith(".py") and not file.startswith("__"):
-                    module_path = Path(root) / file
-                    module_name = str(module_path.relative_to(custom_path)).replace(
-                        os.sep, ".").replace(".py", "")
-                    spec = importlib.util.spec_from_file_location(
-                        module_name, module_path)
-                    module = importlib.util.module_from_spec(spec)
-                    try:
-                        spec.loader.exec_module(module)
-                    except Exception as e:
-                        continue
-                    for attr_name in dir(module):
-                        attr = getattr(module, attr_name)
-                        if (inspect.isclass(attr) and
-                            issubclass(attr, GenericSignal) or
-                            attr is GenericSignal):
-                            if attr not in signals:
-                                signals.add(attr)
         signals_msg = []
-        
-        for s in signals:
-            signals_msg.append(server_pb2.Signal(
-                module_class = f"{s.__module__}.{s.__qualname__}",
-                name=s.__qualname__
-            ))
-        return signals_msg
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if not inspect.isclass(attr) or attr.__module__ != module.__name__:
+                continue
+            module_class = f"{attr.__module__}.{attr.__qualname__}"
+            if (issubclass(attr, GenericSignal) or
+                    module_class == generic_signal_mc):
+                signals_msg.append(server_pb2.Signal(
+                    module_class=module_class,
+                    name=attr.__qualname__
+                ))
+        return signals_msg, ""
 
     def generate_new_device(self, device: server_pb2.Device) -> None:
         """
@@ -277,6 +822,8 @@ class QuReedManager:
         -----------
         device (server_pb2.Device): Device description
         """
+        from jinja2 import Environment, FileSystemLoader
+
         VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
         template_module = importlib.import_module("qureed.templates")
         template_dir = os.path.dirname(os.path.abspath(template_module.__file__))
@@ -316,26 +863,14 @@ class QuReedManager:
             raise Exception("Device with this name already exists")
         with open(file_location, "w") as f:
             f.write(rendered_device)
+        # The new device may have been referenced before it existed
+        self.unresolved_classes.clear()
 
     def get_icon_location(self, icon:str) -> str:
         """
         Gets the absolute path of the icon
         """
-        if not icon:
-            return ""
-
-        # Normalize the icon path to use forward slashes (cross-platform)
-        normalized_icon = icon.replace("\\", "/")
-        
-        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
-
-        if "custom/icons" in normalized_icon:
-            return str(Path(VM.path).parents[0] / normalized_icon.lstrip("/"))
-        else:
-            loader = pkgutil.get_loader("qureed")
-            if loader and loader.is_package("qureed"):
-                return str(Path(loader.get_filename()).parent /
-                           "assets" / normalized_icon)
+        return self.get_icon_manifest().location(icon)
 
     def create_device_message(self, device_class: type) -> server_pb2.Device:
         """
@@ -350,7 +885,6 @@ class QuReedManager:
         --------
         server_pb2.Device: Message description of the given device
         """
-        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         class_name = device_class.__name__
         module_class = f"{device_class.__module__}.{device_class.__qualname__}"
         print(f" CDM-> Generating a message {module_class}")
@@ -359,8 +893,8 @@ class QuReedManager:
             gui_name = class_name
 
         gui_tags = getattr(device_class, "gui_tags", None)
-        gui_icon = self.get_icon_location(
-            getattr(device_class, "gui_icon", None))
+        gui_icon_name = getattr(device_class, "gui_icon", None) or ""
+        gui_icon = self.get_icon_location(gui_icon_name)
         
         ports = []
         if hasattr(device_class, "ports"):
@@ -372,13 +906,11 @@ class QuReedManager:
                         signal_type=str(port.signal_type.__name__)
                     ))
 
-        print(f" CDM-> CREATING INSTANCE")
         try:
-            device_instance = device_class(trigger=False)
-            properties = BM.serialize_properties(device_instance.properties)
-            del device_instance
+            properties = self.get_device_properties(device_class)
         except Exception as e:
             print(f" X---> ERROR: {e}")
+            properties = {}
 
 
         device_msg = server_pb2.Device(
@@ -390,11 +922,68 @@ class QuReedManager:
             device_properties=server_pb2.DeviceProperties(
                 properties=properties),
             icon=server_pb2.GetIconResponse(
+                name=gui_icon_name.replace("\\", "/"),
                 abs_path=gui_icon)
             )
 
         return device_msg
 
+    def get_device_properties(self, device_class: type) -> dict:
+        """
+        Gets the serialized properties of the device class. The properties
+        are extracted once per class and memoized, the memoized entry is
+        dropped together with the class when its module is reloaded.
+
+        Parameters:
+        -----------
+        device_class (GenericDevice): The class of the device
+
+        Returns:
+        --------
+        dict: Serialized properties of the device class
+        """
+        properties = self.device_properties.get(device_class)
+        if properties is None:
+            BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+            properties = BM.serialize_properties(
+                self.extract_property_schema(device_class))
+            self.device_properties[device_class] = properties
+        return properties
+
+    def extract_property_schema(self, device_class: type) -> dict:
+        """
+        Extracts the properties of the device class without constructing
+        the device if possible. A declared `properties_schema` takes
+        precedence, followed by a `properties` dict defined on the class
+        (or on one of its bases below GenericDevice). Only if neither is
+        found the device is instantiated to read its properties.
+
+        Parameters:
+        -----------
+        device_class (GenericDevice): The class of the device
+
+        Returns:
+        --------
+        dict: Properties of the device class
+        """
+        schema = getattr(device_class, "properties_schema", None)
+        if isinstance(schema, dict):
+            return schema
+
+        GenericDevice = self.get_class(
+            "qureed.devices.generic_device.GenericDevice")
+        for cls in device_class.__mro__:
+            if cls is GenericDevice:
+                break
+            properties = vars(cls).get("properties")
+            if isinstance(properties, dict):
+                return properties
+
+        device_instance = device_class(trigger=False)
+        properties = device_instance.properties
+        del device_instance
+        return properties
+
     def load_custom_as_package(self):
         """
         Load custom as package, the custom package consists
@@ -474,7 +1063,6 @@ class QuReedManager:
             project_root = Path(os.environ.get("QUREED_CWD"))
         else:
             project_root = Path(VM.path).parents[0]
-        custom_devices_path = project_root / "custom" / "devices"
         try:
             if device_request.module_class:
                 print("NOT HERE")
@@ -482,16 +1070,11 @@ class QuReedManager:
 
             elif device_request.module_path:
                 module_path = Path(device_request.module_path)
-                module_name = str(
-                    module_path.relative_to(custom_devices_path)).replace(
-                        os.sep, ".").replace(".py", "")
+                module_name = self.module_name_from_path(
+                    module_path, project_root)
 
                 # Dynamically import the module
-                spec = importlib.util.spec_from_file_location(
-                    module_name,
-                    module_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                module = self.import_module_from_path(module_name, module_path)
                 device_message = self.create_device_message_from_module(module)
                 print("DEVICE CREATED")
                 return device_message[0]
@@ -519,7 +1102,6 @@ class QuReedManager:
         
         """
         VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
-        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         if VM.path is None or VM.path == "None":
             project_root = os.environ.get("QUREED_CWD")
         else:
@@ -538,9 +1120,9 @@ class QuReedManager:
 
                 class_name = attr.__name__
                 gui_name = getattr(attr, "gui_name", None)
+                gui_icon_name = getattr(attr, "gui_icon", None) or ""
                 try:
-                    gui_icon = self.get_icon_location(
-                        getattr(attr, "gui_icon", None))
+                    gui_icon = self.get_icon_location(gui_icon_name)
                 except Exception as e:
                     continue
                 gui_tags = getattr(attr, "gui_tags", None)
@@ -576,9 +1158,7 @@ class QuReedManager:
                     gui_name = class_name
 
                 # Construct the Device Protobuf message
-                attr_instance = attr(trigger=False)
-                properties = BM.serialize_properties(attr_instance.properties)
-                del attr_instance
+                properties = self.get_device_properties(attr)
                 device_message = server_pb2.Device(
                     class_name=class_name,
                     gui_name=gui_name,
@@ -588,6 +1168,7 @@ class QuReedManager:
                     device_properties=server_pb2.DeviceProperties(
                         properties=properties),
                     icon=server_pb2.GetIconResponse(
+                        name=gui_icon_name.replace("\\", "/"),
                         abs_path=gui_icon
                     )
                 )
@@ -600,6 +1181,10 @@ class QuReedManager:
         """
         Gets the class based on the device_mc
 
+        Resolved classes are cached by their module.class notation until
+        their module is reloaded. Names which cannot be resolved are cached
+        as well, so they fail fast until the modules are scanned again.
+
         Parameters:
         - mc: str
             A string describing the module and class path.
@@ -613,32 +1198,55 @@ class QuReedManager:
         - ModuleNotFoundError: If the module is not found.
         - AttributeError: If the class is not found in the module.
         """
-        try:
-            # Split the module path and class name
-            *module_path, class_name = mc.split(".")
-            module_name = ".".join(module_path)
+        cls = self.class_cache.get(mc)
+        if cls is not None:
+            return cls
+        failure = self.unresolved_classes.get(mc)
+        if failure is not None:
+            error_type, message = failure
+            raise error_type(message)
 
+        # Split the module path and class name
+        module_name, _, class_name = mc.rpartition(".")
+        try:
             # Import the module dynamically
-            module = importlib.import_module(module_name)
+            module = self.module_registry.import_module(module_name)
 
             # Get the class from the module
             cls = getattr(module, class_name)
-
-            return cls
-        except ModuleNotFoundError:
-            traceback.print_exc()
-            print(f"Module '{module_name}' not found.")
-            print(f"Module path: {module_path}")
-            print(f"Class Name: {class_name}")
-            print(traceback.format_exc())
-            print(sys.path)
-            print(sys.executable)
+        except ModuleNotFoundError as e:
+            message = f"Module '{module_name}' not found: {e}"
+            self.unresolved_classes[mc] = (ModuleNotFoundError, message)
+            print(message)
             raise
         except AttributeError:
-            traceback.print_exc()
-            print(f"Class '{class_name}' not found in module '{module_name}'.")
+            message = (
+                f"Class '{class_name}' not found in module '{module_name}'.")
+            self.unresolved_classes[mc] = (AttributeError, message)
+            print(message)
             raise
         except Exception as e:
             traceback.print_exc()
             print(f"An error occurred: {e}")
             raise
+        self.class_cache[mc] = cls
+        return cls
+
+    def invalidate_class_cache(self, module_names=None) -> None:
+        """
+        Drops the cached classes of the given modules together with all of
+        the cached resolution failures
+
+        Parameters:
+        -----------
+        module_names (Optional[Iterable[str]]): Names of the reloaded
+            modules, all cached classes are dropped if None
+        """
+        self.unresolved_classes.clear()
+        if module_names is None:
+            self.class_cache.clear()
+            return
+        module_names = set(module_names)
+        for mc in list(self.class_cache):
+            if mc.rpartition(".")[0] in module_names:
+                self.class_cache.pop(mc, None)
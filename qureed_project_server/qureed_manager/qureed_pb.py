@@ -1,4 +1,5 @@
 import traceback
+import queue
 from qureed_project_server import server_pb2_grpc, server_pb2
 from qureed_project_server.logic_modules import LogicModuleHandler, LogicModuleEnum
 
@@ -15,13 +16,7 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
         print("Grabing all of the devices (SERVER)")
         QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
         try:
-            devices, message = QM.get_devices()
-            # Convert to Protobuf message
-            return server_pb2.GetDevicesResponse(
-                status="success",
-                devices=devices,
-                message=message
-            )
+            return QM.search_devices(request)
         except Exception as e:
             traceback.print_exc()
             return server_pb2.GetDevicesResponse(
@@ -44,6 +39,29 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
                 message=f"Error during icon fetch: {e}"
                 )
 
+    def GetIcon(self, request, context):
+        try:
+            QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+            return QM.get_icon(request.name, request.known_hash)
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.GetIconResponse(
+                name=request.name,
+                status="failure",
+                message=f"Error during icon fetch: {e}"
+                )
+
+    def GetIconsBulk(self, request, context):
+        try:
+            QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+            yield from QM.get_changed_icons(dict(request.known_hashes))
+        except Exception as e:
+            traceback.print_exc()
+            yield server_pb2.GetIconResponse(
+                status="failure",
+                message=f"Error during icon fetch: {e}"
+                )
+
     def GetSignals(self, request, context):
         try:
             QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
@@ -76,7 +94,8 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
     def OpenBoard(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            devices_msg, connections_msg = BM.open_scheme(request.board)
+            devices_msg, connections_msg = BM.open_scheme(
+                request.board, reload=request.reload)
 
             return server_pb2.OpenBoardResponse(
                 status="success",
@@ -90,10 +109,32 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
                 message=f"Error when opening board {request.board} the devices: {e}"
                 )
 
+    def OpenBoardStream(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            chunks = BM.open_scheme_chunks(
+                request.board, chunk_size=request.chunk_size or 500,
+                reload=request.reload)
+            for devices_msg, connections_msg in chunks:
+                yield server_pb2.OpenBoardResponse(
+                    status="success",
+                    devices=devices_msg,
+                    connections=connections_msg
+                    )
+            yield server_pb2.OpenBoardResponse(status="success", done=True)
+        except Exception as e:
+            traceback.print_exc()
+            yield server_pb2.OpenBoardResponse(
+                status="failure",
+                message=f"Error when opening board {request.board} the devices: {e}",
+                done=True
+                )
+
     def SaveBoard(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            BM.save_scheme(request)
+            with BM.use_board(request.board):
+                BM.save_scheme(request)
             return server_pb2.SaveBoardResponse(
                 status="success",
                 )
@@ -122,7 +163,8 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
     def AddDevice(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            device_uuid = BM.add_device(request.device)
+            with BM.use_board(request.board):
+                device_uuid = BM.add_device(request.device)
             return server_pb2.AddDeviceResponse(
                 status="success",
                 device_uuid=str(device_uuid)
@@ -137,7 +179,8 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
     def RemoveDevice(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            BM.remove_device(request.device_uuid)
+            with BM.use_board(request.board):
+                BM.remove_device(request.device_uuid)
             return server_pb2.RemoveDeviceResponse(
                 status="success"
                 )
@@ -151,7 +194,8 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
     def ConnectDevices(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            BM.connect_devices(request)
+            with BM.use_board(request.board):
+                BM.connect_devices(request)
             return server_pb2.ConnectDevicesResponse(
                 status="success"
                 )
@@ -165,7 +209,8 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
     def DisconnectDevices(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            BM.disconnect_devices(request)
+            with BM.use_board(request.board):
+                BM.disconnect_devices(request)
             return server_pb2.DisconnectDevicesResponse(
                 status="success"
                 )
@@ -179,7 +224,8 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
     def UpdateDeviceProperties(self, request, context):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
         try:
-            BM.update_device_properties(request.device)
+            with BM.use_board(request.board):
+                BM.update_device_properties(request.device)
             return server_pb2.UpdateDevicePropertiesResponse(
                 status="success"
                 )
@@ -190,3 +236,208 @@ class QuReemManagementService(server_pb2_grpc.QuReedManagementServicer):
                 message=f"Failed to update the property due to: {e}"
                 )
             
+
+    def ApplyBoardEdits(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            with BM.use_board(request.board):
+                results, failed_edit = BM.apply_board_edits(request.edits)
+            if failed_edit >= 0:
+                return server_pb2.ApplyBoardEditsResponse(
+                    status="failure",
+                    message=(f"Edit {failed_edit} failed, no edits were "
+                             f"applied: {results[failed_edit].message}"),
+                    results=results,
+                    failed_edit=failed_edit
+                    )
+            return server_pb2.ApplyBoardEditsResponse(
+                status="success",
+                results=results,
+                failed_edit=-1
+                )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.ApplyBoardEditsResponse(
+                status="failure",
+                message=f"Failed to apply the board edits due to: {e}",
+                failed_edit=-1
+                )
+
+    def GetBoardGraph(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            with BM.use_board(request.board):
+                components, order, cycle_connections = BM.get_board_graph()
+            return server_pb2.GetBoardGraphResponse(
+                status="success",
+                components=[
+                    server_pb2.BoardComponent(device_uuids=component)
+                    for component in components],
+                topological_order=order,
+                cycle_connections=cycle_connections
+                )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.GetBoardGraphResponse(
+                status="failure",
+                message=f"Failed to get the board graph due to: {e}"
+                )
+
+    def UndoBoard(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            with BM.use_board(request.board):
+                return self._board_history_response(*BM.undo())
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.BoardHistoryResponse(
+                status="failure",
+                message=f"Failed to undo due to: {e}"
+                )
+
+    def RedoBoard(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            with BM.use_board(request.board):
+                return self._board_history_response(*BM.redo())
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.BoardHistoryResponse(
+                status="failure",
+                message=f"Failed to redo due to: {e}"
+                )
+
+    def RevertBoard(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            with BM.use_board(request.board):
+                return self._board_history_response(
+                    *BM.revert_board(request.version))
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.BoardHistoryResponse(
+                status="failure",
+                message=(f"Failed to revert to version {request.version} "
+                         f"due to: {e}")
+                )
+
+    def GetBoardHistory(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            with BM.use_board(request.board):
+                version, versions = BM.get_board_history()
+            return server_pb2.BoardHistoryResponse(
+                status="success",
+                version=version,
+                versions=[
+                    server_pb2.BoardHistoryEntry(
+                        version=number, description=description)
+                    for number, description in versions]
+                )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.BoardHistoryResponse(
+                status="failure",
+                message=f"Failed to get the board history due to: {e}"
+                )
+
+    @staticmethod
+    def _board_history_response(
+            version, devices, removed_devices, connections,
+            removed_connections):
+        return server_pb2.BoardHistoryResponse(
+            status="success",
+            version=version,
+            devices=devices,
+            removed_devices=removed_devices,
+            connections=connections,
+            removed_connections=removed_connections
+            )
+
+    def GetCompatiblePorts(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            # Catalog ports can be queried without an open board
+            with BM.use_board(request.board, required=False):
+                board_ports, catalog_ports = BM.get_compatible_ports(request)
+            return server_pb2.GetCompatiblePortsResponse(
+                status="success",
+                board_ports=board_ports,
+                catalog_ports=catalog_ports
+                )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.GetCompatiblePortsResponse(
+                status="failure",
+                message=f"Failed to find the compatible ports due to: {e}"
+                )
+
+    def CloseBoard(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            BM.close_board(request.board, save=request.save)
+            return server_pb2.CloseBoardResponse(
+                status="success"
+                )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.CloseBoardResponse(
+                status="failure",
+                message=f"Failed to close the board {request.board}: {e}"
+                )
+
+    def ListBoards(self, request, context):
+        BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
+        try:
+            return server_pb2.ListBoardsResponse(
+                status="success",
+                boards=[
+                    server_pb2.OpenBoardInfo(
+                        board=board,
+                        devices=devices,
+                        connections=connections,
+                        materialized_devices=materialized,
+                        unsaved_edits=unsaved_edits,
+                        active=active)
+                    for (board, devices, connections, materialized,
+                         unsaved_edits, active) in BM.list_boards()]
+                )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.ListBoardsResponse(
+                status="failure",
+                message=f"Failed to list the open boards due to: {e}"
+                )
+
+    def WatchCatalog(self, request, context):
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        try:
+            catalog = QM.start_catalog_watcher()
+        except Exception as e:
+            traceback.print_exc()
+            yield server_pb2.CatalogDelta(
+                message=f"Failed to start the catalog watcher: {e}"
+                )
+            return
+
+        subscription = catalog.subscribe()
+        try:
+            version = request.known_version
+            snapshot = catalog.snapshot()
+            if snapshot.version != version:
+                version = snapshot.version
+                yield snapshot
+            while context.is_active():
+                try:
+                    delta = subscription.get(timeout=1)
+                except queue.Empty:
+                    continue
+                # Deltas already contained in the snapshot are skipped
+                if delta.version <= version:
+                    continue
+                version = delta.version
+                yield delta
+        except Exception as e:
+            print(f"Catalog stream error: {e}")
+        finally:
+            catalog.unsubscribe(subscription)
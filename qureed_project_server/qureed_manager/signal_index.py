@@ -0,0 +1,184 @@
+import inspect
+import threading
+
+from qureed_project_server import server_pb2
+
+
+def signal_key(signal_class: type) -> str:
+    """
+    Gets the module.class notation of the signal class
+    """
+    return f"{signal_class.__module__}.{signal_class.__qualname__}"
+
+
+class SignalIndex:
+    """
+    SignalIndex maps every known signal class to its ancestors and
+    descendants, so that the compatibility of two signal types is a set
+    lookup instead of an `issubclass` check on the class objects.
+
+    Signals are identified by their module.class notation, which stays the
+    same when the defining module is reloaded. Signal types of the catalog
+    ports are only known by their class name, `by_name` resolves them.
+
+    Attributes:
+    -----------
+    base_class (type): Root of the signal hierarchy (GenericSignal)
+    classes (dict[str, type]): Signal classes by module.class
+    ancestors (dict[str, frozenset]): Ancestors of every signal, including
+        the signal itself
+    descendants (dict[str, set]): Descendants of every signal, including
+        the signal itself
+    by_name (dict[str, set]): module.class of the signals by class name
+
+    Methods:
+    --------
+    add(signal_class): Adds the signal class (and its ancestors)
+    remove(module_class): Removes the signal class
+    sync(signal_classes): Makes the index contain exactly the given classes
+    common_signal(signal_one, signal_two): Gets the more specific of two
+        compatible signals
+    compatible(signal_one, signal_two): Checks if two signals are compatible
+    compatible_with_name(signal, name): Checks if the signal is compatible
+        with a signal known only by its class name
+    get_signals(): Gets the messages of all indexed signals
+    """
+
+    def __init__(self, base_class: type):
+        self.base_class = base_class
+        self.classes = {}
+        self.ancestors = {}
+        self.descendants = {}
+        self.by_name = {}
+        self.lock = threading.RLock()
+
+    def is_signal_class(self, attr) -> bool:
+        """
+        Checks if the given attribute is a signal class
+        """
+        return inspect.isclass(attr) and (
+            issubclass(attr, self.base_class) or
+            signal_key(attr) == signal_key(self.base_class))
+
+    def add(self, signal_class: type) -> str:
+        """
+        Adds the signal class to the index, its ancestors are added as well
+
+        Parameters:
+        -----------
+        signal_class (type): The signal class
+
+        Returns:
+        --------
+        str: The module.class notation of the signal
+        """
+        key = signal_key(signal_class)
+        with self.lock:
+            if self.classes.get(key) is signal_class:
+                return key
+            if key in self.classes:
+                self.remove(key)
+            ancestors = set()
+            for cls in signal_class.__mro__:
+                if not self.is_signal_class(cls):
+                    continue
+                ancestor_key = signal_key(cls)
+                ancestors.add(ancestor_key)
+                if cls is not signal_class and ancestor_key not in self.classes:
+                    self.add(cls)
+            self.classes[key] = signal_class
+            self.ancestors[key] = frozenset(ancestors)
+            self.descendants.setdefault(key, set()).add(key)
+            for ancestor_key in ancestors:
+                self.descendants.setdefault(ancestor_key, set()).add(key)
+            self.by_name.setdefault(signal_class.__name__, set()).add(key)
+        return key
+
+    def remove(self, module_class: str) -> None:
+        """
+        Removes the signal from the index
+
+        Parameters:
+        -----------
+        module_class (str): The module.class notation of the signal
+        """
+        with self.lock:
+            signal_class = self.classes.pop(module_class, None)
+            if signal_class is None:
+                return
+            for ancestor_key in self.ancestors.pop(module_class, ()):
+                self.descendants.get(ancestor_key, set()).discard(
+                    module_class)
+            names = self.by_name.get(signal_class.__name__, set())
+            names.discard(module_class)
+            if not names:
+                self.by_name.pop(signal_class.__name__, None)
+
+    def sync(self, signal_classes: list[type]) -> None:
+        """
+        Updates the index so that it contains exactly the given signal
+        classes (and their ancestors), unchanged signals are not touched
+
+        Parameters:
+        -----------
+        signal_classes (list[type]): All currently known signal classes
+        """
+        with self.lock:
+            keys = {self.add(signal_class) for signal_class in signal_classes}
+            for signal_class in signal_classes:
+                keys |= self.ancestors[signal_key(signal_class)]
+            for key in list(self.classes):
+                if key not in keys:
+                    self.remove(key)
+
+    def common_signal(self, signal_one: type, signal_two: type) -> type | None:
+        """
+        Gets the more specific of the two signals if one is derived from the
+        other, None is returned if the hierarchies diverge
+
+        Parameters:
+        -----------
+        signal_one (type): First signal class
+        signal_two (type): Second signal class
+
+        Returns:
+        --------
+        Optional[type]: The more specific signal class
+        """
+        key_one = self.add(signal_one)
+        key_two = self.add(signal_two)
+        if key_two in self.ancestors[key_one]:
+            return signal_one
+        if key_one in self.ancestors[key_two]:
+            return signal_two
+        return None
+
+    def compatible(self, signal_one: str, signal_two: str) -> bool:
+        """
+        Checks if the two signals (given in the module.class notation) can
+        be connected
+        """
+        ancestors = self.ancestors.get(signal_one)
+        if ancestors is None:
+            return False
+        return (signal_two in ancestors or
+                signal_two in self.descendants.get(signal_one, ()))
+
+    def compatible_with_name(self, signal: str, name: str) -> bool:
+        """
+        Checks if the signal (given in the module.class notation) can be
+        connected to a signal known only by its class name
+        """
+        return any(
+            self.compatible(signal, candidate)
+            for candidate in self.by_name.get(name, ()))
+
+    def get_signals(self) -> list[server_pb2.Signal]:
+        """
+        Gets the messages of all indexed signals
+        """
+        with self.lock:
+            return [
+                server_pb2.Signal(module_class=key, name=cls.__qualname__)
+                for key, cls in self.classes.items()
+            ]
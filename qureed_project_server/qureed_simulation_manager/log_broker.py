@@ -0,0 +1,240 @@
+"""
+Distribution of the simulation logs to the log stream subscribers
+
+Every SimulationLogStream call subscribes to the broker with its own
+bounded queue, the submitted logs are published to all subscribers (the
+subscribers can filter by simulation_id). A subscriber which does not keep
+up never blocks the others: once its queue is full its oldest logs are
+dropped and it is downgraded (the tensors of its logs are reduced to ids,
+the values are fetched with GetTensor), once it dropped more than
+max_dropped_logs it is cut loose and its stream ends.
+"""
+import itertools
+import threading
+import time
+from collections import deque
+
+from qureed_project_server import server_pb2
+
+
+class LogSubscription:
+    """
+    LogSubscription is the queue of one log stream subscriber
+
+    Attributes:
+    -----------
+    subscriber_id (int): Id of the subscription
+    simulation_id (str): Only logs of this simulation are queued, all logs
+        if empty
+    max_queued_logs (int): Number of queued logs at which the oldest logs
+        are dropped
+    max_dropped_logs (int): Number of dropped logs at which the subscriber
+        is cut loose
+    queued (int): Number of queued logs
+    delivered (int): Number of logs taken by the subscriber
+    dropped (int): Number of dropped logs
+    max_lag (float): Longest time in seconds a log waited in the queue
+    downgraded (bool): The subscriber receives the logs without payloads
+    closed (bool): The subscription ended
+    close_reason (str): Why the subscription ended
+
+    Methods:
+    --------
+    put(logs, published_at, downgrade): Queues the logs of the subscriber
+    get(timeout): Takes the queued logs
+    lag(): Time in seconds the oldest queued log waits
+    close(reason): Ends the subscription
+    """
+
+    def __init__(self, subscriber_id: int, simulation_id: str = "",
+                 max_queued_logs: int = 10000,
+                 max_dropped_logs: int = 100000):
+        self.subscriber_id = subscriber_id
+        self.simulation_id = simulation_id
+        self.max_queued_logs = max(1, max_queued_logs)
+        self.max_dropped_logs = max_dropped_logs
+        self.queued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.max_lag = 0.0
+        self.downgraded = False
+        self.closed = False
+        self.close_reason = ""
+        self._batches = deque()
+        self._condition = threading.Condition()
+
+    def put(self, logs: list, published_at: float, downgrade=None) -> None:
+        """
+        Queues the logs of the subscriber, drops the oldest queued logs if
+        the queue is full, called by the publishing thread
+
+        Parameters:
+        -----------
+        logs (list[server_pb2.SimulationLog]): Published logs
+        published_at (float): Monotonic time of the publication
+        downgrade (Optional[Callable]): Gives the log without tensor values
+            for a downgraded subscriber, the logs are kept as they are if
+            not given
+        """
+        if self.simulation_id:
+            logs = [log for log in logs
+                    if log.simulation_id == self.simulation_id]
+        if not logs:
+            return
+        with self._condition:
+            if self.closed:
+                return
+            if self.downgraded and downgrade is not None:
+                logs = [downgrade(log) for log in logs]
+            self._batches.append((published_at, logs))
+            self.queued += len(logs)
+            while (self.queued > self.max_queued_logs and
+                   len(self._batches) > 1):
+                _, dropped = self._batches.popleft()
+                self.queued -= len(dropped)
+                self.dropped += len(dropped)
+                self.downgraded = True
+            if self.dropped > self.max_dropped_logs:
+                self._close(f"Subscriber dropped {self.dropped} logs, it "
+                            "does not keep up with the simulation")
+            self._condition.notify_all()
+
+    def get(self, timeout: float | None = None) -> list:
+        """
+        Takes the queued logs, waits up to timeout for logs
+
+        Returns:
+        --------
+        list[server_pb2.SimulationLog]: The logs, empty on timeout or once
+            the subscription is closed
+        """
+        with self._condition:
+            if not self._batches and not self.closed:
+                self._condition.wait(timeout)
+            if not self._batches:
+                return []
+            now = time.monotonic()
+            self.max_lag = max(self.max_lag, now - self._batches[0][0])
+            logs = []
+            for _, batch in self._batches:
+                logs.extend(batch)
+            self._batches.clear()
+            self.queued = 0
+            self.delivered += len(logs)
+            return logs
+
+    def lag(self) -> float:
+        with self._condition:
+            if not self._batches:
+                return 0.0
+            return time.monotonic() - self._batches[0][0]
+
+    def close(self, reason: str = "") -> None:
+        with self._condition:
+            self._close(reason)
+
+    def _close(self, reason: str) -> None:
+        # Holds the condition
+        if not self.closed:
+            self.closed = True
+            self.close_reason = reason
+            self._batches.clear()
+            self.queued = 0
+        self._condition.notify_all()
+
+
+class LogBroker:
+    """
+    LogBroker publishes the simulation logs to the subscribers
+
+    Attributes:
+    -----------
+    published (int): Number of published logs
+
+    Methods:
+    --------
+    subscribe(simulation_id, max_queued_logs, max_dropped_logs): Adds a
+        subscriber
+    unsubscribe(subscription): Removes the subscriber
+    has_subscribers(): Checks if anyone follows the logs
+    publish(logs): Queues the logs for every subscriber
+    subscriptions(): Lists the subscriptions
+    """
+
+    def __init__(self, keep_tensor=None):
+        """
+        Parameters:
+        -----------
+        keep_tensor (Optional[Callable]): Keeps a tensor and returns its id
+            (None if it can't be kept), used to send the tensors of
+            downgraded subscribers as ids
+        """
+        self.keep_tensor = keep_tensor
+        self.published = 0
+        self._subscriptions = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def subscribe(self, simulation_id: str = "",
+                  max_queued_logs: int = 10000,
+                  max_dropped_logs: int = 100000) -> LogSubscription:
+        subscription = LogSubscription(
+            next(self._ids), simulation_id, max_queued_logs,
+            max_dropped_logs)
+        with self._lock:
+            self._subscriptions[subscription.subscriber_id] = subscription
+        return subscription
+
+    def unsubscribe(self, subscription: LogSubscription) -> None:
+        subscription.close("Unsubscribed")
+        with self._lock:
+            self._subscriptions.pop(subscription.subscriber_id, None)
+
+    def has_subscribers(self) -> bool:
+        return bool(self._subscriptions)
+
+    def publish(self, logs: list) -> None:
+        """
+        Queues the logs for every subscriber, does not wait for the
+        subscribers
+        """
+        published_at = time.monotonic()
+        self.published += len(logs)
+        # The light logs are shared by the downgraded subscribers
+        light_logs = {}
+
+        def downgrade(log):
+            light = light_logs.get(id(log))
+            if light is None:
+                light = light_logs[id(log)] = _without_payload(
+                    log, self.keep_tensor)
+            return light
+
+        for subscription in self.subscriptions():
+            subscription.put(logs, published_at, downgrade)
+
+    def subscriptions(self) -> list[LogSubscription]:
+        with self._lock:
+            return list(self._subscriptions.values())
+
+
+def _without_payload(log: server_pb2.SimulationLog,
+                     keep_tensor=None) -> server_pb2.SimulationLog:
+    """
+    Copy of the log with the tensor reduced to its id: the tensor_id of a
+    preview, or the id under which keep_tensor stored the tensor. A tensor
+    which can't be kept is sent as it is.
+    """
+    if not log.HasField("tensor"):
+        return log
+    tensor_id = log.tensor.tensor_id
+    if not tensor_id and keep_tensor is not None:
+        tensor_id = keep_tensor(log.tensor)
+    if not tensor_id:
+        return log
+    light = server_pb2.SimulationLog()
+    light.CopyFrom(log)
+    light.tensor.Clear()
+    light.tensor.tensor_id = tensor_id
+    light.tensor.full_shape.extend(log.tensor.full_shape or log.tensor.shape)
+    return light
@@ -3,10 +3,17 @@ from pathlib import Path
 import sys
 import subprocess
 import threading
+import uuid
 
 from qureed_project_server.logic_modules import (
     LogicModuleEnum, LogicModuleHandler
 )
+from qureed_project_server.qureed_simulation_manager.log_broker import (
+    LogBroker
+)
+from qureed_project_server.qureed_simulation_manager.tensor_store import (
+    TensorStore
+)
 
 LMH = LogicModuleHandler()
 
@@ -34,6 +41,19 @@ class QuReedSimulationManager:
             self.port = None
             self.running_simulation = None
             self.simulation_servicer = None 
+            # Handling of the logs once the log queue of the simulation is
+            # full, see simulation.log_sender
+            self.log_policy = "block"
+            # Logged tensors larger than tensor_preview_bytes are forwarded
+            # as previews, the full tensors are kept in the tensor store
+            self.tensor_store = TensorStore()
+            self.max_tensor_store_bytes = 256 * 2**20
+            self.tensor_preview_bytes = 64 * 2**10
+            self.tensor_preview_elements = 4096
+            # Every log stream subscriber gets its own bounded queue
+            self.log_broker = LogBroker(keep_tensor=self.keep_tensor)
+            self.max_subscriber_logs = 10000
+            self.max_subscriber_dropped_logs = 100000
 
     def set_port(self, port):
         self.port = port
@@ -103,7 +123,8 @@ class QuReedSimulationManager:
             "--port", str(self.port),
             "--scheme", scheme,
             "--simulation-id", simulation_id,
-            "--duration", str(simulation_time)
+            "--duration", str(simulation_time),
+            "--log-policy", self.log_policy,
         ]
 
         env = {
@@ -155,3 +176,52 @@ class QuReedSimulationManager:
     def handle_simulation_end(self):
         print("ENDING THE SIMULATION -------")
         self.running_simulation = None
+
+    def publish_tensor(self, tensor):
+        """
+        Replaces a large logged tensor with its preview (single precision,
+        at most tensor_preview_elements values) and keeps the full tensor
+        in the tensor store
+
+        Parameters:
+        -----------
+        tensor (server_pb2.Tensor): Logged tensor, modified in place
+        """
+        if tensor.tensor_id or tensor.ByteSize() <= self.tensor_preview_bytes:
+            return
+        from qureed_project_server.utils.tensor_logging import (
+            message_from_tensor, preview_of_tensor, tensor_from_message
+        )
+        tensor_id = self.keep_tensor(tensor)
+        if tensor_id is None:
+            return
+        preview = message_from_tensor(preview_of_tensor(
+            tensor_from_message(tensor), self.tensor_preview_elements))
+        preview.tensor_id = tensor_id
+        preview.full_shape.extend(tensor.shape)
+        tensor.CopyFrom(preview)
+
+    def keep_tensor(self, tensor):
+        """
+        Keeps the tensor in the tensor store
+
+        Parameters:
+        -----------
+        tensor (server_pb2.Tensor): The tensor
+
+        Returns:
+        --------
+        Optional[str]: Id for GetTensor, None if the tensor exceeds the
+            store
+        """
+        tensor_id = uuid.uuid4().hex
+        if not self.tensor_store.put(
+                tensor_id, tensor, self.max_tensor_store_bytes):
+            return None
+        return tensor_id
+
+    def get_tensor(self, tensor_id):
+        """
+        Gets the full tensor of a preview, None if it is no longer kept
+        """
+        return self.tensor_store.get(tensor_id)
@@ -1,5 +1,4 @@
 import traceback
-import queue
 import time
 
 from qureed_project_server import server_pb2_grpc, server_pb2
@@ -46,33 +45,125 @@ class QuReedSimulationServicer(server_pb2_grpc.QuReedSimulationServicer):
         pass
 
     def SimulationLogSubmission(self, request, context):
-        SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
-        if hasattr(self, "log_handler"):
-            self.log_handler(request.log)
+        self._forward_logs([request.log])
+        return server_pb2.SubmitSimulationLogResponse(received=1)
 
+    def SimulationLogBatchSubmission(self, request_iterator, context):
+        """
+        Receives the logs of a simulation in batches, each batch is handed
+        to the log stream in one step
+        """
+        received = 0
+        try:
+            for batch in request_iterator:
+                if batch.logs:
+                    self._forward_logs(list(batch.logs))
+                    received += len(batch.logs)
+        except Exception:
+            traceback.print_exc()
+        return server_pb2.SubmitSimulationLogResponse(received=received)
 
-    def SimulationLogStream(self, request, context):
-        log_queue = queue.Queue()
+    def _forward_logs(self, logs):
+        SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
+        if SiM.log_broker.has_subscribers():
+            for log in logs:
+                if log.HasField("tensor"):
+                    SiM.publish_tensor(log.tensor)
+            SiM.log_broker.publish(logs)
+        if any(log.end for log in logs):
+            SiM.handle_simulation_end()
 
-        def log_handler(message):
-            log_queue.put(message)
+    def GetTensor(self, request, context):
+        try:
+            SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
+            tensor = SiM.get_tensor(request.tensor_id)
+            if tensor is None:
+                return server_pb2.GetTensorResponse(
+                    status="failure",
+                    message=f"Tensor {request.tensor_id} is no longer kept"
+                )
+            return server_pb2.GetTensorResponse(
+                status="success",
+                tensor=tensor
+            )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.GetTensorResponse(
+                status="failure",
+                message=f"Getting the tensor failed due to: {e}"
+            )
 
-        self.log_handler = log_handler
+    def SimulationLogStream(self, request, context):
+        SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
+        subscription = SiM.log_broker.subscribe(
+            request.simulation_id,
+            max_queued_logs=SiM.max_subscriber_logs,
+            max_dropped_logs=SiM.max_subscriber_dropped_logs)
+        reported_drops = 0
 
         try:
-            while context.is_active():
-                try:
-                    log_message = log_queue.get(timeout=1)
+            while context.is_active() and not subscription.closed:
+                logs = subscription.get(timeout=1)
+                if subscription.dropped > reported_drops:
+                    logs.insert(0, server_pb2.SimulationLog(
+                        log_type="warning",
+                        message=(
+                            f"{subscription.dropped - reported_drops} logs "
+                            "dropped, the stream is too slow (tensors are "
+                            "sent as ids from now on)"),
+                        simulation_id=request.simulation_id,
+                    ))
+                    reported_drops = subscription.dropped
+                if not logs:
+                    continue
+                if request.batched:
                     yield server_pb2.SimulationLogStreamResponse(
-                        log=log_message
+                        logs=logs
+                    )
+                else:
+                    for log_message in logs:
+                        yield server_pb2.SimulationLogStreamResponse(
+                            log=log_message
+                        )
+                if not request.keep_open and any(
+                        log_message.end for log_message in logs):
+                    break
+            if subscription.close_reason:
+                yield server_pb2.SimulationLogStreamResponse(
+                    log=server_pb2.SimulationLog(
+                        log_type="error",
+                        message=subscription.close_reason,
+                        simulation_id=request.simulation_id,
                     )
-                    if log_message.end:
-                        SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
-                        SiM.handle_simulation_end()
-                        break
-                except queue.Empty:
-                    pass
+                )
         except Exception as e:
             print(f"Log streame error: {e}")
         finally:
-            self.log_handler = None
+            SiM.log_broker.unsubscribe(subscription)
+
+    def ListLogSubscribers(self, request, context):
+        try:
+            SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
+            return server_pb2.ListLogSubscribersResponse(
+                status="success",
+                published=SiM.log_broker.published,
+                subscribers=[
+                    server_pb2.LogSubscriberInfo(
+                        subscriber_id=subscription.subscriber_id,
+                        simulation_id=subscription.simulation_id,
+                        queued=subscription.queued,
+                        delivered=subscription.delivered,
+                        dropped=subscription.dropped,
+                        lag=subscription.lag(),
+                        max_lag=subscription.max_lag,
+                        downgraded=subscription.downgraded,
+                    )
+                    for subscription in SiM.log_broker.subscriptions()
+                ]
+            )
+        except Exception as e:
+            traceback.print_exc()
+            return server_pb2.ListLogSubscribersResponse(
+                status="failure",
+                message=f"Listing the log subscribers failed due to: {e}"
+            )
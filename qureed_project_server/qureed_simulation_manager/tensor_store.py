@@ -0,0 +1,71 @@
+"""
+Full-precision tensors of the logged previews
+
+Large logged tensors are forwarded to the GUI as previews (see
+QuReedSimulationManager.publish_tensor), the server keeps the full tensors
+so they can be fetched by id with GetTensor. The store is bounded by the
+serialized size of the kept tensors, the least recently used tensors are
+evicted first.
+"""
+import threading
+from collections import OrderedDict
+
+from qureed_project_server import server_pb2
+
+
+class TensorStore:
+    """
+    TensorStore keeps serialized Tensor messages by id
+
+    Attributes:
+    -----------
+    stored_bytes (int): Serialized size of the kept tensors
+    evicted (int): Number of evicted tensors
+
+    Methods:
+    --------
+    put(tensor_id, tensor, max_bytes): Keeps the tensor
+    get(tensor_id): Gets the tensor, None if it was evicted
+    clear(): Drops all tensors
+    """
+
+    def __init__(self):
+        self.stored_bytes = 0
+        self.evicted = 0
+        self._tensors = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, tensor_id: str, tensor: server_pb2.Tensor,
+            max_bytes: int) -> bool:
+        """
+        Keeps the tensor, evicts the least recently used tensors to stay
+        within max_bytes
+
+        Returns:
+        --------
+        bool: False if the tensor alone exceeds max_bytes (not kept)
+        """
+        data = tensor.SerializeToString()
+        if len(data) > max_bytes:
+            return False
+        with self._lock:
+            self._tensors[tensor_id] = data
+            self.stored_bytes += len(data)
+            while self.stored_bytes > max_bytes:
+                _, evicted = self._tensors.popitem(last=False)
+                self.stored_bytes -= len(evicted)
+                self.evicted += 1
+        return True
+
+    def get(self, tensor_id: str) -> server_pb2.Tensor | None:
+        with self._lock:
+            data = self._tensors.get(tensor_id)
+            if data is None:
+                return None
+            self._tensors.move_to_end(tensor_id)
+        return server_pb2.Tensor.FromString(data)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tensors.clear()
+            self.stored_bytes = 0
@@ -1,33 +1,122 @@
 from concurrent import futures
 import argparse
+import importlib
+import threading
 import grpc
 
 from qureed_project_server import server_pb2_grpc
-from qureed_project_server.venv_management import VenvManagementServicer
 from qureed_project_server.server_management import ServerManagementServicer
-from qureed_project_server.qureed_manager import QuReemManagementService
-from qureed_project_server.qureed_simulation_manager import QuReedSimulationServicer
 from qureed_project_server.logic_modules import (
     LogicModuleEnum, LogicModuleHandler
 )
 
+LMH = LogicModuleHandler()
 
 
-def serve(port):
+class LazyServicer:
+    """
+    LazyServicer stands in for a servicer whose module (and with it its
+    dependencies) is imported only when the first of its RPCs is called.
+    This lets the server bind its port and answer `Status` right away.
+
+    Attributes:
+    -----------
+    module_name (str): Module defining the servicer
+    class_name (str): Name of the servicer class
+    on_load (Optional[callable]): Called with the servicer once it is created
+    """
+
+    def __init__(self, module_name: str, class_name: str, on_load=None):
+        self._module_name = module_name
+        self._class_name = class_name
+        self._on_load = on_load
+        self._servicer = None
+        self._lock = threading.Lock()
+
+    def load(self):
+        """
+        Imports the module and creates the servicer (once)
+        """
+        if self._servicer is None:
+            with self._lock:
+                if self._servicer is None:
+                    module = importlib.import_module(self._module_name)
+                    servicer = getattr(module, self._class_name)()
+                    if self._on_load is not None:
+                        self._on_load(servicer)
+                    self._servicer = servicer
+        return self._servicer
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def rpc(request, context):
+            return getattr(self.load(), name)(request, context)
+        rpc.__name__ = name
+        return rpc
+
+
+def warm_up(servicers: list[LazyServicer]) -> None:
+    """
+    Imports the servicers, qureed and the builtin device modules in the
+    background after the server started accepting connections
+    """
+    try:
+        for servicer in servicers:
+            servicer.load()
+        QM = LMH.get_logic(LogicModuleEnum.QUREED_MANAGER)
+        QM.warm_up()
+        print("Warm-up finished")
+    except Exception as e:
+        print(f"Warm-up failed: {e}")
+
+
+def serve(port, discovery_workers=0, warm_up_server=False,
+          max_materialized_boards=4, max_materialized_devices=None,
+          simulation_log_policy="block", tensor_preview_bytes=64 * 2**10,
+          tensor_preview_elements=4096, max_tensor_store_bytes=256 * 2**20,
+          max_subscriber_logs=10000, max_subscriber_dropped_logs=100000):
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
 
-    SiM = LogicModuleHandler().get_logic(LogicModuleEnum.SIMULATION_MANAGER)
-    sim_servicer = QuReedSimulationServicer()
-    SiM.register_simulation_servicer(sim_servicer)
+    LMH.configure(
+        LogicModuleEnum.QUREED_MANAGER, discovery_workers=discovery_workers)
+    LMH.configure(
+        LogicModuleEnum.BOARD_MANAGER,
+        max_materialized_boards=max_materialized_boards,
+        max_materialized_devices=max_materialized_devices)
+    LMH.configure(
+        LogicModuleEnum.SIMULATION_MANAGER,
+        log_policy=simulation_log_policy,
+        tensor_preview_bytes=tensor_preview_bytes,
+        tensor_preview_elements=tensor_preview_elements,
+        max_tensor_store_bytes=max_tensor_store_bytes,
+        max_subscriber_logs=max_subscriber_logs,
+        max_subscriber_dropped_logs=max_subscriber_dropped_logs)
+
+    def register_simulation_servicer(servicer):
+        SiM = LMH.get_logic(LogicModuleEnum.SIMULATION_MANAGER)
+        SiM.register_simulation_servicer(servicer)
+        SiM.set_port(port)
+
+    venv_servicer = LazyServicer(
+        "qureed_project_server.venv_management", "VenvManagementServicer")
+    qureed_servicer = LazyServicer(
+        "qureed_project_server.qureed_manager", "QuReemManagementService")
+    sim_servicer = LazyServicer(
+        "qureed_project_server.qureed_simulation_manager",
+        "QuReedSimulationServicer",
+        on_load=register_simulation_servicer)
+
     # Add services to the server
     server_pb2_grpc.add_ServerManagementServicer_to_server(
         ServerManagementServicer(server), server
     )
     server_pb2_grpc.add_VenvManagementServicer_to_server(
-        VenvManagementServicer(), server
+        venv_servicer, server
     )
     server_pb2_grpc.add_QuReedManagementServicer_to_server(
-        QuReemManagementService(), server
+        qureed_servicer, server
     )
     server_pb2_grpc.add_QuReedSimulationServicer_to_server(
         sim_servicer, server
@@ -37,18 +126,69 @@ def serve(port):
     server.add_insecure_port(f"127.0.0.1:{port}")
     print(f"BINDING TO 127.0.0.1::{port}")
 
-    SiM.set_port(port)
     server.start()
     print(f"Server started on port {port}")
+    if warm_up_server:
+        threading.Thread(
+            target=warm_up,
+            args=([venv_servicer, qureed_servicer, sim_servicer],),
+            daemon=True).start()
     server.wait_for_termination()
 
 
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--port", type=int, required=True)
+    parser.add_argument(
+        "--discovery-workers", type=int, default=0,
+        help="Number of processes used to discover devices (0: serial)")
+    parser.add_argument(
+        "--warm-up", action="store_true",
+        help="Import qureed and the device modules in the background "
+             "once the server is accepting connections")
+    parser.add_argument(
+        "--max-materialized-boards", type=int, default=4,
+        help="Number of open boards which keep their constructed devices, "
+             "the least recently used boards fall back to records")
+    parser.add_argument(
+        "--max-materialized-devices", type=int, default=None,
+        help="Number of constructed devices kept over all open boards "
+             "(default: no limit)")
+    parser.add_argument(
+        "--simulation-log-policy", default="block",
+        choices=["block", "drop-oldest", "drop-newest", "coalesce"],
+        help="Handling of the simulation logs once the log queue of the "
+             "simulation is full")
+    parser.add_argument(
+        "--tensor-preview-bytes", type=int, default=64 * 2**10,
+        help="Logged tensors larger than this are sent to the GUI as "
+             "previews, the full tensors are fetched with GetTensor")
+    parser.add_argument(
+        "--tensor-preview-elements", type=int, default=4096,
+        help="Number of values of a tensor preview")
+    parser.add_argument(
+        "--tensor-store-bytes", type=int, default=256 * 2**20,
+        help="Size of the full tensors kept for the previews")
+    parser.add_argument(
+        "--max-subscriber-logs", type=int, default=10000,
+        help="Number of logs queued for a log stream subscriber, the oldest "
+             "logs of a slower subscriber are dropped")
+    parser.add_argument(
+        "--max-subscriber-dropped-logs", type=int, default=100000,
+        help="Number of dropped logs at which a log stream subscriber is "
+             "disconnected")
     args = parser.parse_args()
 
-    serve(args.port)
+    serve(args.port, discovery_workers=args.discovery_workers,
+          warm_up_server=args.warm_up,
+          max_materialized_boards=args.max_materialized_boards,
+          max_materialized_devices=args.max_materialized_devices,
+          simulation_log_policy=args.simulation_log_policy,
+          tensor_preview_bytes=args.tensor_preview_bytes,
+          tensor_preview_elements=args.tensor_preview_elements,
+          max_tensor_store_bytes=args.tensor_store_bytes,
+          max_subscriber_logs=args.max_subscriber_logs,
+          max_subscriber_dropped_logs=args.max_subscriber_dropped_logs)
 
 
 if __name__ == "__main__":
@@ -25,13 +25,15 @@ _sym_db = _symbol_database.Default()
 from google.protobuf import struct_pb2 as google_dot_protobuf_dot_struct__pb2
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cserver.proto\x12\x15qureed_project_server\x1a\x1cgoogle/protobuf/struct.proto\"\x0f\n\rStatusRequest\"1\n\x0eStatusResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x12\n\x10TerminateRequest\"4\n\x11TerminateResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\'\n\x12VenvConnectRequest\x12\x11\n\tvenv_path\x18\x01 \x01(\t\"6\n\x13VenvConnectResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x0f\n\rFreezeRequest\"C\n\x0e\x46reezeResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x10\n\x08packages\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"!\n\x0eInstallRequest\x12\x0f\n\x07package\x18\x01 \x01(\t\"2\n\x0fInstallResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"#\n\x10UninstallRequest\x12\x0f\n\x07package\x18\x01 \x01(\t\"4\n\x11UninstallResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1e\n\x0eGetIconRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\"1\n\x0fGetIconResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x61\x62s_path\x18\x02 \x01(\t\"\x11\n\x0fGetIconsRequest\"\x97\x01\n\x10GetIconsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12&\n\x05icons\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12:\n\nicons_list\x18\x03 \x03(\x0b\x32&.qureed_project_server.GetIconResponse\x12\x0f\n\x07message\x18\x04 \x01(\t\",\n\x06Signal\x12\x14\n\x0cmodule_class\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x13\n\x11GetSignalsRequest\"e\n\x12GetSignalsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x07signals\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Signal\"?\n\x10\x44\x65viceProperties\x12+\n\nproperties\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\"\x8c\x01\n\nConnection\x12\x17\n\x0f\x64\x65vice_one_uuid\x18\x01 \x01(\t\x12\x17\n\x0f\x64\x65vice_two_uuid\x18\x02 \x01(\t\x12\x1d\n\x15\x64\x65vice_one_port_label\x18\x03 \x01(\t\x12\x1d\n\x15\x64\x65vice_two_port_label\x18\x04 \x01(\t\x12\x0e\n\x06signal\x18\x05 \x01(\t\"=\n\x04Port\x12\r\n\x05label\x18\x01 \x01(\t\x12\x13\n\x0bsignal_type\x18\x02 \x01(\t\x12\x11\n\tdirection\x18\x03 \x01(\t\"\x9c\x02\n\x06\x44\x65vice\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\x10\n\x08gui_name\x18\x02 \x01(\t\x12\x14\n\x0cmodule_class\x18\x03 \x01(\t\x12*\n\x05ports\x18\x04 \x03(\x0b\x32\x1b.qureed_project_server.Port\x12\x0c\n\x04uuid\x18\x05 \x01(\t\x12\x42\n\x11\x64\x65vice_properties\x18\x06 \x01(\x0b\x32\'.qureed_project_server.DeviceProperties\x12\x10\n\x08location\x18\x07 \x03(\x02\x12\x10\n\x08gui_tags\x18\x08 \x03(\t\x12\x34\n\x04icon\x18\t \x01(\x0b\x32&.qureed_project_server.GetIconResponse\"F\n\x15GenerateDeviceRequest\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\"9\n\x16GenerateDeviceResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x13\n\x11GetDevicesRequest\"e\n\x12GetDevicesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x07\x64\x65vices\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Device\"Q\n\x10GetDeviceRequest\x12\x14\n\x0cmodule_class\x18\x01 \x01(\t\x12\x12\n\nclass_name\x18\x02 \x01(\t\x12\x13\n\x0bmodule_path\x18\x03 \x01(\t\"c\n\x11GetDeviceResponse\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\"!\n\x10OpenBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\"\x9c\x01\n\x11OpenBoardResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x07\x64\x65vices\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x36\n\x0b\x63onnections\x18\x04 \x03(\x0b\x32!.qureed_project_server.Connection\"\x89\x01\n\x10SaveBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\x12.\n\x07\x64\x65vices\x18\x02 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x36\n\x0b\x63onnections\x18\x03 \x03(\x0b\x32!.qureed_project_server.Connection\"4\n\x11SaveBoardResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"A\n\x10\x41\x64\x64\x44\x65viceRequest\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\"I\n\x11\x41\x64\x64\x44\x65viceResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65vice_uuid\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"*\n\x13RemoveDeviceRequest\x12\x13\n\x0b\x64\x65vice_uuid\x18\x01 \x01(\t\"7\n\x14RemoveDeviceResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"s\n\x15\x43onnectDevicesRequest\x12\x15\n\rdevice_uuid_1\x18\x01 \x01(\t\x12\x15\n\rdevice_port_1\x18\x02 \x01(\t\x12\x15\n\rdevice_uuid_2\x18\x03 \x01(\t\x12\x15\n\rdevice_port_2\x18\x04 \x01(\t\"9\n\x16\x43onnectDevicesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"v\n\x18\x44isconnectDevicesRequest\x12\x15\n\rdevice_uuid_1\x18\x01 \x01(\t\x12\x15\n\rdevice_port_1\x18\x02 \x01(\t\x12\x15\n\rdevice_uuid_2\x18\x03 \x01(\t\x12\x15\n\rdevice_port_2\x18\x04 \x01(\t\"<\n\x19\x44isconnectDevicesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"N\n\x1dUpdateDevicePropertiesRequest\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\"A\n\x1eUpdateDevicePropertiesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"]\n\x16StartSimulationRequest\x12\x13\n\x0bscheme_path\x18\x01 \x01(\t\x12\x15\n\rsimulation_id\x18\x02 \x01(\t\x12\x17\n\x0fsimulation_time\x18\x03 \x01(\x02\":\n\x17StartSimulationResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x17\n\x15StopSimulationRequest\"9\n\x16StopSimulationResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1a\n\x18SimulationLoggingRequest\"A\n\x06Tensor\x12\x13\n\x0breal_values\x18\x01 \x03(\x01\x12\x13\n\x0bimag_values\x18\x02 \x03(\x01\x12\r\n\x05shape\x18\x03 \x03(\x05\"\xff\x01\n\rSimulationLog\x12\x11\n\ttimestamp\x18\x01 \x01(\x02\x12\x1c\n\x14simulation_timestamp\x18\x02 \x01(\x02\x12\x10\n\x08log_type\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65vice_name\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65vice_type\x18\x05 \x01(\t\x12\x0f\n\x07message\x18\x06 \x01(\t\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x12\x15\n\rsimulation_id\x18\x08 \x01(\t\x12\x0b\n\x03\x65nd\x18\t \x01(\x08\x12-\n\x06tensor\x18\x0b \x01(\x0b\x32\x1d.qureed_project_server.Tensor\x12\x0e\n\x06\x66igure\x18\x0c \x01(\t\"o\n\x19SimulationLoggingResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x31\n\x03log\x18\x03 \x01(\x0b\x32$.qureed_project_server.SimulationLog\"\x1b\n\x19PerformanceLoggingRequest\"K\n\x0ePerformanceLog\x12\x10\n\x08used_ram\x18\x01 \x01(\x02\x12\x15\n\ravailable_ram\x18\x02 \x01(\x02\x12\x10\n\x08used_cpu\x18\x03 \x01(\x02\"q\n\x1aPerformanceLoggingResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x32\n\x03log\x18\x03 \x01(\x0b\x32%.qureed_project_server.PerformanceLog\"O\n\x1aSubmitSimulationLogRequest\x12\x31\n\x03log\x18\x01 \x01(\x0b\x32$.qureed_project_server.SimulationLog\"\x1d\n\x1bSubmitSimulationLogResponse\"\x1c\n\x1aSimulationLogStreamRequest\"P\n\x1bSimulationLogStreamResponse\x12\x31\n\x03log\x18\x01 \x01(\x0b\x32$.qureed_project_server.SimulationLog2\xc9\x01\n\x10ServerManagement\x12U\n\x06Status\x12$.qureed_project_server.StatusRequest\x1a%.qureed_project_server.StatusResponse\x12^\n\tTerminate\x12\'.qureed_project_server.TerminateRequest\x1a(.qureed_project_server.TerminateResponse2\x83\x03\n\x0eVenvManagement\x12`\n\x07\x43onnect\x12).qureed_project_server.VenvConnectRequest\x1a*.qureed_project_server.VenvConnectResponse\x12U\n\x06\x46reeze\x12$.qureed_project_server.FreezeRequest\x1a%.qureed_project_server.FreezeResponse\x12X\n\x07Install\x12%.qureed_project_server.InstallRequest\x1a&.qureed_project_server.InstallResponse\x12^\n\tUninstall\x12\'.qureed_project_server.UninstallRequest\x1a(.qureed_project_server.UninstallResponse2\xd7\n\n\x10QuReedManagement\x12[\n\x08GetIcons\x12&.qureed_project_server.GetIconsRequest\x1a\'.qureed_project_server.GetIconsResponse\x12X\n\x07GetIcon\x12%.qureed_project_server.GetIconRequest\x1a&.qureed_project_server.GetIconResponse\x12\x61\n\nGetDevices\x12(.qureed_project_server.GetDevicesRequest\x1a).qureed_project_server.GetDevicesResponse\x12^\n\tGetDevice\x12\'.qureed_project_server.GetDeviceRequest\x1a(.qureed_project_server.GetDeviceResponse\x12\x61\n\nGetSignals\x12(.qureed_project_server.GetSignalsRequest\x1a).qureed_project_server.GetSignalsResponse\x12^\n\tOpenBoard\x12\'.qureed_project_server.OpenBoardRequest\x1a(.qureed_project_server.OpenBoardResponse\x12^\n\tSaveBoard\x12\'.qureed_project_server.SaveBoardRequest\x1a(.qureed_project_server.SaveBoardResponse\x12^\n\tAddDevice\x12\'.qureed_project_server.AddDeviceRequest\x1a(.qureed_project_server.AddDeviceResponse\x12g\n\x0cRemoveDevice\x12*.qureed_project_server.RemoveDeviceRequest\x1a+.qureed_project_server.RemoveDeviceResponse\x12m\n\x0e\x43onnectDevices\x12,.qureed_project_server.ConnectDevicesRequest\x1a-.qureed_project_server.ConnectDevicesResponse\x12v\n\x11\x44isconnectDevices\x12/.qureed_project_server.DisconnectDevicesRequest\x1a\x30.qureed_project_server.DisconnectDevicesResponse\x12n\n\x0fGenerateDevices\x12,.qureed_project_server.GenerateDeviceRequest\x1a-.qureed_project_server.GenerateDeviceResponse\x12\x85\x01\n\x16UpdateDeviceProperties\x12\x34.qureed_project_server.UpdateDevicePropertiesRequest\x1a\x35.qureed_project_server.UpdateDevicePropertiesResponse2\xe8\x05\n\x10QuReedSimulation\x12p\n\x0fStartSimulation\x12-.qureed_project_server.StartSimulationRequest\x1a..qureed_project_server.StartSimulationResponse\x12m\n\x0eStopSimulation\x12,.qureed_project_server.StopSimulationRequest\x1a-.qureed_project_server.StopSimulationResponse\x12v\n\x11SimulationLogging\x12/.qureed_project_server.SimulationLoggingRequest\x1a\x30.qureed_project_server.SimulationLoggingResponse\x12x\n\x11PerfomanceLogging\x12\x30.qureed_project_server.PerformanceLoggingRequest\x1a\x31.qureed_project_server.PerformanceLoggingResponse\x12\x80\x01\n\x17SimulationLogSubmission\x12\x31.qureed_project_server.SubmitSimulationLogRequest\x1a\x32.qureed_project_server.SubmitSimulationLogResponse\x12~\n\x13SimulationLogStream\x12\x31.qureed_project_server.SimulationLogStreamRequest\x1a\x32.qureed_project_server.SimulationLogStreamResponse0\x01\x62\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0cserver.proto\x12\x15qureed_project_server\x1a\x1cgoogle/protobuf/struct.proto\"\x0f\n\rStatusRequest\"1\n\x0eStatusResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x12\n\x10TerminateRequest\"4\n\x11TerminateResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\'\n\x12VenvConnectRequest\x12\x11\n\tvenv_path\x18\x01 \x01(\t\"6\n\x13VenvConnectResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x0f\n\rFreezeRequest\"C\n\x0e\x46reezeResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x10\n\x08packages\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"!\n\x0eInstallRequest\x12\x0f\n\x07package\x18\x01 \x01(\t\"2\n\x0fInstallResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"#\n\x10UninstallRequest\x12\x0f\n\x07package\x18\x01 \x01(\t\"4\n\x11UninstallResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"2\n\x0eGetIconRequest\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x12\n\nknown_hash\x18\x02 \x01(\t\"\x81\x01\n\x0fGetIconResponse\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x10\n\x08\x61\x62s_path\x18\x02 \x01(\t\x12\x0c\n\x04hash\x18\x03 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x12\x11\n\tunchanged\x18\x05 \x01(\x08\x12\x0e\n\x06status\x18\x06 \x01(\t\x12\x0f\n\x07message\x18\x07 \x01(\t\"\x9c\x01\n\x13GetIconsBulkRequest\x12Q\n\x0cknown_hashes\x18\x01 \x03(\x0b\x32;.qureed_project_server.GetIconsBulkRequest.KnownHashesEntry\x1a\x32\n\x10KnownHashesEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\x11\n\x0fGetIconsRequest\"\x97\x01\n\x10GetIconsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12&\n\x05icons\x18\x02 \x01(\x0b\x32\x17.google.protobuf.Struct\x12:\n\nicons_list\x18\x03 \x03(\x0b\x32&.qureed_project_server.GetIconResponse\x12\x0f\n\x07message\x18\x04 \x01(\t\",\n\x06Signal\x12\x14\n\x0cmodule_class\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x13\n\x11GetSignalsRequest\"e\n\x12GetSignalsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x07signals\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Signal\"?\n\x10\x44\x65viceProperties\x12+\n\nproperties\x18\x01 \x01(\x0b\x32\x17.google.protobuf.Struct\"\x8c\x01\n\nConnection\x12\x17\n\x0f\x64\x65vice_one_uuid\x18\x01 \x01(\t\x12\x17\n\x0f\x64\x65vice_two_uuid\x18\x02 \x01(\t\x12\x1d\n\x15\x64\x65vice_one_port_label\x18\x03 \x01(\t\x12\x1d\n\x15\x64\x65vice_two_port_label\x18\x04 \x01(\t\x12\x0e\n\x06signal\x18\x05 \x01(\t\"=\n\x04Port\x12\r\n\x05label\x18\x01 \x01(\t\x12\x13\n\x0bsignal_type\x18\x02 \x01(\t\x12\x11\n\tdirection\x18\x03 \x01(\t\"\x9c\x02\n\x06\x44\x65vice\x12\x12\n\nclass_name\x18\x01 \x01(\t\x12\x10\n\x08gui_name\x18\x02 \x01(\t\x12\x14\n\x0cmodule_class\x18\x03 \x01(\t\x12*\n\x05ports\x18\x04 \x03(\x0b\x32\x1b.qureed_project_server.Port\x12\x0c\n\x04uuid\x18\x05 \x01(\t\x12\x42\n\x11\x64\x65vice_properties\x18\x06 \x01(\x0b\x32\'.qureed_project_server.DeviceProperties\x12\x10\n\x08location\x18\x07 \x03(\x02\x12\x10\n\x08gui_tags\x18\x08 \x03(\t\x12\x34\n\x04icon\x18\t \x01(\x0b\x32&.qureed_project_server.GetIconResponse\"F\n\x15GenerateDeviceRequest\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\"9\n\x16GenerateDeviceResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x9b\x01\n\x11GetDevicesRequest\x12\x13\n\x0bname_prefix\x18\x01 \x01(\t\x12\x0c\n\x04tags\x18\x02 \x03(\t\x12\x13\n\x0bsignal_type\x18\x03 \x01(\t\x12\x11\n\tdirection\x18\x04 \x01(\t\x12\x11\n\tpage_size\x18\x05 \x01(\r\x12\x12\n\npage_token\x18\x06 \x01(\t\x12\x14\n\x0csummary_only\x18\x07 \x01(\x08\"\x92\x01\n\x12GetDevicesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x07\x64\x65vices\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x17\n\x0fnext_page_token\x18\x04 \x01(\t\x12\x12\n\ntotal_size\x18\x05 \x01(\r\"Q\n\x10GetDeviceRequest\x12\x14\n\x0cmodule_class\x18\x01 \x01(\t\x12\x12\n\nclass_name\x18\x02 \x01(\t\x12\x13\n\x0bmodule_path\x18\x03 \x01(\t\"c\n\x11GetDeviceResponse\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0e\n\x06status\x18\x03 \x01(\t\"1\n\x10OpenBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\x12\x0e\n\x06reload\x18\x02 \x01(\x08\"\xaa\x01\n\x11OpenBoardResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12.\n\x07\x64\x65vices\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x36\n\x0b\x63onnections\x18\x04 \x03(\x0b\x32!.qureed_project_server.Connection\x12\x0c\n\x04\x64one\x18\x05 \x01(\x08\"K\n\x16OpenBoardStreamRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\x12\x12\n\nchunk_size\x18\x02 \x01(\r\x12\x0e\n\x06reload\x18\x03 \x01(\x08\"\x89\x01\n\x10SaveBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\x12.\n\x07\x64\x65vices\x18\x02 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x36\n\x0b\x63onnections\x18\x03 \x03(\x0b\x32!.qureed_project_server.Connection\"4\n\x11SaveBoardResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"P\n\x10\x41\x64\x64\x44\x65viceRequest\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\x12\r\n\x05\x62oard\x18\x02 \x01(\t\"I\n\x11\x41\x64\x64\x44\x65viceResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65vice_uuid\x18\x02 \x01(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"9\n\x13RemoveDeviceRequest\x12\x13\n\x0b\x64\x65vice_uuid\x18\x01 \x01(\t\x12\r\n\x05\x62oard\x18\x02 \x01(\t\"7\n\x14RemoveDeviceResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x82\x01\n\x15\x43onnectDevicesRequest\x12\x15\n\rdevice_uuid_1\x18\x01 \x01(\t\x12\x15\n\rdevice_port_1\x18\x02 \x01(\t\x12\x15\n\rdevice_uuid_2\x18\x03 \x01(\t\x12\x15\n\rdevice_port_2\x18\x04 \x01(\t\x12\r\n\x05\x62oard\x18\x05 \x01(\t\"9\n\x16\x43onnectDevicesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x85\x01\n\x18\x44isconnectDevicesRequest\x12\x15\n\rdevice_uuid_1\x18\x01 \x01(\t\x12\x15\n\rdevice_port_1\x18\x02 \x01(\t\x12\x15\n\rdevice_uuid_2\x18\x03 \x01(\t\x12\x15\n\rdevice_port_2\x18\x04 \x01(\t\x12\r\n\x05\x62oard\x18\x05 \x01(\t\"<\n\x19\x44isconnectDevicesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"]\n\x1dUpdateDevicePropertiesRequest\x12-\n\x06\x64\x65vice\x18\x01 \x01(\x0b\x32\x1d.qureed_project_server.Device\x12\r\n\x05\x62oard\x18\x02 \x01(\t\"A\n\x1eUpdateDevicePropertiesResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x89\x03\n\tBoardEdit\x12=\n\nadd_device\x18\x01 \x01(\x0b\x32\'.qureed_project_server.AddDeviceRequestH\x00\x12\x43\n\rremove_device\x18\x02 \x01(\x0b\x32*.qureed_project_server.RemoveDeviceRequestH\x00\x12G\n\x0f\x63onnect_devices\x18\x03 \x01(\x0b\x32,.qureed_project_server.ConnectDevicesRequestH\x00\x12M\n\x12\x64isconnect_devices\x18\x04 \x01(\x0b\x32/.qureed_project_server.DisconnectDevicesRequestH\x00\x12X\n\x18update_device_properties\x18\x05 \x01(\x0b\x32\x34.qureed_project_server.UpdateDevicePropertiesRequestH\x00\x42\x06\n\x04\x65\x64it\"G\n\x0f\x42oardEditResult\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65vice_uuid\x18\x03 \x01(\t\"X\n\x16\x41pplyBoardEditsRequest\x12/\n\x05\x65\x64its\x18\x01 \x03(\x0b\x32 .qureed_project_server.BoardEdit\x12\r\n\x05\x62oard\x18\x02 \x01(\t\"\x88\x01\n\x17\x41pplyBoardEditsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x37\n\x07results\x18\x03 \x03(\x0b\x32&.qureed_project_server.BoardEditResult\x12\x13\n\x0b\x66\x61iled_edit\x18\x04 \x01(\x05\"%\n\x14GetBoardGraphRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\"&\n\x0e\x42oardComponent\x12\x14\n\x0c\x64\x65vice_uuids\x18\x01 \x03(\t\"\xcc\x01\n\x15GetBoardGraphResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x39\n\ncomponents\x18\x03 \x03(\x0b\x32%.qureed_project_server.BoardComponent\x12\x19\n\x11topological_order\x18\x04 \x03(\t\x12<\n\x11\x63ycle_connections\x18\x05 \x03(\x0b\x32!.qureed_project_server.Connection\"!\n\x10UndoBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\"!\n\x10RedoBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\"4\n\x12RevertBoardRequest\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12\r\n\x05\x62oard\x18\x02 \x01(\t\"\'\n\x16GetBoardHistoryRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\"0\n\x11\x43loseBoardRequest\x12\r\n\x05\x62oard\x18\x01 \x01(\t\x12\x0c\n\x04save\x18\x02 \x01(\x08\"5\n\x12\x43loseBoardResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x13\n\x11ListBoardsRequest\"\x89\x01\n\rOpenBoardInfo\x12\r\n\x05\x62oard\x18\x01 \x01(\t\x12\x0f\n\x07\x64\x65vices\x18\x02 \x01(\x04\x12\x13\n\x0b\x63onnections\x18\x03 \x01(\x04\x12\x1c\n\x14materialized_devices\x18\x04 \x01(\x04\x12\x15\n\runsaved_edits\x18\x05 \x01(\x04\x12\x0e\n\x06\x61\x63tive\x18\x06 \x01(\x08\"k\n\x12ListBoardsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x34\n\x06\x62oards\x18\x03 \x03(\x0b\x32$.qureed_project_server.OpenBoardInfo\"9\n\x11\x42oardHistoryEntry\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\"\xc5\x02\n\x14\x42oardHistoryResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\x04\x12:\n\x08versions\x18\x04 \x03(\x0b\x32(.qureed_project_server.BoardHistoryEntry\x12.\n\x07\x64\x65vices\x18\x05 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x17\n\x0fremoved_devices\x18\x06 \x03(\t\x12\x36\n\x0b\x63onnections\x18\x07 \x03(\x0b\x32!.qureed_project_server.Connection\x12>\n\x13removed_connections\x18\x08 \x03(\x0b\x32!.qureed_project_server.Connection\",\n\x13WatchCatalogRequest\x12\x15\n\rknown_version\x18\x01 \x01(\x04\"\xd0\x02\n\x0c\x43\x61talogDelta\x12\x0f\n\x07version\x18\x01 \x01(\x04\x12\x10\n\x08snapshot\x18\x02 \x01(\x08\x12\x34\n\radded_devices\x18\x03 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x36\n\x0f\x63hanged_devices\x18\x04 \x03(\x0b\x32\x1d.qureed_project_server.Device\x12\x17\n\x0fremoved_devices\x18\x05 \x03(\t\x12\x34\n\radded_signals\x18\x06 \x03(\x0b\x32\x1d.qureed_project_server.Signal\x12\x36\n\x0f\x63hanged_signals\x18\x07 \x03(\x0b\x32\x1d.qureed_project_server.Signal\x12\x17\n\x0fremoved_signals\x18\x08 \x03(\t\x12\x0f\n\x07message\x18\t \x01(\t\"\x82\x01\n\x19GetCompatiblePortsRequest\x12\x13\n\x0b\x64\x65vice_uuid\x18\x01 \x01(\t\x12\x14\n\x0cmodule_class\x18\x02 \x01(\t\x12\x12\n\nport_label\x18\x03 \x01(\t\x12\x17\n\x0finclude_catalog\x18\x04 \x01(\x08\x12\r\n\x05\x62oard\x18\x05 \x01(\t\"e\n\rPortReference\x12\x13\n\x0b\x64\x65vice_uuid\x18\x01 \x01(\t\x12\x14\n\x0cmodule_class\x18\x02 \x01(\t\x12)\n\x04port\x18\x03 \x01(\x0b\x32\x1b.qureed_project_server.Port\"\xb5\x01\n\x1aGetCompatiblePortsResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x39\n\x0b\x62oard_ports\x18\x03 \x03(\x0b\x32$.qureed_project_server.PortReference\x12;\n\rcatalog_ports\x18\x04 \x03(\x0b\x32$.qureed_project_server.PortReference\"]\n\x16StartSimulationRequest\x12\x13\n\x0bscheme_path\x18\x01 \x01(\t\x12\x15\n\rsimulation_id\x18\x02 \x01(\t\x12\x17\n\x0fsimulation_time\x18\x03 \x01(\x02\":\n\x17StartSimulationResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x17\n\x15StopSimulationRequest\"9\n\x16StopSimulationResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\"\x1a\n\x18SimulationLoggingRequest\"\xf4\x01\n\x06Tensor\x12\x13\n\x0breal_values\x18\x01 \x03(\x01\x12\x13\n\x0bimag_values\x18\x02 \x03(\x01\x12\r\n\x05shape\x18\x03 \x03(\x05\x12\x0c\n\x04\x64\x61ta\x18\x04 \x01(\x0c\x12\r\n\x05\x64type\x18\x05 \x01(\t\x12\x12\n\nbyte_order\x18\x06 \x01(\t\x12\x13\n\x0b\x63ompression\x18\x07 \x01(\t\x12\x0e\n\x06layout\x18\x08 \x01(\t\x12\x0f\n\x07indices\x18\t \x01(\x0c\x12\x0e\n\x06indptr\x18\n \x01(\x0c\x12\x13\n\x0bindex_dtype\x18\x0b \x01(\t\x12\x11\n\ttensor_id\x18\x0c \x01(\t\x12\x12\n\nfull_shape\x18\r \x03(\x05\"\xff\x01\n\rSimulationLog\x12\x11\n\ttimestamp\x18\x01 \x01(\x02\x12\x1c\n\x14simulation_timestamp\x18\x02 \x01(\x02\x12\x10\n\x08log_type\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65vice_name\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65vice_type\x18\x05 \x01(\t\x12\x0f\n\x07message\x18\x06 \x01(\t\x12\r\n\x05\x65rror\x18\x07 \x01(\t\x12\x15\n\rsimulation_id\x18\x08 \x01(\t\x12\x0b\n\x03\x65nd\x18\t \x01(\x08\x12-\n\x06tensor\x18\x0b \x01(\x0b\x32\x1d.qureed_project_server.Tensor\x12\x0e\n\x06\x66igure\x18\x0c \x01(\t\"o\n\x19SimulationLoggingResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x31\n\x03log\x18\x03 \x01(\x0b\x32$.qureed_project_server.SimulationLog\"\x1b\n\x19PerformanceLoggingRequest\"K\n\x0ePerformanceLog\x12\x10\n\x08used_ram\x18\x01 \x01(\x02\x12\x15\n\ravailable_ram\x18\x02 \x01(\x02\x12\x10\n\x08used_cpu\x18\x03 \x01(\x02\"q\n\x1aPerformanceLoggingResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x32\n\x03log\x18\x03 \x01(\x0b\x32%.qureed_project_server.PerformanceLog\"O\n\x1aSubmitSimulationLogRequest\x12\x31\n\x03log\x18\x01 \x01(\x0b\x32$.qureed_project_server.SimulationLog\"/\n\x1bSubmitSimulationLogResponse\x12\x10\n\x08received\x18\x01 \x01(\x04\"H\n\x12SimulationLogBatch\x12\x32\n\x04logs\x18\x01 \x03(\x0b\x32$.qureed_project_server.SimulationLog\"W\n\x1aSimulationLogStreamRequest\x12\x0f\n\x07\x62\x61tched\x18\x01 \x01(\x08\x12\x15\n\rsimulation_id\x18\x02 \x01(\t\x12\x11\n\tkeep_open\x18\x03 \x01(\x08\"\x84\x01\n\x1bSimulationLogStreamResponse\x12\x31\n\x03log\x18\x01 \x01(\x0b\x32$.qureed_project_server.SimulationLog\x12\x32\n\x04logs\x18\x02 \x03(\x0b\x32$.qureed_project_server.SimulationLog\"\x1b\n\x19ListLogSubscribersRequest\"\xa7\x01\n\x11LogSubscriberInfo\x12\x15\n\rsubscriber_id\x18\x01 \x01(\x04\x12\x15\n\rsimulation_id\x18\x02 \x01(\t\x12\x0e\n\x06queued\x18\x03 \x01(\x04\x12\x11\n\tdelivered\x18\x04 \x01(\x04\x12\x0f\n\x07\x64ropped\x18\x05 \x01(\x04\x12\x0b\n\x03lag\x18\x06 \x01(\x01\x12\x0f\n\x07max_lag\x18\x07 \x01(\x01\x12\x12\n\ndowngraded\x18\x08 \x01(\x08\"\x8f\x01\n\x1aListLogSubscribersResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12=\n\x0bsubscribers\x18\x03 \x03(\x0b\x32(.qureed_project_server.LogSubscriberInfo\x12\x11\n\tpublished\x18\x04 \x01(\x04\"%\n\x10GetTensorRequest\x12\x11\n\ttensor_id\x18\x01 \x01(\t\"c\n\x11GetTensorResponse\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\t\x12-\n\x06tensor\x18\x03 \x01(\x0b\x32\x1d.qureed_project_server.Tensor\"X\n\x0cSchemeDevice\x12\x14\n\x0c\x64\x65vice_class\x18\x01 \x01(\r\x12\x0c\n\x04uuid\x18\x02 \x01(\t\x12\x10\n\x08location\x18\x03 \x03(\x01\x12\x12\n\nproperties\x18\x04 \x01(\x0c\"M\n\x10SchemeConnection\x12\x14\n\x0csignal_class\x18\x01 \x01(\r\x12\x14\n\x0c\x64\x65vice_uuids\x18\x02 \x03(\t\x12\r\n\x05ports\x18\x03 \x03(\t\"\xc2\x01\n\nSchemeFile\x12\x10\n\x08revision\x18\x01 \x01(\x04\x12\x16\n\x0e\x64\x65vice_classes\x18\x02 \x03(\t\x12\x16\n\x0esignal_classes\x18\x03 \x03(\t\x12\x34\n\x07\x64\x65vices\x18\x04 \x03(\x0b\x32#.qureed_project_server.SchemeDevice\x12<\n\x0b\x63onnections\x18\x05 \x03(\x0b\x32\'.qureed_project_server.SchemeConnection2\xc9\x01\n\x10ServerManagement\x12U\n\x06Status\x12$.qureed_project_server.StatusRequest\x1a%.qureed_project_server.StatusResponse\x12^\n\tTerminate\x12\'.qureed_project_server.TerminateRequest\x1a(.qureed_project_server.TerminateResponse2\x83\x03\n\x0eVenvManagement\x12`\n\x07\x43onnect\x12).qureed_project_server.VenvConnectRequest\x1a*.qureed_project_server.VenvConnectResponse\x12U\n\x06\x46reeze\x12$.qureed_project_server.FreezeRequest\x1a%.qureed_project_server.FreezeResponse\x12X\n\x07Install\x12%.qureed_project_server.InstallRequest\x1a&.qureed_project_server.InstallResponse\x12^\n\tUninstall\x12\'.qureed_project_server.UninstallRequest\x1a(.qureed_project_server.UninstallResponse2\xc9\x14\n\x10QuReedManagement\x12[\n\x08GetIcons\x12&.qureed_project_server.GetIconsRequest\x1a\'.qureed_project_server.GetIconsResponse\x12X\n\x07GetIcon\x12%.qureed_project_server.GetIconRequest\x1a&.qureed_project_server.GetIconResponse\x12\x64\n\x0cGetIconsBulk\x12*.qureed_project_server.GetIconsBulkRequest\x1a&.qureed_project_server.GetIconResponse0\x01\x12\x61\n\nGetDevices\x12(.qureed_project_server.GetDevicesRequest\x1a).qureed_project_server.GetDevicesResponse\x12^\n\tGetDevice\x12\'.qureed_project_server.GetDeviceRequest\x1a(.qureed_project_server.GetDeviceResponse\x12\x61\n\nGetSignals\x12(.qureed_project_server.GetSignalsRequest\x1a).qureed_project_server.GetSignalsResponse\x12^\n\tOpenBoard\x12\'.qureed_project_server.OpenBoardRequest\x1a(.qureed_project_server.OpenBoardResponse\x12l\n\x0fOpenBoardStream\x12-.qureed_project_server.OpenBoardStreamRequest\x1a(.qureed_project_server.OpenBoardResponse0\x01\x12^\n\tSaveBoard\x12\'.qureed_project_server.SaveBoardRequest\x1a(.qureed_project_server.SaveBoardResponse\x12^\n\tAddDevice\x12\'.qureed_project_server.AddDeviceRequest\x1a(.qureed_project_server.AddDeviceResponse\x12g\n\x0cRemoveDevice\x12*.qureed_project_server.RemoveDeviceRequest\x1a+.qureed_project_server.RemoveDeviceResponse\x12m\n\x0e\x43onnectDevices\x12,.qureed_project_server.ConnectDevicesRequest\x1a-.qureed_project_server.ConnectDevicesResponse\x12v\n\x11\x44isconnectDevices\x12/.qureed_project_server.DisconnectDevicesRequest\x1a\x30.qureed_project_server.DisconnectDevicesResponse\x12n\n\x0fGenerateDevices\x12,.qureed_project_server.GenerateDeviceRequest\x1a-.qureed_project_server.GenerateDeviceResponse\x12\x85\x01\n\x16UpdateDeviceProperties\x12\x34.qureed_project_server.UpdateDevicePropertiesRequest\x1a\x35.qureed_project_server.UpdateDevicePropertiesResponse\x12\x61\n\x0cWatchCatalog\x12*.qureed_project_server.WatchCatalogRequest\x1a#.qureed_project_server.CatalogDelta0\x01\x12y\n\x12GetCompatiblePorts\x12\x30.qureed_project_server.GetCompatiblePortsRequest\x1a\x31.qureed_project_server.GetCompatiblePortsResponse\x12p\n\x0f\x41pplyBoardEdits\x12-.qureed_project_server.ApplyBoardEditsRequest\x1a..qureed_project_server.ApplyBoardEditsResponse\x12j\n\rGetBoardGraph\x12+.qureed_project_server.GetBoardGraphRequest\x1a,.qureed_project_server.GetBoardGraphResponse\x12\x61\n\tUndoBoard\x12\'.qureed_project_server.UndoBoardRequest\x1a+.qureed_project_server.BoardHistoryResponse\x12\x61\n\tRedoBoard\x12\'.qureed_project_server.RedoBoardRequest\x1a+.qureed_project_server.BoardHistoryResponse\x12\x65\n\x0bRevertBoard\x12).qureed_project_server.RevertBoardRequest\x1a+.qureed_project_server.BoardHistoryResponse\x12m\n\x0fGetBoardHistory\x12-.qureed_project_server.GetBoardHistoryRequest\x1a+.qureed_project_server.BoardHistoryResponse\x12\x61\n\nCloseBoard\x12(.qureed_project_server.CloseBoardRequest\x1a).qureed_project_server.CloseBoardResponse\x12\x61\n\nListBoards\x12(.qureed_project_server.ListBoardsRequest\x1a).qureed_project_server.ListBoardsResponse2\xc4\x08\n\x10QuReedSimulation\x12p\n\x0fStartSimulation\x12-.qureed_project_server.StartSimulationRequest\x1a..qureed_project_server.StartSimulationResponse\x12m\n\x0eStopSimulation\x12,.qureed_project_server.StopSimulationRequest\x1a-.qureed_project_server.StopSimulationResponse\x12v\n\x11SimulationLogging\x12/.qureed_project_server.SimulationLoggingRequest\x1a\x30.qureed_project_server.SimulationLoggingResponse\x12x\n\x11PerfomanceLogging\x12\x30.qureed_project_server.PerformanceLoggingRequest\x1a\x31.qureed_project_server.PerformanceLoggingResponse\x12\x80\x01\n\x17SimulationLogSubmission\x12\x31.qureed_project_server.SubmitSimulationLogRequest\x1a\x32.qureed_project_server.SubmitSimulationLogResponse\x12\x7f\n\x1cSimulationLogBatchSubmission\x12).qureed_project_server.SimulationLogBatch\x1a\x32.qureed_project_server.SubmitSimulationLogResponse(\x01\x12~\n\x13SimulationLogStream\x12\x31.qureed_project_server.SimulationLogStreamRequest\x1a\x32.qureed_project_server.SimulationLogStreamResponse0\x01\x12^\n\tGetTensor\x12\'.qureed_project_server.GetTensorRequest\x1a(.qureed_project_server.GetTensorResponse\x12y\n\x12ListLogSubscribers\x12\x30.qureed_project_server.ListLogSubscribersRequest\x1a\x31.qureed_project_server.ListLogSubscribersResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
 _builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'server_pb2', _globals)
 if not _descriptor._USE_C_DESCRIPTORS:
   DESCRIPTOR._loaded_options = None
+  _globals['_GETICONSBULKREQUEST_KNOWNHASHESENTRY']._loaded_options = None
+  _globals['_GETICONSBULKREQUEST_KNOWNHASHESENTRY']._serialized_options = b'8\001'
   _globals['_STATUSREQUEST']._serialized_start=69
   _globals['_STATUSREQUEST']._serialized_end=84
   _globals['_STATUSRESPONSE']._serialized_start=86
@@ -57,103 +59,173 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_UNINSTALLRESPONSE']._serialized_start=518
   _globals['_UNINSTALLRESPONSE']._serialized_end=570
   _globals['_GETICONREQUEST']._serialized_start=572
-  _globals['_GETICONREQUEST']._serialized_end=602
-  _globals['_GETICONRESPONSE']._serialized_start=604
-  _globals['_GETICONRESPONSE']._serialized_end=653
-  _globals['_GETICONSREQUEST']._serialized_start=655
-  _globals['_GETICONSREQUEST']._serialized_end=672
-  _globals['_GETICONSRESPONSE']._serialized_start=675
-  _globals['_GETICONSRESPONSE']._serialized_end=826
-  _globals['_SIGNAL']._serialized_start=828
-  _globals['_SIGNAL']._serialized_end=872
-  _globals['_GETSIGNALSREQUEST']._serialized_start=874
-  _globals['_GETSIGNALSREQUEST']._serialized_end=893
-  _globals['_GETSIGNALSRESPONSE']._serialized_start=895
-  _globals['_GETSIGNALSRESPONSE']._serialized_end=996
-  _globals['_DEVICEPROPERTIES']._serialized_start=998
-  _globals['_DEVICEPROPERTIES']._serialized_end=1061
-  _globals['_CONNECTION']._serialized_start=1064
-  _globals['_CONNECTION']._serialized_end=1204
-  _globals['_PORT']._serialized_start=1206
-  _globals['_PORT']._serialized_end=1267
-  _globals['_DEVICE']._serialized_start=1270
-  _globals['_DEVICE']._serialized_end=1554
-  _globals['_GENERATEDEVICEREQUEST']._serialized_start=1556
-  _globals['_GENERATEDEVICEREQUEST']._serialized_end=1626
-  _globals['_GENERATEDEVICERESPONSE']._serialized_start=1628
-  _globals['_GENERATEDEVICERESPONSE']._serialized_end=1685
-  _globals['_GETDEVICESREQUEST']._serialized_start=1687
-  _globals['_GETDEVICESREQUEST']._serialized_end=1706
-  _globals['_GETDEVICESRESPONSE']._serialized_start=1708
-  _globals['_GETDEVICESRESPONSE']._serialized_end=1809
-  _globals['_GETDEVICEREQUEST']._serialized_start=1811
-  _globals['_GETDEVICEREQUEST']._serialized_end=1892
-  _globals['_GETDEVICERESPONSE']._serialized_start=1894
-  _globals['_GETDEVICERESPONSE']._serialized_end=1993
-  _globals['_OPENBOARDREQUEST']._serialized_start=1995
-  _globals['_OPENBOARDREQUEST']._serialized_end=2028
-  _globals['_OPENBOARDRESPONSE']._serialized_start=2031
-  _globals['_OPENBOARDRESPONSE']._serialized_end=2187
-  _globals['_SAVEBOARDREQUEST']._serialized_start=2190
-  _globals['_SAVEBOARDREQUEST']._serialized_end=2327
-  _globals['_SAVEBOARDRESPONSE']._serialized_start=2329
-  _globals['_SAVEBOARDRESPONSE']._serialized_end=2381
-  _globals['_ADDDEVICEREQUEST']._serialized_start=2383
-  _globals['_ADDDEVICEREQUEST']._serialized_end=2448
-  _globals['_ADDDEVICERESPONSE']._serialized_start=2450
-  _globals['_ADDDEVICERESPONSE']._serialized_end=2523
-  _globals['_REMOVEDEVICEREQUEST']._serialized_start=2525
-  _globals['_REMOVEDEVICEREQUEST']._serialized_end=2567
-  _globals['_REMOVEDEVICERESPONSE']._serialized_start=2569
-  _globals['_REMOVEDEVICERESPONSE']._serialized_end=2624
-  _globals['_CONNECTDEVICESREQUEST']._serialized_start=2626
-  _globals['_CONNECTDEVICESREQUEST']._serialized_end=2741
-  _globals['_CONNECTDEVICESRESPONSE']._serialized_start=2743
-  _globals['_CONNECTDEVICESRESPONSE']._serialized_end=2800
-  _globals['_DISCONNECTDEVICESREQUEST']._serialized_start=2802
-  _globals['_DISCONNECTDEVICESREQUEST']._serialized_end=2920
-  _globals['_DISCONNECTDEVICESRESPONSE']._serialized_start=2922
-  _globals['_DISCONNECTDEVICESRESPONSE']._serialized_end=2982
-  _globals['_UPDATEDEVICEPROPERTIESREQUEST']._serialized_start=2984
-  _globals['_UPDATEDEVICEPROPERTIESREQUEST']._serialized_end=3062
-  _globals['_UPDATEDEVICEPROPERTIESRESPONSE']._serialized_start=3064
-  _globals['_UPDATEDEVICEPROPERTIESRESPONSE']._serialized_end=3129
-  _globals['_STARTSIMULATIONREQUEST']._serialized_start=3131
-  _globals['_STARTSIMULATIONREQUEST']._serialized_end=3224
-  _globals['_STARTSIMULATIONRESPONSE']._serialized_start=3226
-  _globals['_STARTSIMULATIONRESPONSE']._serialized_end=3284
-  _globals['_STOPSIMULATIONREQUEST']._serialized_start=3286
-  _globals['_STOPSIMULATIONREQUEST']._serialized_end=3309
-  _globals['_STOPSIMULATIONRESPONSE']._serialized_start=3311
-  _globals['_STOPSIMULATIONRESPONSE']._serialized_end=3368
-  _globals['_SIMULATIONLOGGINGREQUEST']._serialized_start=3370
-  _globals['_SIMULATIONLOGGINGREQUEST']._serialized_end=3396
-  _globals['_TENSOR']._serialized_start=3398
-  _globals['_TENSOR']._serialized_end=3463
-  _globals['_SIMULATIONLOG']._serialized_start=3466
-  _globals['_SIMULATIONLOG']._serialized_end=3721
-  _globals['_SIMULATIONLOGGINGRESPONSE']._serialized_start=3723
-  _globals['_SIMULATIONLOGGINGRESPONSE']._serialized_end=3834
-  _globals['_PERFORMANCELOGGINGREQUEST']._serialized_start=3836
-  _globals['_PERFORMANCELOGGINGREQUEST']._serialized_end=3863
-  _globals['_PERFORMANCELOG']._serialized_start=3865
-  _globals['_PERFORMANCELOG']._serialized_end=3940
-  _globals['_PERFORMANCELOGGINGRESPONSE']._serialized_start=3942
-  _globals['_PERFORMANCELOGGINGRESPONSE']._serialized_end=4055
-  _globals['_SUBMITSIMULATIONLOGREQUEST']._serialized_start=4057
-  _globals['_SUBMITSIMULATIONLOGREQUEST']._serialized_end=4136
-  _globals['_SUBMITSIMULATIONLOGRESPONSE']._serialized_start=4138
-  _globals['_SUBMITSIMULATIONLOGRESPONSE']._serialized_end=4167
-  _globals['_SIMULATIONLOGSTREAMREQUEST']._serialized_start=4169
-  _globals['_SIMULATIONLOGSTREAMREQUEST']._serialized_end=4197
-  _globals['_SIMULATIONLOGSTREAMRESPONSE']._serialized_start=4199
-  _globals['_SIMULATIONLOGSTREAMRESPONSE']._serialized_end=4279
-  _globals['_SERVERMANAGEMENT']._serialized_start=4282
-  _globals['_SERVERMANAGEMENT']._serialized_end=4483
-  _globals['_VENVMANAGEMENT']._serialized_start=4486
-  _globals['_VENVMANAGEMENT']._serialized_end=4873
-  _globals['_QUREEDMANAGEMENT']._serialized_start=4876
-  _globals['_QUREEDMANAGEMENT']._serialized_end=6243
-  _globals['_QUREEDSIMULATION']._serialized_start=6246
-  _globals['_QUREEDSIMULATION']._serialized_end=6990
+  _globals['_GETICONREQUEST']._serialized_end=622
+  _globals['_GETICONRESPONSE']._serialized_start=625
+  _globals['_GETICONRESPONSE']._serialized_end=754
+  _globals['_GETICONSBULKREQUEST']._serialized_start=757
+  _globals['_GETICONSBULKREQUEST']._serialized_end=913
+  _globals['_GETICONSBULKREQUEST_KNOWNHASHESENTRY']._serialized_start=863
+  _globals['_GETICONSBULKREQUEST_KNOWNHASHESENTRY']._serialized_end=913
+  _globals['_GETICONSREQUEST']._serialized_start=915
+  _globals['_GETICONSREQUEST']._serialized_end=932
+  _globals['_GETICONSRESPONSE']._serialized_start=935
+  _globals['_GETICONSRESPONSE']._serialized_end=1086
+  _globals['_SIGNAL']._serialized_start=1088
+  _globals['_SIGNAL']._serialized_end=1132
+  _globals['_GETSIGNALSREQUEST']._serialized_start=1134
+  _globals['_GETSIGNALSREQUEST']._serialized_end=1153
+  _globals['_GETSIGNALSRESPONSE']._serialized_start=1155
+  _globals['_GETSIGNALSRESPONSE']._serialized_end=1256
+  _globals['_DEVICEPROPERTIES']._serialized_start=1258
+  _globals['_DEVICEPROPERTIES']._serialized_end=1321
+  _globals['_CONNECTION']._serialized_start=1324
+  _globals['_CONNECTION']._serialized_end=1464
+  _globals['_PORT']._serialized_start=1466
+  _globals['_PORT']._serialized_end=1527
+  _globals['_DEVICE']._serialized_start=1530
+  _globals['_DEVICE']._serialized_end=1814
+  _globals['_GENERATEDEVICEREQUEST']._serialized_start=1816
+  _globals['_GENERATEDEVICEREQUEST']._serialized_end=1886
+  _globals['_GENERATEDEVICERESPONSE']._serialized_start=1888
+  _globals['_GENERATEDEVICERESPONSE']._serialized_end=1945
+  _globals['_GETDEVICESREQUEST']._serialized_start=1948
+  _globals['_GETDEVICESREQUEST']._serialized_end=2103
+  _globals['_GETDEVICESRESPONSE']._serialized_start=2106
+  _globals['_GETDEVICESRESPONSE']._serialized_end=2252
+  _globals['_GETDEVICEREQUEST']._serialized_start=2254
+  _globals['_GETDEVICEREQUEST']._serialized_end=2335
+  _globals['_GETDEVICERESPONSE']._serialized_start=2337
+  _globals['_GETDEVICERESPONSE']._serialized_end=2436
+  _globals['_OPENBOARDREQUEST']._serialized_start=2438
+  _globals['_OPENBOARDREQUEST']._serialized_end=2487
+  _globals['_OPENBOARDRESPONSE']._serialized_start=2490
+  _globals['_OPENBOARDRESPONSE']._serialized_end=2660
+  _globals['_OPENBOARDSTREAMREQUEST']._serialized_start=2662
+  _globals['_OPENBOARDSTREAMREQUEST']._serialized_end=2737
+  _globals['_SAVEBOARDREQUEST']._serialized_start=2740
+  _globals['_SAVEBOARDREQUEST']._serialized_end=2877
+  _globals['_SAVEBOARDRESPONSE']._serialized_start=2879
+  _globals['_SAVEBOARDRESPONSE']._serialized_end=2931
+  _globals['_ADDDEVICEREQUEST']._serialized_start=2933
+  _globals['_ADDDEVICEREQUEST']._serialized_end=3013
+  _globals['_ADDDEVICERESPONSE']._serialized_start=3015
+  _globals['_ADDDEVICERESPONSE']._serialized_end=3088
+  _globals['_REMOVEDEVICEREQUEST']._serialized_start=3090
+  _globals['_REMOVEDEVICEREQUEST']._serialized_end=3147
+  _globals['_REMOVEDEVICERESPONSE']._serialized_start=3149
+  _globals['_REMOVEDEVICERESPONSE']._serialized_end=3204
+  _globals['_CONNECTDEVICESREQUEST']._serialized_start=3207
+  _globals['_CONNECTDEVICESREQUEST']._serialized_end=3337
+  _globals['_CONNECTDEVICESRESPONSE']._serialized_start=3339
+  _globals['_CONNECTDEVICESRESPONSE']._serialized_end=3396
+  _globals['_DISCONNECTDEVICESREQUEST']._serialized_start=3399
+  _globals['_DISCONNECTDEVICESREQUEST']._serialized_end=3532
+  _globals['_DISCONNECTDEVICESRESPONSE']._serialized_start=3534
+  _globals['_DISCONNECTDEVICESRESPONSE']._serialized_end=3594
+  _globals['_UPDATEDEVICEPROPERTIESREQUEST']._serialized_start=3596
+  _globals['_UPDATEDEVICEPROPERTIESREQUEST']._serialized_end=3689
+  _globals['_UPDATEDEVICEPROPERTIESRESPONSE']._serialized_start=3691
+  _globals['_UPDATEDEVICEPROPERTIESRESPONSE']._serialized_end=3756
+  _globals['_BOARDEDIT']._serialized_start=3759
+  _globals['_BOARDEDIT']._serialized_end=4152
+  _globals['_BOARDEDITRESULT']._serialized_start=4154
+  _globals['_BOARDEDITRESULT']._serialized_end=4225
+  _globals['_APPLYBOARDEDITSREQUEST']._serialized_start=4227
+  _globals['_APPLYBOARDEDITSREQUEST']._serialized_end=4315
+  _globals['_APPLYBOARDEDITSRESPONSE']._serialized_start=4318
+  _globals['_APPLYBOARDEDITSRESPONSE']._serialized_end=4454
+  _globals['_GETBOARDGRAPHREQUEST']._serialized_start=4456
+  _globals['_GETBOARDGRAPHREQUEST']._serialized_end=4493
+  _globals['_BOARDCOMPONENT']._serialized_start=4495
+  _globals['_BOARDCOMPONENT']._serialized_end=4533
+  _globals['_GETBOARDGRAPHRESPONSE']._serialized_start=4536
+  _globals['_GETBOARDGRAPHRESPONSE']._serialized_end=4740
+  _globals['_UNDOBOARDREQUEST']._serialized_start=4742
+  _globals['_UNDOBOARDREQUEST']._serialized_end=4775
+  _globals['_REDOBOARDREQUEST']._serialized_start=4777
+  _globals['_REDOBOARDREQUEST']._serialized_end=4810
+  _globals['_REVERTBOARDREQUEST']._serialized_start=4812
+  _globals['_REVERTBOARDREQUEST']._serialized_end=4864
+  _globals['_GETBOARDHISTORYREQUEST']._serialized_start=4866
+  _globals['_GETBOARDHISTORYREQUEST']._serialized_end=4905
+  _globals['_CLOSEBOARDREQUEST']._serialized_start=4907
+  _globals['_CLOSEBOARDREQUEST']._serialized_end=4955
+  _globals['_CLOSEBOARDRESPONSE']._serialized_start=4957
+  _globals['_CLOSEBOARDRESPONSE']._serialized_end=5010
+  _globals['_LISTBOARDSREQUEST']._serialized_start=5012
+  _globals['_LISTBOARDSREQUEST']._serialized_end=5031
+  _globals['_OPENBOARDINFO']._serialized_start=5034
+  _globals['_OPENBOARDINFO']._serialized_end=5171
+  _globals['_LISTBOARDSRESPONSE']._serialized_start=5173
+  _globals['_LISTBOARDSRESPONSE']._serialized_end=5280
+  _globals['_BOARDHISTORYENTRY']._serialized_start=5282
+  _globals['_BOARDHISTORYENTRY']._serialized_end=5339
+  _globals['_BOARDHISTORYRESPONSE']._serialized_start=5342
+  _globals['_BOARDHISTORYRESPONSE']._serialized_end=5667
+  _globals['_WATCHCATALOGREQUEST']._serialized_start=5669
+  _globals['_WATCHCATALOGREQUEST']._serialized_end=5713
+  _globals['_CATALOGDELTA']._serialized_start=5716
+  _globals['_CATALOGDELTA']._serialized_end=6052
+  _globals['_GETCOMPATIBLEPORTSREQUEST']._serialized_start=6055
+  _globals['_GETCOMPATIBLEPORTSREQUEST']._serialized_end=6185
+  _globals['_PORTREFERENCE']._serialized_start=6187
+  _globals['_PORTREFERENCE']._serialized_end=6288
+  _globals['_GETCOMPATIBLEPORTSRESPONSE']._serialized_start=6291
+  _globals['_GETCOMPATIBLEPORTSRESPONSE']._serialized_end=6472
+  _globals['_STARTSIMULATIONREQUEST']._serialized_start=6474
+  _globals['_STARTSIMULATIONREQUEST']._serialized_end=6567
+  _globals['_STARTSIMULATIONRESPONSE']._serialized_start=6569
+  _globals['_STARTSIMULATIONRESPONSE']._serialized_end=6627
+  _globals['_STOPSIMULATIONREQUEST']._serialized_start=6629
+  _globals['_STOPSIMULATIONREQUEST']._serialized_end=6652
+  _globals['_STOPSIMULATIONRESPONSE']._serialized_start=6654
+  _globals['_STOPSIMULATIONRESPONSE']._serialized_end=6711
+  _globals['_SIMULATIONLOGGINGREQUEST']._serialized_start=6713
+  _globals['_SIMULATIONLOGGINGREQUEST']._serialized_end=6739
+  _globals['_TENSOR']._serialized_start=6742
+  _globals['_TENSOR']._serialized_end=6986
+  _globals['_SIMULATIONLOG']._serialized_start=6989
+  _globals['_SIMULATIONLOG']._serialized_end=7244
+  _globals['_SIMULATIONLOGGINGRESPONSE']._serialized_start=7246
+  _globals['_SIMULATIONLOGGINGRESPONSE']._serialized_end=7357
+  _globals['_PERFORMANCELOGGINGREQUEST']._serialized_start=7359
+  _globals['_PERFORMANCELOGGINGREQUEST']._serialized_end=7386
+  _globals['_PERFORMANCELOG']._serialized_start=7388
+  _globals['_PERFORMANCELOG']._serialized_end=7463
+  _globals['_PERFORMANCELOGGINGRESPONSE']._serialized_start=7465
+  _globals['_PERFORMANCELOGGINGRESPONSE']._serialized_end=7578
+  _globals['_SUBMITSIMULATIONLOGREQUEST']._serialized_start=7580
+  _globals['_SUBMITSIMULATIONLOGREQUEST']._serialized_end=7659
+  _globals['_SUBMITSIMULATIONLOGRESPONSE']._serialized_start=7661
+  _globals['_SUBMITSIMULATIONLOGRESPONSE']._serialized_end=7708
+  _globals['_SIMULATIONLOGBATCH']._serialized_start=7710
+  _globals['_SIMULATIONLOGBATCH']._serialized_end=7782
+  _globals['_SIMULATIONLOGSTREAMREQUEST']._serialized_start=7784
+  _globals['_SIMULATIONLOGSTREAMREQUEST']._serialized_end=7871
+  _globals['_SIMULATIONLOGSTREAMRESPONSE']._serialized_start=7874
+  _globals['_SIMULATIONLOGSTREAMRESPONSE']._serialized_end=8006
+  _globals['_LISTLOGSUBSCRIBERSREQUEST']._serialized_start=8008
+  _globals['_LISTLOGSUBSCRIBERSREQUEST']._serialized_end=8035
+  _globals['_LOGSUBSCRIBERINFO']._serialized_start=8038
+  _globals['_LOGSUBSCRIBERINFO']._serialized_end=8205
+  _globals['_LISTLOGSUBSCRIBERSRESPONSE']._serialized_start=8208
+  _globals['_LISTLOGSUBSCRIBERSRESPONSE']._serialized_end=8351
+  _globals['_GETTENSORREQUEST']._serialized_start=8353
+  _globals['_GETTENSORREQUEST']._serialized_end=8390
+  _globals['_GETTENSORRESPONSE']._serialized_start=8392
+  _globals['_GETTENSORRESPONSE']._serialized_end=8491
+  _globals['_SCHEMEDEVICE']._serialized_start=8493
+  _globals['_SCHEMEDEVICE']._serialized_end=8581
+  _globals['_SCHEMECONNECTION']._serialized_start=8583
+  _globals['_SCHEMECONNECTION']._serialized_end=8660
+  _globals['_SCHEMEFILE']._serialized_start=8663
+  _globals['_SCHEMEFILE']._serialized_end=8857
+  _globals['_SERVERMANAGEMENT']._serialized_start=8860
+  _globals['_SERVERMANAGEMENT']._serialized_end=9061
+  _globals['_VENVMANAGEMENT']._serialized_start=9064
+  _globals['_VENVMANAGEMENT']._serialized_end=9451
+  _globals['_QUREEDMANAGEMENT']._serialized_start=9454
+  _globals['_QUREEDMANAGEMENT']._serialized_end=12087
+  _globals['_QUREEDSIMULATION']._serialized_start=12090
+  _globals['_QUREEDSIMULATION']._serialized_end=13182
 # @@protoc_insertion_point(module_scope)
@@ -365,6 +365,11 @@ class QuReedManagementStub(object):
                 request_serializer=server__pb2.GetIconRequest.SerializeToString,
                 response_deserializer=server__pb2.GetIconResponse.FromString,
                 _registered_method=True)
+        self.GetIconsBulk = channel.unary_stream(
+                '/qureed_project_server.QuReedManagement/GetIconsBulk',
+                request_serializer=server__pb2.GetIconsBulkRequest.SerializeToString,
+                response_deserializer=server__pb2.GetIconResponse.FromString,
+                _registered_method=True)
         self.GetDevices = channel.unary_unary(
                 '/qureed_project_server.QuReedManagement/GetDevices',
                 request_serializer=server__pb2.GetDevicesRequest.SerializeToString,
@@ -385,6 +390,11 @@ class QuReedManagementStub(object):
                 request_serializer=server__pb2.OpenBoardRequest.SerializeToString,
                 response_deserializer=server__pb2.OpenBoardResponse.FromString,
                 _registered_method=True)
+        self.OpenBoardStream = channel.unary_stream(
+                '/qureed_project_server.QuReedManagement/OpenBoardStream',
+                request_serializer=server__pb2.OpenBoardStreamRequest.SerializeToString,
+                response_deserializer=server__pb2.OpenBoardResponse.FromString,
+                _registered_method=True)
         self.SaveBoard = channel.unary_unary(
                 '/qureed_project_server.QuReedManagement/SaveBoard',
                 request_serializer=server__pb2.SaveBoardRequest.SerializeToString,
@@ -420,6 +430,56 @@ class QuReedManagementStub(object):
                 request_serializer=server__pb2.UpdateDevicePropertiesRequest.SerializeToString,
                 response_deserializer=server__pb2.UpdateDevicePropertiesResponse.FromString,
                 _registered_method=True)
+        self.WatchCatalog = channel.unary_stream(
+                '/qureed_project_server.QuReedManagement/WatchCatalog',
+                request_serializer=server__pb2.WatchCatalogRequest.SerializeToString,
+                response_deserializer=server__pb2.CatalogDelta.FromString,
+                _registered_method=True)
+        self.GetCompatiblePorts = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/GetCompatiblePorts',
+                request_serializer=server__pb2.GetCompatiblePortsRequest.SerializeToString,
+                response_deserializer=server__pb2.GetCompatiblePortsResponse.FromString,
+                _registered_method=True)
+        self.ApplyBoardEdits = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/ApplyBoardEdits',
+                request_serializer=server__pb2.ApplyBoardEditsRequest.SerializeToString,
+                response_deserializer=server__pb2.ApplyBoardEditsResponse.FromString,
+                _registered_method=True)
+        self.GetBoardGraph = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/GetBoardGraph',
+                request_serializer=server__pb2.GetBoardGraphRequest.SerializeToString,
+                response_deserializer=server__pb2.GetBoardGraphResponse.FromString,
+                _registered_method=True)
+        self.UndoBoard = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/UndoBoard',
+                request_serializer=server__pb2.UndoBoardRequest.SerializeToString,
+                response_deserializer=server__pb2.BoardHistoryResponse.FromString,
+                _registered_method=True)
+        self.RedoBoard = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/RedoBoard',
+                request_serializer=server__pb2.RedoBoardRequest.SerializeToString,
+                response_deserializer=server__pb2.BoardHistoryResponse.FromString,
+                _registered_method=True)
+        self.RevertBoard = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/RevertBoard',
+                request_serializer=server__pb2.RevertBoardRequest.SerializeToString,
+                response_deserializer=server__pb2.BoardHistoryResponse.FromString,
+                _registered_method=True)
+        self.GetBoardHistory = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/GetBoardHistory',
+                request_serializer=server__pb2.GetBoardHistoryRequest.SerializeToString,
+                response_deserializer=server__pb2.BoardHistoryResponse.FromString,
+                _registered_method=True)
+        self.CloseBoard = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/CloseBoard',
+                request_serializer=server__pb2.CloseBoardRequest.SerializeToString,
+                response_deserializer=server__pb2.CloseBoardResponse.FromString,
+                _registered_method=True)
+        self.ListBoards = channel.unary_unary(
+                '/qureed_project_server.QuReedManagement/ListBoards',
+                request_serializer=server__pb2.ListBoardsRequest.SerializeToString,
+                response_deserializer=server__pb2.ListBoardsResponse.FromString,
+                _registered_method=True)
 
 
 class QuReedManagementServicer(object):
@@ -439,6 +499,13 @@ class QuReedManagementServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetIconsBulk(self, request, context):
+        """Stream the icons which the client doesn't have yet or which changed
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def GetDevices(self, request, context):
         """Get a list of all implemented devices
         """
@@ -467,6 +534,13 @@ class QuReedManagementServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def OpenBoardStream(self, request, context):
+        """Open a board, the devices and connections are streamed in chunks
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SaveBoard(self, request, context):
         """Request the board to be saved
         """
@@ -516,6 +590,76 @@ class QuReedManagementServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def WatchCatalog(self, request, context):
+        """Stream the changes of the device and signal catalog
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCompatiblePorts(self, request, context):
+        """Get all ports which can be connected to the given port
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ApplyBoardEdits(self, request, context):
+        """Apply multiple board edits at once, all or nothing
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBoardGraph(self, request, context):
+        """Get the connected components, topological order and cycles of the board
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UndoBoard(self, request, context):
+        """Undo the last board edit, returns the changed devices and connections
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RedoBoard(self, request, context):
+        """Redo the last undone board edit
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RevertBoard(self, request, context):
+        """Revert the board to a version of its history
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBoardHistory(self, request, context):
+        """Get the versions of the board history
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CloseBoard(self, request, context):
+        """Close an open board
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListBoards(self, request, context):
+        """List the open boards
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_QuReedManagementServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -529,6 +673,11 @@ def add_QuReedManagementServicer_to_server(servicer, server):
                     request_deserializer=server__pb2.GetIconRequest.FromString,
                     response_serializer=server__pb2.GetIconResponse.SerializeToString,
             ),
+            'GetIconsBulk': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetIconsBulk,
+                    request_deserializer=server__pb2.GetIconsBulkRequest.FromString,
+                    response_serializer=server__pb2.GetIconResponse.SerializeToString,
+            ),
             'GetDevices': grpc.unary_unary_rpc_method_handler(
                     servicer.GetDevices,
                     request_deserializer=server__pb2.GetDevicesRequest.FromString,
@@ -549,6 +698,11 @@ def add_QuReedManagementServicer_to_server(servicer, server):
                     request_deserializer=server__pb2.OpenBoardRequest.FromString,
                     response_serializer=server__pb2.OpenBoardResponse.SerializeToString,
             ),
+            'OpenBoardStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.OpenBoardStream,
+                    request_deserializer=server__pb2.OpenBoardStreamRequest.FromString,
+                    response_serializer=server__pb2.OpenBoardResponse.SerializeToString,
+            ),
             'SaveBoard': grpc.unary_unary_rpc_method_handler(
                     servicer.SaveBoard,
                     request_deserializer=server__pb2.SaveBoardRequest.FromString,
@@ -584,6 +738,56 @@ def add_QuReedManagementServicer_to_server(servicer, server):
                     request_deserializer=server__pb2.UpdateDevicePropertiesRequest.FromString,
                     response_serializer=server__pb2.UpdateDevicePropertiesResponse.SerializeToString,
             ),
+            'WatchCatalog': grpc.unary_stream_rpc_method_handler(
+                    servicer.WatchCatalog,
+                    request_deserializer=server__pb2.WatchCatalogRequest.FromString,
+                    response_serializer=server__pb2.CatalogDelta.SerializeToString,
+            ),
+            'GetCompatiblePorts': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCompatiblePorts,
+                    request_deserializer=server__pb2.GetCompatiblePortsRequest.FromString,
+                    response_serializer=server__pb2.GetCompatiblePortsResponse.SerializeToString,
+            ),
+            'ApplyBoardEdits': grpc.unary_unary_rpc_method_handler(
+                    servicer.ApplyBoardEdits,
+                    request_deserializer=server__pb2.ApplyBoardEditsRequest.FromString,
+                    response_serializer=server__pb2.ApplyBoardEditsResponse.SerializeToString,
+            ),
+            'GetBoardGraph': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBoardGraph,
+                    request_deserializer=server__pb2.GetBoardGraphRequest.FromString,
+                    response_serializer=server__pb2.GetBoardGraphResponse.SerializeToString,
+            ),
+            'UndoBoard': grpc.unary_unary_rpc_method_handler(
+                    servicer.UndoBoard,
+                    request_deserializer=server__pb2.UndoBoardRequest.FromString,
+                    response_serializer=server__pb2.BoardHistoryResponse.SerializeToString,
+            ),
+            'RedoBoard': grpc.unary_unary_rpc_method_handler(
+                    servicer.RedoBoard,
+                    request_deserializer=server__pb2.RedoBoardRequest.FromString,
+                    response_serializer=server__pb2.BoardHistoryResponse.SerializeToString,
+            ),
+            'RevertBoard': grpc.unary_unary_rpc_method_handler(
+                    servicer.RevertBoard,
+                    request_deserializer=server__pb2.RevertBoardRequest.FromString,
+                    response_serializer=server__pb2.BoardHistoryResponse.SerializeToString,
+            ),
+            'GetBoardHistory': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBoardHistory,
+                    request_deserializer=server__pb2.GetBoardHistoryRequest.FromString,
+                    response_serializer=server__pb2.BoardHistoryResponse.SerializeToString,
+            ),
+            'CloseBoard': grpc.unary_unary_rpc_method_handler(
+                    servicer.CloseBoard,
+                    request_deserializer=server__pb2.CloseBoardRequest.FromString,
+                    response_serializer=server__pb2.CloseBoardResponse.SerializeToString,
+            ),
+            'ListBoards': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListBoards,
+                    request_deserializer=server__pb2.ListBoardsRequest.FromString,
+                    response_serializer=server__pb2.ListBoardsResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'qureed_project_server.QuReedManagement', rpc_method_handlers)
@@ -649,6 +853,33 @@ class QuReedManagement(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def GetIconsBulk(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/GetIconsBulk',
+            server__pb2.GetIconsBulkRequest.SerializeToString,
+            server__pb2.GetIconResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def GetDevices(request,
             target,
@@ -757,6 +988,33 @@ class QuReedManagement(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def OpenBoardStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/OpenBoardStream',
+            server__pb2.OpenBoardStreamRequest.SerializeToString,
+            server__pb2.OpenBoardResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SaveBoard(request,
             target,
@@ -946,6 +1204,276 @@ class QuReedManagement(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def WatchCatalog(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/WatchCatalog',
+            server__pb2.WatchCatalogRequest.SerializeToString,
+            server__pb2.CatalogDelta.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCompatiblePorts(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/GetCompatiblePorts',
+            server__pb2.GetCompatiblePortsRequest.SerializeToString,
+            server__pb2.GetCompatiblePortsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ApplyBoardEdits(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/ApplyBoardEdits',
+            server__pb2.ApplyBoardEditsRequest.SerializeToString,
+            server__pb2.ApplyBoardEditsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBoardGraph(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/GetBoardGraph',
+            server__pb2.GetBoardGraphRequest.SerializeToString,
+            server__pb2.GetBoardGraphResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UndoBoard(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/UndoBoard',
+            server__pb2.UndoBoardRequest.SerializeToString,
+            server__pb2.BoardHistoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RedoBoard(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/RedoBoard',
+            server__pb2.RedoBoardRequest.SerializeToString,
+            server__pb2.BoardHistoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RevertBoard(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/RevertBoard',
+            server__pb2.RevertBoardRequest.SerializeToString,
+            server__pb2.BoardHistoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBoardHistory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/GetBoardHistory',
+            server__pb2.GetBoardHistoryRequest.SerializeToString,
+            server__pb2.BoardHistoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CloseBoard(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/CloseBoard',
+            server__pb2.CloseBoardRequest.SerializeToString,
+            server__pb2.CloseBoardResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListBoards(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedManagement/ListBoards',
+            server__pb2.ListBoardsRequest.SerializeToString,
+            server__pb2.ListBoardsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
 
 class QuReedSimulationStub(object):
     """Missing associated documentation comment in .proto file."""
@@ -981,11 +1509,26 @@ class QuReedSimulationStub(object):
                 request_serializer=server__pb2.SubmitSimulationLogRequest.SerializeToString,
                 response_deserializer=server__pb2.SubmitSimulationLogResponse.FromString,
                 _registered_method=True)
+        self.SimulationLogBatchSubmission = channel.stream_unary(
+                '/qureed_project_server.QuReedSimulation/SimulationLogBatchSubmission',
+                request_serializer=server__pb2.SimulationLogBatch.SerializeToString,
+                response_deserializer=server__pb2.SubmitSimulationLogResponse.FromString,
+                _registered_method=True)
         self.SimulationLogStream = channel.unary_stream(
                 '/qureed_project_server.QuReedSimulation/SimulationLogStream',
                 request_serializer=server__pb2.SimulationLogStreamRequest.SerializeToString,
                 response_deserializer=server__pb2.SimulationLogStreamResponse.FromString,
                 _registered_method=True)
+        self.GetTensor = channel.unary_unary(
+                '/qureed_project_server.QuReedSimulation/GetTensor',
+                request_serializer=server__pb2.GetTensorRequest.SerializeToString,
+                response_deserializer=server__pb2.GetTensorResponse.FromString,
+                _registered_method=True)
+        self.ListLogSubscribers = channel.unary_unary(
+                '/qureed_project_server.QuReedSimulation/ListLogSubscribers',
+                request_serializer=server__pb2.ListLogSubscribersRequest.SerializeToString,
+                response_deserializer=server__pb2.ListLogSubscribersResponse.FromString,
+                _registered_method=True)
 
 
 class QuReedSimulationServicer(object):
@@ -1026,6 +1569,13 @@ class QuReedSimulationServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SimulationLogBatchSubmission(self, request_iterator, context):
+        """Batched Simulation Log Submission, one stream per simulation
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def SimulationLogStream(self, request, context):
         """Simulation Log Stream
         """
@@ -1033,6 +1583,20 @@ class QuReedSimulationServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def GetTensor(self, request, context):
+        """Full tensor of a logged preview
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListLogSubscribers(self, request, context):
+        """Lists the log stream subscribers with their lag
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_QuReedSimulationServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -1061,11 +1625,26 @@ def add_QuReedSimulationServicer_to_server(servicer, server):
                     request_deserializer=server__pb2.SubmitSimulationLogRequest.FromString,
                     response_serializer=server__pb2.SubmitSimulationLogResponse.SerializeToString,
             ),
+            'SimulationLogBatchSubmission': grpc.stream_unary_rpc_method_handler(
+                    servicer.SimulationLogBatchSubmission,
+                    request_deserializer=server__pb2.SimulationLogBatch.FromString,
+                    response_serializer=server__pb2.SubmitSimulationLogResponse.SerializeToString,
+            ),
             'SimulationLogStream': grpc.unary_stream_rpc_method_handler(
                     servicer.SimulationLogStream,
                     request_deserializer=server__pb2.SimulationLogStreamRequest.FromString,
                     response_serializer=server__pb2.SimulationLogStreamResponse.SerializeToString,
             ),
+            'GetTensor': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTensor,
+                    request_deserializer=server__pb2.GetTensorRequest.FromString,
+                    response_serializer=server__pb2.GetTensorResponse.SerializeToString,
+            ),
+            'ListLogSubscribers': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListLogSubscribers,
+                    request_deserializer=server__pb2.ListLogSubscribersRequest.FromString,
+                    response_serializer=server__pb2.ListLogSubscribersResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'qureed_project_server.QuReedSimulation', rpc_method_handlers)
@@ -1212,6 +1791,33 @@ class QuReedSimulation(object):
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def SimulationLogBatchSubmission(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/qureed_project_server.QuReedSimulation/SimulationLogBatchSubmission',
+            server__pb2.SimulationLogBatch.SerializeToString,
+            server__pb2.SubmitSimulationLogResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def SimulationLogStream(request,
             target,
@@ -1238,3 +1844,57 @@ class QuReedSimulation(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def GetTensor(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedSimulation/GetTensor',
+            server__pb2.GetTensorRequest.SerializeToString,
+            server__pb2.GetTensorResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListLogSubscribers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/qureed_project_server.QuReedSimulation/ListLogSubscribers',
+            server__pb2.ListLogSubscribersRequest.SerializeToString,
+            server__pb2.ListLogSubscribersResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
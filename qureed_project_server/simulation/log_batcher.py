@@ -0,0 +1,187 @@
+"""
+Batched submission of the simulation logs
+
+The logs of a simulation are buffered and sent to the server over a single
+client-streaming SimulationLogBatchSubmission call. A batch is sent once
+enough logs (or bytes) are buffered, once the oldest buffered log waited
+for the flush interval or right away for the last log of the simulation.
+The buffer is bounded, the simulation waits for the stream while it is
+full.
+"""
+import threading
+import time
+import traceback
+
+from qureed_project_server import server_pb2
+
+
+class LogBatcher:
+    """
+    LogBatcher buffers the logs and streams them to the server in batches
+
+    Attributes:
+    -----------
+    submit_stream (Callable): Client-streaming stub method, called with an
+        iterator of SimulationLogBatch messages
+    max_batch_logs (int): Number of logs which triggers a batch
+    max_batch_bytes (int): Serialized size which triggers a batch
+    flush_interval (float): Longest time in seconds a log is buffered
+    max_buffered_logs (int): Number of buffered logs at which `submit`
+        waits for the stream
+    submitted (int): Number of submitted logs
+    sent (int): Number of logs handed to the stream
+
+    Methods:
+    --------
+    submit(log): Buffers the log
+    flush(): Sends the buffered logs without waiting for a trigger
+    close(timeout): Sends the buffered logs and ends the stream
+    """
+
+    def __init__(
+            self,
+            submit_stream,
+            max_batch_logs: int = 500,
+            max_batch_bytes: int = 1 << 20,
+            flush_interval: float = 0.05,
+            max_buffered_logs: int = 10000):
+        self.submit_stream = submit_stream
+        self.max_batch_logs = max_batch_logs
+        self.max_batch_bytes = max_batch_bytes
+        self.flush_interval = flush_interval
+        self.max_buffered_logs = max(max_buffered_logs, max_batch_logs)
+        self.submitted = 0
+        self.sent = 0
+        self._condition = threading.Condition()
+        self._buffer = []
+        self._buffered_bytes = 0
+        self._flush = False
+        self._end = False
+        self._closed = False
+        self._thread = None
+
+    def submit(self, log: server_pb2.SimulationLog) -> None:
+        """
+        Buffers the log, waits while the buffer is full. The last log of
+        the simulation (end) is sent right away.
+        """
+        size = log.ByteSize()
+        with self._condition:
+            while (len(self._buffer) >= self.max_buffered_logs and
+                   self._thread is not None):
+                self._condition.wait()
+            self._buffer.append((log, size, time.monotonic()))
+            self._buffered_bytes += size
+            self.submitted += 1
+            self._end = self._end or log.end
+            self._start()
+            if self._ready():
+                self._condition.notify_all()
+
+    def flush(self) -> None:
+        """
+        Sends the buffered logs without waiting for a trigger
+        """
+        with self._condition:
+            self._flush = True
+            self._condition.notify_all()
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Sends the buffered logs, ends the stream and waits for the server to
+        receive them
+
+        Parameters:
+        -----------
+        timeout (Optional[float]): Longest time to wait in seconds
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+                thread = self._thread
+            if thread is None:
+                return
+            if deadline is None:
+                thread.join()
+            else:
+                thread.join(max(0.0, deadline - time.monotonic()))
+                if time.monotonic() >= deadline:
+                    return
+
+    def _start(self) -> None:
+        # Holds the condition
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._stream, name="log-batcher", daemon=True)
+            self._thread.start()
+
+    def _ready(self) -> bool:
+        # Holds the condition
+        if not self._buffer:
+            return False
+        return (self._flush or self._end or self._closed or
+                len(self._buffer) >= self.max_batch_logs or
+                self._buffered_bytes >= self.max_batch_bytes or
+                time.monotonic() - self._buffer[0][2] >= self.flush_interval)
+
+    def _stream(self) -> None:
+        """
+        Runs a submission stream, the stream ends with the last log of the
+        simulation or once the batcher is closed
+        """
+        failed = False
+        try:
+            self.submit_stream(self._batches())
+        except Exception:
+            failed = True
+            traceback.print_exc()
+            print("Log submission stream failed")
+        finally:
+            with self._condition:
+                self._thread = None
+                # Logs submitted after the end start a new stream, after a
+                # failure the next submitted log does
+                if self._buffer and not failed:
+                    self._start()
+                self._condition.notify_all()
+
+    def _batches(self):
+        while True:
+            with self._condition:
+                while not self._ready():
+                    if self._closed and not self._buffer:
+                        return
+                    timeout = None
+                    if self._buffer:
+                        timeout = max(0.0, self.flush_interval - (
+                            time.monotonic() - self._buffer[0][2]))
+                    self._condition.wait(timeout)
+                batch = self._take()
+                end = any(log.end for log in batch)
+                self._condition.notify_all()
+            self.sent += len(batch)
+            yield server_pb2.SimulationLogBatch(logs=batch)
+            if end:
+                return
+
+    def _take(self) -> list[server_pb2.SimulationLog]:
+        """
+        Takes the next batch from the buffer, holds the condition
+        """
+        count = 0
+        size = 0
+        for _, log_size, _ in self._buffer:
+            if count and (count >= self.max_batch_logs or
+                          size + log_size > self.max_batch_bytes):
+                break
+            count += 1
+            size += log_size
+        batch = [entry[0] for entry in self._buffer[:count]]
+        del self._buffer[:count]
+        self._buffered_bytes -= size
+        self._end = any(entry[0].end for entry in self._buffer)
+        if not self._buffer:
+            self._flush = False
+        return batch
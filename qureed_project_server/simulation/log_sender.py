@@ -0,0 +1,187 @@
+"""
+Non-blocking hand-off of the simulation logs
+
+The logging hook runs on the simulation thread, it only queues the log
+entries. A sender thread builds the SimulationLog messages (tensor
+conversion, saving figures) and hands them on, so a slow server or GUI
+does not stall the simulation. The hook copies the tensors and renders the
+figures, so the simulation can go on changing them once they are logged. The queue is bounded, the policy decides
+what happens once it is full:
+
+- block: the simulation waits for the sender
+- drop-oldest: the oldest queued entry is dropped
+- drop-newest: the new entry is dropped
+- coalesce: the new entry replaces the queued entry of the same device,
+  entries of a device without a queued entry drop the oldest entry
+
+The last entry of the simulation (end) is never dropped or coalesced.
+"""
+import io
+import threading
+import traceback
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+BLOCK = "block"
+DROP_OLDEST = "drop-oldest"
+DROP_NEWEST = "drop-newest"
+COALESCE = "coalesce"
+LOG_POLICIES = (BLOCK, DROP_OLDEST, DROP_NEWEST, COALESCE)
+
+
+class LogSender:
+    """
+    LogSender queues the log entries and sends them from its thread
+
+    Attributes:
+    -----------
+    send (Callable): Called with each log entry on the sender thread
+    policy (str): Policy applied once the queue is full, one of
+        LOG_POLICIES
+    max_queued (int): Number of queued entries at which the policy applies
+    queued (int): Number of entries handed to the sender
+    sent (int): Number of entries passed to `send`
+    dropped (int): Number of dropped entries
+    coalesced (int): Number of entries replaced by a newer entry of the
+        same device
+
+    Methods:
+    --------
+    enqueue(log_entry): Queues the log entry, called by the logging hook
+    close(timeout): Sends the queued entries and stops the sender thread
+    report(): Describes the dropped and coalesced entries
+    """
+
+    def __init__(self, send, policy: str = BLOCK, max_queued: int = 10000):
+        if policy not in LOG_POLICIES:
+            raise ValueError(
+                f"Unknown log policy {policy}, expected one of {LOG_POLICIES}")
+        self.send = send
+        self.policy = policy
+        self.max_queued = max(1, max_queued)
+        self.queued = 0
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._condition = threading.Condition()
+        # Sequence number -> entry, in the order of the entries
+        self._queue = OrderedDict()
+        # Device -> sequence number of its queued entry
+        self._latest = {}
+        self._sequence = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="log-sender", daemon=True)
+        self._thread.start()
+
+    def enqueue(self, log_entry: dict, *args, **kwargs) -> None:
+        """
+        Queues a copy of the log entry, has the signature of the qureed
+        logging hook
+        """
+        entry = dict(log_entry)
+        # The simulation may keep working on its arrays and figures
+        if isinstance(entry.get("tensor"), np.ndarray):
+            entry["tensor"] = entry["tensor"].copy()
+        if entry.get("figure") is not None:
+            if entry.get("figure_name"):
+                entry["figure"] = _render_figure(
+                    entry["figure"], entry["figure_name"])
+            else:
+                # Figures are only sent as saved plots
+                del entry["figure"]
+        end = bool(entry.get("end"))
+        device = entry.get("device_name")
+        with self._condition:
+            if len(self._queue) >= self.max_queued and not end:
+                if self.policy == BLOCK:
+                    while (len(self._queue) >= self.max_queued and
+                           not self._closed):
+                        self._condition.wait()
+                elif self.policy == DROP_NEWEST:
+                    self.dropped += 1
+                    return
+                elif (self.policy == COALESCE and
+                      device is not None and device in self._latest):
+                    self._queue[self._latest[device]] = entry
+                    self.coalesced += 1
+                    return
+                else:
+                    self._drop_oldest()
+            self._sequence += 1
+            self._queue[self._sequence] = entry
+            if device is not None:
+                self._latest[device] = self._sequence
+            self.queued += 1
+            self._condition.notify_all()
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Sends the queued entries and stops the sender thread
+
+        Parameters:
+        -----------
+        timeout (Optional[float]): Longest time to wait in seconds
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        if self.dropped or self.coalesced:
+            print(f"Log sender: {self.report()}")
+
+    def report(self) -> str:
+        """
+        Describes the entries which were not sent as they were logged
+        """
+        return (f"{self.dropped} log entries dropped, {self.coalesced} "
+                f"coalesced ({self.policy} policy)")
+
+    def _drop_oldest(self) -> None:
+        # Holds the condition, the end entry is the last entry
+        sequence, entry = self._queue.popitem(last=False)
+        self._forget(sequence, entry)
+        self.dropped += 1
+
+    def _forget(self, sequence: int, entry: dict) -> None:
+        device = entry.get("device_name")
+        if device is not None and self._latest.get(device) == sequence:
+            del self._latest[device]
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._queue and not self._closed:
+                    self._condition.wait()
+                if not self._queue:
+                    return
+                sequence, entry = self._queue.popitem(last=False)
+                self._forget(sequence, entry)
+                self._condition.notify_all()
+            try:
+                self.send(entry)
+            except Exception:
+                traceback.print_exc()
+            self.sent += 1
+
+
+def _render_figure(figure, figure_name: str) -> bytes:
+    """
+    Renders the matplotlib figure to the image file content, the format is
+    given by the suffix of the figure name (matplotlib's default format if
+    it has none)
+
+    Parameters:
+    -----------
+    figure (matplotlib.figure.Figure): The logged figure
+    figure_name (str): File name of the plot
+
+    Returns:
+    --------
+    bytes: Content of the image file
+    """
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=Path(figure_name).suffix[1:] or None)
+    return buffer.getvalue()
@@ -1,53 +1,57 @@
 import argparse
-import threading
-import asyncio
 import json
-import time
 import traceback
 from pathlib import Path
+import grpc
 import numpy as np
 
 from qureed.devices.variables.int_variable import IntVariable
 from qureed.simulation import Simulation
 from qureed.extra.logging import set_logging_hook, get_custom_logger, Loggers
 
-from qureed_project_server.client import GrpcClient
-from qureed_project_server import server_pb2
+from qureed_project_server import server_pb2, server_pb2_grpc
 from qureed_project_server.logic_modules import (
     LogicModuleEnum, LogicModuleHandler
 )
+from qureed_project_server.simulation.log_batcher import LogBatcher
+from qureed_project_server.simulation.log_sender import (
+    BLOCK, LOG_POLICIES, LogSender
+)
 from qureed_project_server.utils import message_from_tensor
 
 LMH = LogicModuleHandler()
 
 
 class JSONExecution():
-    def __init__(self, scheme, duration, port, simulation_id):
+    def __init__(self, scheme, duration, port, simulation_id,
+                 log_batch_size=500, log_batch_bytes=1 << 20,
+                 log_flush_interval=0.05, log_policy=BLOCK,
+                 log_queue_size=10000, tensor_compression=""):
         self.scheme = scheme
         self.duration = duration
-        self.grpc_client = None
-        self.grpc_thread = None
         self.simulation_id = simulation_id
+        self.tensor_compression = tensor_compression
         self.devices = []
         self.connections = []
 
-        def grpc_thread_func():
-            self.loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(self.loop)
-            self.grpc_client = GrpcClient(server_address=f"127.0.0.1:{port}")
-            self.loop.run_forever()
-
-        # Start the gRPC thread if not already running
-        if self.grpc_thread is None:
-            self.grpc_thread = threading.Thread(target=grpc_thread_func, daemon=True)
-            self.grpc_thread.start()
-
-        while self.grpc_client is None:
-            time.sleep(0.1)  # Small delay to ensure it's created
+        # Logs are streamed in batches instead of one call per log
+        self.log_channel = grpc.insecure_channel(f"127.0.0.1:{port}")
+        self.log_batcher = LogBatcher(
+            server_pb2_grpc.QuReedSimulationStub(
+                self.log_channel).SimulationLogBatchSubmission,
+            max_batch_logs=log_batch_size,
+            max_batch_bytes=log_batch_bytes,
+            flush_interval=log_flush_interval,
+        )
+        # The logging hook only queues the entries, the messages are built
+        # and submitted on the sender thread
+        self.log_sender = LogSender(
+            self.send_logs, policy=log_policy, max_queued=log_queue_size)
 
     def assemble_simulation(self):
         BM = LMH.get_logic(LogicModuleEnum.BOARD_MANAGER)
-        BM.open_scheme(self.scheme)
+        # The simulation needs the real devices and signals
+        BM.open_scheme(self.scheme, lightweight=False)
 
 
     def run(self):
@@ -61,19 +65,24 @@ class JSONExecution():
             err_logger = get_custom_logger(Loggers.Error)
             err_logger.info(traceback.format_exc())
             traceback.print_exc()
+        finally:
+            self.log_sender.close()
+            self.log_batcher.close()
+            self.log_channel.close()
 
-    def run_in_loop(self, coro):
+    def send_logs(self, log_entry):
         """
-        Utility method to run a coroutine in the correct event loop.
+        Builds the SimulationLog of the entry and submits it, runs on the
+        log sender thread. The entries lost to the log policy are reported
+        before the last log of the simulation.
         """
-        if self.loop is None:
-            raise RuntimeError("Event loop is not initialized. Did you call start()?")
-
-        # Submit the coroutine to the correct loop
-        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
-        return future.result()
- 
-    def send_logs(self, log_entry, *args, **kwargs):
+        if log_entry.get("end") and (
+                self.log_sender.dropped or self.log_sender.coalesced):
+            self.log_batcher.submit(server_pb2.SimulationLog(
+                log_type="warning",
+                message=self.log_sender.report(),
+                simulation_id=self.simulation_id,
+            ))
         key_translation = {
             "simulation_time":"simulation_timestamp",
             "timestamp":"timestamp",
@@ -93,17 +102,19 @@ class JSONExecution():
         for key, new_key in key_translation.items():
             if key in log_entry.keys():
                 if key == "tensor":
-                    simulation_log_entry[new_key]=message_from_tensor(log_entry[key])
+                    simulation_log_entry[new_key]=message_from_tensor(
+                        log_entry[key], compression=self.tensor_compression)
                 elif key == "figure_name":
                     continue
                 elif key == "figure":
+                    # Rendered by the logging hook (see LogSender.enqueue)
                     figure = log_entry[key]
                     if not "figure_name" in log_entry.keys():
                         continue
                     plot_dir = Path(VM.path).parents[0] / "plots"
                     plot_dir.mkdir(parents=True, exist_ok=True)
                     plot_path =Path(VM.path).parents[0] / "plots" / log_entry["figure_name"]
-                    figure.savefig(str(plot_path))
+                    plot_path.write_bytes(figure)
                     simulation_log_entry["figure"] = str(plot_path)
                 else:
                     simulation_log_entry[new_key] = log_entry[key]
@@ -112,20 +123,7 @@ class JSONExecution():
         log_message = server_pb2.SimulationLog(
             **simulation_log_entry
         )
-
-        async def submit_logs():
-            try:
-                response = await self.grpc_client.call(
-                    self.grpc_client.simulation_stub.SimulationLogSubmission,
-                    server_pb2.SubmitSimulationLogRequest(
-                        log=log_message
-                    )
-                )
-            except Exception as e:
-                print("gRPC log submission failed {e}")
-        
-        self.run_in_loop(submit_logs())
-        VM = LMH.get_logic(LogicModuleEnum.VENV_MANAGER)
+        self.log_batcher.submit(log_message)
 
 
 
@@ -139,6 +137,28 @@ def main():
     parser.add_argument("--base-dir", type=str, required=True)
     parser.add_argument("--duration", type=float, default=1)
     parser.add_argument("--simulation-id", type=str)
+    parser.add_argument(
+        "--log-batch-size", type=int, default=500,
+        help="Number of logs sent to the server in one batch")
+    parser.add_argument(
+        "--log-batch-bytes", type=int, default=1 << 20,
+        help="Serialized size of the logs sent in one batch")
+    parser.add_argument(
+        "--log-flush-interval", type=float, default=0.05,
+        help="Longest time in seconds a log waits for its batch")
+    parser.add_argument(
+        "--log-policy", choices=LOG_POLICIES, default=BLOCK,
+        help="Handling of the logs once the log queue is full: wait for "
+             "the sender, drop the oldest or the newest log, or replace the "
+             "queued log of the same device")
+    parser.add_argument(
+        "--log-queue-size", type=int, default=10000,
+        help="Number of logs queued for the sender")
+    parser.add_argument(
+        "--tensor-compression", choices=["", "zlib", "zstd", "lz4"],
+        default="",
+        help="Compression of the logged tensors (zstd and lz4 need the "
+             "compression extra)")
     args = parser.parse_args()
 
     print("VENV")
@@ -154,8 +174,14 @@ def main():
         duration=args.duration,
         port=args.port,
         simulation_id=args.simulation_id,
+        log_batch_size=args.log_batch_size,
+        log_batch_bytes=args.log_batch_bytes,
+        log_flush_interval=args.log_flush_interval,
+        log_policy=args.log_policy,
+        log_queue_size=args.log_queue_size,
+        tensor_compression=args.tensor_compression,
         )
-    set_logging_hook(JE.send_logs)
+    set_logging_hook(JE.log_sender.enqueue)
     JE.assemble_simulation()
 
     JE.run()
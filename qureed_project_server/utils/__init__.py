@@ -1 +1,13 @@
-from .tensor_logging import tensor_from_message,message_from_tensor
\ No newline at end of file
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "tensor_from_message": "qureed_project_server.utils.tensor_logging",
+    "message_from_tensor": "qureed_project_server.utils.tensor_logging",
+}
+
+
+def __getattr__(name):
+    # numpy is only imported once the tensor helpers are used
+    if name in _LAZY_ATTRIBUTES:
+        return getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,223 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from pathlib import Path
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0)
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+def _load_inotify():
+    """
+    Loads the libc inotify functions, None is returned if inotify is not
+    available on this platform
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(
+            ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [
+            ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        return libc
+    except (OSError, AttributeError):
+        return None
+
+
+class FileWatcher:
+    """
+    FileWatcher watches directories (recursively) for created, modified and
+    removed files and reports them through the callback.
+
+    On Linux inotify is used, on other platforms (or if inotify cannot be
+    initialized) the directories are polled. In both cases the watcher keeps
+    a stat snapshot of the watched files, events only tell it which files
+    have to be checked again, so the callback is invoked only for files
+    whose mtime or size actually changed.
+
+    Attributes:
+    -----------
+    directories (list[Path]): Watched directories
+    callback (callable): Called with the list of changed paths
+    suffix (str): Only files with this suffix are reported
+    poll_interval (float): Polling interval in seconds
+    backend (str): Either "inotify" or "polling"
+
+    Methods:
+    --------
+    start(): Starts the watcher thread
+    stop(): Stops the watcher thread
+    """
+
+    def __init__(
+            self,
+            directories: list[Path],
+            callback,
+            suffix: str = ".py",
+            poll_interval: float = 1.0,
+            use_inotify: bool = True):
+        self.directories = [Path(d) for d in directories]
+        self.callback = callback
+        self.suffix = suffix
+        self.poll_interval = poll_interval
+        self.backend = "polling"
+        self._libc = _load_inotify() if use_inotify else None
+        self._fd = None
+        self._watches = {}
+        self._snapshot = {}
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def start(self) -> None:
+        """
+        Takes the initial snapshot and starts the watcher thread
+        """
+        self._snapshot = self._scan_all()
+        if self._libc is not None:
+            fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+            if fd >= 0:
+                self._fd = fd
+                self.backend = "inotify"
+                for directory in self.directories:
+                    self._add_watches(directory)
+        self._thread = threading.Thread(
+            target=self._run, name="FileWatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the watcher thread
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._watches = {}
+
+    def _is_watched_file(self, path: Path) -> bool:
+        return path.suffix == self.suffix and not path.name.startswith("__")
+
+    def _scan_all(self) -> dict:
+        snapshot = {}
+        for directory in self.directories:
+            for root, _, files in os.walk(directory):
+                for file in files:
+                    path = Path(root) / file
+                    if self._is_watched_file(path):
+                        stat = self._stat(path)
+                        if stat is not None:
+                            snapshot[path] = stat
+        return snapshot
+
+    def _stat(self, path: Path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _add_watches(self, directory: Path) -> None:
+        for root, _, _ in os.walk(directory):
+            wd = self._libc.inotify_add_watch(
+                self._fd, os.fsencode(root), WATCH_MASK)
+            if wd >= 0:
+                self._watches[wd] = Path(root)
+
+    def _check(self, paths) -> list[Path]:
+        """
+        Compares the given paths against the snapshot, updates the snapshot
+        and returns the paths which changed
+        """
+        changed = []
+        for path in paths:
+            stat = self._stat(path)
+            if stat == self._snapshot.get(path):
+                continue
+            if stat is None:
+                self._snapshot.pop(path, None)
+            else:
+                self._snapshot[path] = stat
+            changed.append(path)
+        return changed
+
+    def _dispatch(self, changed: list[Path]) -> None:
+        if not changed:
+            return
+        try:
+            self.callback(sorted(changed))
+        except Exception as e:
+            print(f"File watcher callback failed: {e}")
+
+    def _run(self) -> None:
+        if self.backend == "inotify":
+            self._run_inotify()
+        else:
+            self._run_polling()
+
+    def _run_polling(self) -> None:
+        while not self._stop_event.wait(self.poll_interval):
+            current = self._scan_all()
+            self._dispatch(self._check(set(current) | set(self._snapshot)))
+
+    def _run_inotify(self) -> None:
+        while not self._stop_event.is_set():
+            readable, _, _ = select.select(
+                [self._fd], [], [], self.poll_interval)
+            if not readable:
+                continue
+            # Give the editor a moment to finish writing before reading
+            # the batch of events
+            self._stop_event.wait(0.05)
+            paths = set()
+            rescan = False
+            try:
+                data = os.read(self._fd, 65536)
+            except BlockingIOError:
+                continue
+            offset = 0
+            while offset + EVENT_HEADER.size <= len(data):
+                wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    rescan = True
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                if mask & IN_DELETE_SELF:
+                    self._watches.pop(wd, None)
+                    rescan = True
+                    continue
+                path = directory / os.fsdecode(name)
+                if mask & IN_ISDIR:
+                    if mask & (IN_CREATE | IN_MOVED_TO):
+                        self._add_watches(path)
+                    rescan = True
+                elif self._is_watched_file(path):
+                    paths.add(path)
+            if rescan:
+                paths |= set(self._scan_all()) | set(self._snapshot)
+            self._dispatch(self._check(paths))
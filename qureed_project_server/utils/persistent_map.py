@@ -0,0 +1,272 @@
+"""
+Immutable map with structural sharing (hash array mapped trie)
+
+Every update returns a new map which shares all untouched nodes with the
+original one, an update copies only the O(log32 n) nodes on the path to the
+changed entry. Maps derived from each other can be compared in time
+proportional to their difference, since shared nodes are skipped.
+"""
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_MASK = (1 << 64) - 1
+
+# Marks a key which is absent in one of the compared maps
+MISSING = object()
+
+
+class _Node:
+    """
+    Trie node, the children are leaves (hash, key, value) or nodes and are
+    stored in the order of their bits in the bitmap
+    """
+    __slots__ = ("bitmap", "children")
+
+    def __init__(self, bitmap: int, children: tuple):
+        self.bitmap = bitmap
+        self.children = children
+
+
+class _Collision:
+    """
+    Leaves whose keys have the same hash
+    """
+    __slots__ = ("hash", "leaves")
+
+    def __init__(self, key_hash: int, leaves: tuple):
+        self.hash = key_hash
+        self.leaves = leaves
+
+
+_EMPTY_NODE = _Node(0, ())
+
+
+def _hash(key) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _index(bitmap: int, bit: int) -> int:
+    return (bitmap & (bit - 1)).bit_count()
+
+
+def _pair(leaf_1: tuple, leaf_2: tuple, shift: int):
+    """
+    Creates the subtree holding two leaves with different keys
+    """
+    if leaf_1[0] == leaf_2[0]:
+        return _Collision(leaf_1[0], (leaf_1, leaf_2))
+    bit_1 = 1 << ((leaf_1[0] >> shift) & _MASK)
+    bit_2 = 1 << ((leaf_2[0] >> shift) & _MASK)
+    if bit_1 == bit_2:
+        return _Node(bit_1, (_pair(leaf_1, leaf_2, shift + _BITS),))
+    if bit_1 < bit_2:
+        return _Node(bit_1 | bit_2, (leaf_1, leaf_2))
+    return _Node(bit_1 | bit_2, (leaf_2, leaf_1))
+
+
+def _set(node, leaf: tuple, shift: int) -> tuple:
+    """
+    Returns:
+    --------
+    tuple[node, bool]: The updated node (the same node if nothing changed)
+        and if the key was added
+    """
+    key_hash, key, value = leaf
+    if isinstance(node, _Collision):
+        if node.hash != key_hash:
+            # Push the collision one level down next to the new leaf
+            bit = 1 << ((node.hash >> shift) & _MASK)
+            return _set(_Node(bit, (node,)), leaf, shift)
+        for i, existing in enumerate(node.leaves):
+            if existing[1] == key:
+                if existing[2] is value:
+                    return node, False
+                return _Collision(
+                    key_hash,
+                    node.leaves[:i] + (leaf,) + node.leaves[i + 1:]), False
+        return _Collision(key_hash, node.leaves + (leaf,)), True
+
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    i = _index(node.bitmap, bit)
+    children = node.children
+    if not node.bitmap & bit:
+        return _Node(node.bitmap | bit,
+                     children[:i] + (leaf,) + children[i:]), True
+    child = children[i]
+    if isinstance(child, tuple):
+        if child[1] == key:
+            if child[2] is value:
+                return node, False
+            new_child, added = leaf, False
+        else:
+            new_child, added = _pair(child, leaf, shift + _BITS), True
+    else:
+        new_child, added = _set(child, leaf, shift + _BITS)
+        if new_child is child:
+            return node, False
+    return _Node(node.bitmap,
+                 children[:i] + (new_child,) + children[i + 1:]), added
+
+
+def _delete(node, key_hash: int, key, shift: int):
+    """
+    Returns:
+    --------
+    The updated node (the same node if the key is absent), a leaf if only a
+    single leaf is left in a subtree or None if the subtree is empty
+    """
+    if isinstance(node, _Collision):
+        leaves = tuple(leaf for leaf in node.leaves if leaf[1] != key)
+        if len(leaves) == len(node.leaves):
+            return node
+        return leaves[0] if len(leaves) == 1 else _Collision(node.hash, leaves)
+
+    bit = 1 << ((key_hash >> shift) & _MASK)
+    if not node.bitmap & bit:
+        return node
+    i = _index(node.bitmap, bit)
+    child = node.children[i]
+    if isinstance(child, tuple):
+        if child[1] != key:
+            return node
+        new_child = None
+    else:
+        new_child = _delete(child, key_hash, key, shift + _BITS)
+        if new_child is child:
+            return node
+    if new_child is None:
+        children = node.children[:i] + node.children[i + 1:]
+        if not children:
+            return None
+        if len(children) == 1 and isinstance(children[0], tuple):
+            return children[0]
+        return _Node(node.bitmap & ~bit, children)
+    return _Node(node.bitmap,
+                 node.children[:i] + (new_child,) + node.children[i + 1:])
+
+
+def _leaves(node):
+    if isinstance(node, tuple):
+        yield node
+    elif isinstance(node, _Collision):
+        yield from node.leaves
+    elif node is not None:
+        for child in node.children:
+            yield from _leaves(child)
+
+
+def _diff(node_1, node_2, shift: int):
+    if node_1 is node_2:
+        return
+    if isinstance(node_1, _Node) and isinstance(node_2, _Node):
+        bitmap_1, bitmap_2 = node_1.bitmap, node_2.bitmap
+        bits = bitmap_1 | bitmap_2
+        while bits:
+            bit = bits & -bits
+            bits ^= bit
+            child_1 = (node_1.children[_index(bitmap_1, bit)]
+                       if bitmap_1 & bit else None)
+            child_2 = (node_2.children[_index(bitmap_2, bit)]
+                       if bitmap_2 & bit else None)
+            yield from _diff(child_1, child_2, shift + _BITS)
+        return
+    # A leaf or collision against anything, both sides are small or one
+    # side is missing
+    entries_1 = {leaf[1]: leaf[2] for leaf in _leaves(node_1)}
+    for leaf in _leaves(node_2):
+        value_1 = entries_1.pop(leaf[1], MISSING)
+        if value_1 is not leaf[2]:
+            yield leaf[1], value_1, leaf[2]
+    for key, value_1 in entries_1.items():
+        yield key, value_1, MISSING
+
+
+class PersistentMap:
+    """
+    PersistentMap is an immutable mapping, updates return a new map sharing
+    the unchanged structure with the original
+
+    Values are compared by identity when maps are updated or compared, so
+    the values should be treated as immutable.
+
+    Methods:
+    --------
+    get(key, default): Gets the value of the key
+    set(key, value): Gets a map with the key set to the value
+    delete(key): Gets a map without the key
+    items(): Iterates over the (key, value) pairs
+    diff(other): Iterates over the entries which differ from the other map
+    """
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, root: _Node = _EMPTY_NODE, size: int = 0):
+        self._root = root
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, MISSING) is not MISSING
+
+    def __getitem__(self, key):
+        value = self.get(key, MISSING)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        for leaf in _leaves(self._root):
+            yield leaf[1]
+
+    def get(self, key, default=None):
+        key_hash = _hash(key)
+        node = self._root
+        shift = 0
+        while True:
+            if isinstance(node, _Collision):
+                for leaf in node.leaves:
+                    if leaf[1] == key:
+                        return leaf[2]
+                return default
+            bit = 1 << ((key_hash >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return default
+            node = node.children[_index(node.bitmap, bit)]
+            if isinstance(node, tuple):
+                return node[2] if node[1] == key else default
+            shift += _BITS
+
+    def set(self, key, value) -> "PersistentMap":
+        root, added = _set(self._root, (_hash(key), key, value), 0)
+        if root is self._root:
+            return self
+        return PersistentMap(root, self._size + added)
+
+    def delete(self, key) -> "PersistentMap":
+        root = _delete(self._root, _hash(key), key, 0)
+        if root is self._root:
+            return self
+        if root is None:
+            root = _EMPTY_NODE
+        elif not isinstance(root, _Node):
+            # A single leaf or collision is left, the root stays a node
+            bit = 1 << (_hash(next(_leaves(root))[1]) & _MASK)
+            root = _Node(bit, (root,))
+        return PersistentMap(root, self._size - 1)
+
+    def items(self):
+        for leaf in _leaves(self._root):
+            yield leaf[1], leaf[2]
+
+    def diff(self, other: "PersistentMap"):
+        """
+        Iterates over the entries which differ between the maps, subtrees
+        shared by both maps are skipped
+
+        Yields:
+        -------
+        tuple[Hashable, Any, Any]: (key, value in this map, value in the
+            other map), MISSING marks an absent key
+        """
+        yield from _diff(self._root, other._root, 0)
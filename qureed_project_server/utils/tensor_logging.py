@@ -1,27 +1,207 @@
+import sys
+import zlib
+import importlib
+
 import numpy as np
 from qureed_project_server.server_pb2 import Tensor
 
-def message_from_tensor(tensor: np.ndarray) -> Tensor:
+# Compression of the raw tensor buffers, zstd and lz4 are optional
+# (pip install qureed_project_server[compression])
+COMPRESSIONS = ("zlib", "zstd", "lz4")
+_COMPRESSION_MODULES = {"zstd": "zstandard", "lz4": "lz4.frame"}
+_missing_compressions = set()
+
+
+def message_from_tensor(tensor: np.ndarray, raw: bool = True,
+                        compression: str = "", sparse: bool = True) -> Tensor:
     """
     Converts a NumPy tensor (real or complex) to a gRPC Tensor message.
-    If the tensor is real, the imaginary part is set to zeros.
+
+    Parameters:
+    -----------
+    tensor (np.ndarray): The tensor
+    raw (bool): Send the buffer of the tensor (data) with its dtype and byte
+        order, otherwise the values are sent as the repeated real_values
+        and imag_values (the imaginary part of a real tensor is zeros)
+    compression (str): Compression of the raw buffer (zlib, zstd or lz4),
+        the buffer is sent uncompressed if the compression is not
+        available or does not make it smaller
+    sparse (bool): Send the nonzero values with their positions (coo, or
+        csr for matrices) if that is smaller than the dense buffer
+
+    Returns:
+    --------
+    Tensor: The message
+    """
+    tensor = np.asarray(tensor)
+    shape = list(tensor.shape)
+    if not raw or tensor.dtype.kind not in "biufc":
+        tensor = tensor.astype(complex)
+        return Tensor(
+            real_values=tensor.real.ravel().tolist(),
+            imag_values=tensor.imag.ravel().tolist(),
+            shape=shape)
+    message = Tensor(shape=shape)
+    if (sparse and tensor.ndim and tensor.size and
+            _encode_sparse(tensor, message)):
+        data = message.data
+        byte_order = sys.byteorder
+    else:
+        data = tensor.tobytes()
+        byte_order = tensor.dtype.byteorder
+        if byte_order in "=|":
+            byte_order = sys.byteorder
+        else:
+            byte_order = "little" if byte_order == "<" else "big"
+    if compression:
+        compressed = _compress(compression, data)
+        if compressed is not None and len(compressed) < len(data):
+            data = compressed
+        else:
+            compression = ""
+    message.data = data
+    message.dtype = tensor.dtype.name
+    message.byte_order = byte_order
+    message.compression = compression
+    return message
+
+
+def _encode_sparse(tensor: np.ndarray, message: Tensor) -> bool:
+    """
+    Fills the sparse layout of the message if it is smaller than the dense
+    buffer, the values and indices are in the native byte order. Needs a
+    tensor with at least one axis.
+    """
+    nonzero = np.count_nonzero(tensor)
+    index_dtype = np.dtype(np.int32 if tensor.size < 2**31 else np.int64)
+    entry = tensor.dtype.itemsize + index_dtype.itemsize
+    dense = tensor.nbytes
+    coo = nonzero * entry
+    csr = None
+    if tensor.ndim == 2:
+        csr = coo + (tensor.shape[0] + 1) * index_dtype.itemsize
+    if min(coo, csr if csr is not None else coo) >= dense:
+        return False
+    values_dtype = tensor.dtype.newbyteorder("=")
+    if csr is not None and csr < coo:
+        rows, columns = np.nonzero(tensor)
+        indptr = np.zeros(tensor.shape[0] + 1, dtype=index_dtype)
+        np.cumsum(np.bincount(rows, minlength=tensor.shape[0]),
+                  out=indptr[1:])
+        message.layout = "csr"
+        message.indices = columns.astype(index_dtype).tobytes()
+        message.indptr = indptr.tobytes()
+        values = tensor[rows, columns]
+    else:
+        flat = np.flatnonzero(tensor)
+        message.layout = "coo"
+        message.indices = flat.astype(index_dtype).tobytes()
+        values = tensor.ravel()[flat]
+    message.index_dtype = index_dtype.name
+    message.data = values.astype(values_dtype, copy=False).tobytes()
+    return True
+
+
+def _decode_sparse(tensor_message: Tensor, values: np.ndarray,
+                   shape: tuple) -> np.ndarray:
+    index_dtype = np.dtype(tensor_message.index_dtype)
+    indices = np.frombuffer(tensor_message.indices, dtype=index_dtype)
+    tensor = np.zeros(shape, dtype=values.dtype.newbyteorder("="))
+    if tensor_message.layout == "csr":
+        indptr = np.frombuffer(tensor_message.indptr, dtype=index_dtype)
+        rows = np.repeat(np.arange(shape[0]), np.diff(indptr))
+        tensor[rows, indices] = values
+    elif tensor_message.layout == "coo":
+        tensor.ravel()[indices] = values
+    else:
+        raise ValueError(f"Unknown tensor layout {tensor_message.layout}")
+    return tensor
+
+
+def preview_of_tensor(tensor: np.ndarray, max_elements: int) -> np.ndarray:
     """
-    tensor = np.array(tensor)
-    real_values = tensor.real.flatten().tolist()  # Extract real part
-    imag_values = tensor.imag.flatten().tolist() if np.iscomplexobj(tensor) else [0.0] * tensor.size  # Handle real tensors
-    shape = list(tensor.shape)  # Store tensor dimensions
-    ten = Tensor(real_values=real_values, imag_values=imag_values, shape=shape)
+    Reduces the tensor to at most max_elements values in single precision,
+    the axes are downsampled by their own factor (block means): axes
+    shorter than the even share of max_elements are kept, the longer axes
+    share the rest
+
+    Parameters:
+    -----------
+    tensor (np.ndarray): The tensor
+    max_elements (int): Largest number of values of the preview
+
+    Returns:
+    --------
+    np.ndarray: The preview
+    """
+    tensor = np.asarray(tensor)
+    if tensor.dtype.kind == "c":
+        tensor = tensor.astype(np.complex64)
+    elif tensor.dtype.kind == "f":
+        tensor = tensor.astype(np.float32)
+    if tensor.size <= max_elements or tensor.ndim == 0:
+        return tensor
+    steps = _preview_steps(tensor.shape, max(1, max_elements))
+    for axis, (n, step) in enumerate(zip(tensor.shape, steps)):
+        if step == 1:
+            continue
+        starts = np.arange(0, n, step)
+        counts = np.diff(np.append(starts, n))
+        shape = [1] * tensor.ndim
+        shape[axis] = len(starts)
+        tensor = np.add.reduceat(tensor, starts, axis=axis) / counts.reshape(
+            shape).astype(tensor.real.dtype)
+    return tensor
+
+
+def _preview_steps(shape: tuple, max_elements: int) -> list[int]:
+    """
+    Block length of every axis, so that the preview has at most
+    max_elements values
+    """
+    steps = [1] * len(shape)
+    budget = max_elements
+    axes = sorted((axis for axis, n in enumerate(shape) if n > 1),
+                  key=lambda axis: shape[axis])
+    while axes:
+        share = budget ** (1 / len(axes))
+        if shape[axes[0]] > share:
+            break
+        # Fits into its share, the other axes get what it leaves
+        budget /= shape[axes.pop(0)]
+    for axis in axes:
+        steps[axis] = int(np.ceil(shape[axis] / share))
+    lengths = [-(-n // step) for n, step in zip(shape, steps)]
+    while np.prod(lengths) > max_elements:
+        axis = int(np.argmax(lengths))
+        steps[axis] += 1
+        lengths[axis] = -(-shape[axis] // steps[axis])
+    return steps
 
-    new_tensor = tensor_from_message(ten)
-    return ten
 
 def tensor_from_message(tensor_message: Tensor) -> np.ndarray:
     """
     Converts a gRPC Tensor message back into a NumPy tensor.
-    If all imaginary values are zero, returns a real tensor.
+    Dense raw buffers are decoded without copying (the returned array is
+    read-only), sparse layouts are expanded to a dense array. With the
+    repeated values a real tensor is returned if all imaginary values are
+    zero. Previews decode to the preview, the full tensor is fetched with
+    GetTensor.
     """
     try:
         shape = tuple(tensor_message.shape)  # Get tensor shape
+        if tensor_message.dtype:
+            data = tensor_message.data
+            if tensor_message.compression:
+                data = _decompress(tensor_message.compression, data)
+            dtype = np.dtype(tensor_message.dtype)
+            if tensor_message.byte_order != sys.byteorder:
+                dtype = dtype.newbyteorder(
+                    "<" if tensor_message.byte_order == "little" else ">")
+            values = np.frombuffer(data, dtype=dtype)
+            if tensor_message.layout:
+                return _decode_sparse(tensor_message, values, shape)
+            return values.reshape(shape)
         real_part = np.array(tensor_message.real_values).reshape(shape)
         imag_part = np.array(tensor_message.imag_values).reshape(shape)
 
@@ -31,4 +211,33 @@ def tensor_from_message(tensor_message: Tensor) -> np.ndarray:
         return real_part + 1j * imag_part  # Return complex tensor
     except Exception as e:
         print(e)
-        return np.array([0])
\ No newline at end of file
+        return np.array([0])
+
+
+def _compression_module(compression: str):
+    if compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown tensor compression {compression}")
+    if compression == "zlib":
+        return zlib
+    return importlib.import_module(_COMPRESSION_MODULES[compression])
+
+
+def _compress(compression: str, data: bytes) -> bytes | None:
+    try:
+        module = _compression_module(compression)
+    except ModuleNotFoundError:
+        if compression not in _missing_compressions:
+            _missing_compressions.add(compression)
+            print(f"Tensor compression {compression} is not installed, "
+                  "sending the tensors uncompressed")
+        return None
+    if compression == "zstd":
+        return module.ZstdCompressor().compress(data)
+    return module.compress(data)
+
+
+def _decompress(compression: str, data: bytes) -> bytes:
+    module = _compression_module(compression)
+    if compression == "zstd":
+        return module.ZstdDecompressor().decompress(data)
+    return module.decompress(data)
@@ -1,6 +1,5 @@
 from pathlib import Path
 import sys
-from virtualenvapi.manage import VirtualEnvironment
 
 from qureed_project_server.logic_modules import LogicModuleEnum, LogicModuleHandler
 
@@ -62,6 +61,8 @@ class VenvManager:
         ------
            This method also imports the project into the system path
         """
+        from virtualenvapi.manage import VirtualEnvironment
+
         self.path = path
         self.venv = VirtualEnvironment(path)
         # Add the 'custom' directory to sys.path
@@ -20,10 +20,15 @@ setup(
         "mpmath",
         "jinja2"
     ],
+    extras_require={
+        # Compression of the logged tensors
+        "compression": ["zstandard", "lz4"],
+    },
     entry_points={
         "console_scripts": [
             "qureed_server=qureed_project_server.server:main",  # Maps the 'qureed_server' command to 'server.py'
-            "qureed_simulate=qureed_project_server.simulation.simulation:main"
+            "qureed_simulate=qureed_project_server.simulation.simulation:main",
+            "qureed_scheme=qureed_project_server.board_manager.scheme_format:main"
         ],
     },
 )